@@ -2,21 +2,89 @@
 
 import openai
 import os
+import asyncio
 import logging
 import json
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+from .params_cache import ConnectionParamsCache, node_fingerprint
 
 logger = logging.getLogger("AIAgent")
 
+DEFAULT_CONNECTION_PARAMS = {"handshake": True, "retries": 3, "timeout": 10}
+DEFAULT_FIX = "{}"  # What a failed single fix request has always returned
+
+
+def _loads_object(text: str) -> Optional[Dict[str, Any]]:
+    """Parse an LLM reply as a JSON object, tolerating a surrounding ``` code fence."""
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+        text = text.rsplit("```", 1)[0]
+    try:
+        value = json.loads(text)
+    except ValueError:
+        return None
+    return value if isinstance(value, dict) else None
+
+
 class AIAgent:
     """
     AI-powered agent for dynamic decision-making, troubleshooting, and optimization.
     Utilizes OpenAI LLM for generating strategies, connection parameters, and self-healing solutions.
+    - LLM calls never block the event loop: they go through a pooled openai.AsyncOpenAI client,
+      or (with pre-1.0 openai packages) a dedicated bounded thread pool.
+    - At most `max_concurrency` calls are in flight; each is cancelled after `timeout` seconds
+      and falls back to the default answer.
     """
 
-    def __init__(self, openai_api_key: str = None, model: str = "gpt-4o"):
-        openai.api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
+    def __init__(
+        self,
+        openai_api_key: str = None,
+        model: str = "gpt-4o",
+        timeout: float = 30.0,
+        max_concurrency: int = 16,
+        params_cache: Optional[ConnectionParamsCache] = None,
+        batch_window: float = 0.0,
+        max_batch_size: int = 20,
+    ):
+        """
+        :param timeout: Per-call deadline in seconds before falling back to the default answer
+        :param max_concurrency: Max LLM calls in flight at once
+        :param params_cache: Optional cache of connection params keyed by node fingerprint
+        :param batch_window: Seconds to gather get_connection_params / suggest_fix requests into
+            one multi-node prompt (0 sends one prompt per request)
+        :param max_batch_size: Max nodes per batched prompt
+        """
+        self.api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
+        openai.api_key = self.api_key
         self.model = model
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.params_cache = params_cache
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.stats = {
+            "calls": 0, "failures": 0, "timeouts": 0, "in_flight": 0,
+            "batches": 0, "batched_items": 0, "batch_fallbacks": 0,
+        }
+        self._pending: Dict[str, Dict[Any, Tuple[Dict[str, Any], List[asyncio.Future]]]] = {"params": {}, "fix": {}}
+        self._flush_timers: Dict[str, asyncio.TimerHandle] = {}
+        self._batch_tasks = set()
+        self._client = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def aclose(self):
+        """Release the pooled LLM client (or thread pool) and persist the params cache."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.close()
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if self.params_cache is not None:
+            self.params_cache.save()
 
     async def select_discovery_strategy(self) -> str:
         """
@@ -29,14 +97,46 @@ class AIAgent:
             "Reply with a simple strategy name or identifier (e.g., 'parallel-scan', 'geo-priority', 'hybrid-ai')."
         )
         logger.info("Requesting AI for discovery strategy...")
-        result = self._call_openai(prompt, max_tokens=10)
+        result = await self._call_openai(prompt, max_tokens=10)
         logger.info(f"AI selected strategy: {result}")
         return result
 
     async def get_connection_params(self, node: Dict[str, Any]) -> Dict[str, Any]:
         """
         Uses LLM to generate optimal connection parameters for a given node.
+        Served from params_cache when the node's fingerprint has valid cached params.
+        """
+        if self.params_cache is not None:
+            cached = self.params_cache.get(node)
+            if cached is not None:
+                logger.debug(f"Using cached connection params for node: {node.get('id', node)}")
+                return cached
+        if self.batch_window > 0:
+            # Nodes the cache treats as one entry share one batch item.
+            key = self.params_cache.fingerprint(node) if self.params_cache is not None else node_fingerprint(node)
+            params = await self._batched("params", key, node)
+        else:
+            params = await self._request_connection_params(node)
+        if params is None:
+            return dict(DEFAULT_CONNECTION_PARAMS)
+        if self.params_cache is not None:
+            self.params_cache.put(node, params)
+        return params
+
+    def invalidate_connection_params(self, node: Dict[str, Any]):
+        """Forget cached params for a node, e.g. after connecting with them failed."""
+        if self.params_cache is not None and self.params_cache.invalidate(node):
+            logger.info(f"Invalidated cached connection params for node: {node.get('id', node)}")
+
+    async def suggest_fix(self, node: Dict[str, Any], error_msg: str) -> str:
+        """
+        Uses LLM to propose a fix or recovery strategy for a failed node connection.
         """
+        if self.batch_window > 0:
+            return await self._batched("fix", (node_fingerprint(node), error_msg), {"node": node, "error": error_msg})
+        return await self._request_fix(node, error_msg)
+
+    async def _request_connection_params(self, node: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         node_info = json.dumps(node)
         prompt = (
             f"You are an expert in distributed networks. "
@@ -45,18 +145,14 @@ class AIAgent:
             "Reply with JSON only."
         )
         logger.info(f"Requesting AI for connection params for node: {node.get('id', node)}")
-        result = self._call_openai(prompt, max_tokens=100)
-        try:
-            params = json.loads(result)
-        except Exception as e:
-            logger.warning(f"AI response not valid JSON, fallback to defaults. Error: {e}")
-            params = {"handshake": True, "retries": 3, "timeout": 10}
+        result = await self._call_openai(prompt, max_tokens=100)
+        params = _loads_object(result)
+        if not params:
+            logger.warning("AI response not valid JSON, fallback to defaults.")
+            return None
         return params
 
-    async def suggest_fix(self, node: Dict[str, Any], error_msg: str) -> str:
-        """
-        Uses LLM to propose a fix or recovery strategy for a failed node connection.
-        """
+    async def _request_fix(self, node: Dict[str, Any], error_msg: str) -> str:
         node_info = json.dumps(node)
         prompt = (
             f"You are an AI troubleshooting assistant. "
@@ -65,22 +161,157 @@ class AIAgent:
             "Suggest a concise, actionable fix or workaround (e.g., reset handshake, increase timeout, use backup path)."
         )
         logger.info(f"Requesting AI for fix suggestion for node: {node.get('id', node)}")
-        result = self._call_openai(prompt, max_tokens=40)
+        result = await self._call_openai(prompt, max_tokens=40)
         return result.strip()
 
-    def _call_openai(self, prompt: str, max_tokens: int = 50) -> str:
+    # --- Micro-batching ---
+    async def _batched(self, kind: str, key: Any, item: Dict[str, Any]) -> Any:
         """
-        Synchronous wrapper for OpenAI completion (for use within async functions).
+        Queue a params/fix request for the next batch of its kind. A batch is sent
+        `batch_window` seconds after its first request, or as soon as it holds
+        `max_batch_size` distinct items; identical requests share one item.
         """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending[kind]
+        if key in pending:
+            pending[key][1].append(future)
+        else:
+            pending[key] = (item, [future])
+        if len(pending) >= self.max_batch_size:
+            self._flush(kind)
+        elif kind not in self._flush_timers:
+            self._flush_timers[kind] = loop.call_later(self.batch_window, self._flush, kind)
+        return await future
+
+    def _flush(self, kind: str):
+        timer = self._flush_timers.pop(kind, None)
+        if timer is not None:
+            timer.cancel()
+        batch, self._pending[kind] = self._pending[kind], {}
+        if batch:
+            task = asyncio.ensure_future(self._run_batch(kind, batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, kind: str, batch: Dict[Any, Tuple[Dict[str, Any], List[asyncio.Future]]]):
+        items = [item for item, _ in batch.values()]
         try:
-            response = openai.ChatCompletion.create(
+            if len(items) == 1:
+                item = items[0]
+                if kind == "params":
+                    results = [await self._request_connection_params(item)]
+                else:
+                    results = [await self._request_fix(item["node"], item["error"])]
+            else:
+                self.stats["batches"] += 1
+                self.stats["batched_items"] += len(items)
+                results = await (self._params_batch(items) if kind == "params" else self._fix_batch(items))
+        except asyncio.CancelledError:
+            for _, futures in batch.values():
+                for future in futures:
+                    future.cancel()
+            raise
+        except Exception as e:
+            for _, futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        for (_, futures), result in zip(batch.values(), results):
+            for future in futures:
+                if not future.done():
+                    future.set_result(result)
+
+    async def _params_batch(self, nodes: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        keyed = {f"n{i}": node for i, node in enumerate(nodes)}
+        prompt = (
+            "You are an expert in distributed networks. "
+            "For each Pi Network node below (keyed by ID), generate a JSON object of secure, robust connection "
+            "parameters (e.g., handshake, retries, timeouts, security).\n"
+            f"Nodes:\n{json.dumps(keyed)}\n"
+            "Reply with JSON only: one object mapping every key to its parameters object."
+        )
+        logger.info(f"Requesting AI for connection params for {len(nodes)} nodes in one batch")
+        reply = _loads_object(await self._call_openai(prompt, max_tokens=min(100 * len(nodes), 4096))) or {}
+        results = []
+        for key in keyed:
+            params = reply.get(key)
+            if not isinstance(params, dict) or not params:
+                self.stats["batch_fallbacks"] += 1
+                logger.warning(f"Batch reply missing valid params for node {keyed[key].get('id', key)}, using defaults.")
+                params = None
+            results.append(params)
+        return results
+
+    async def _fix_batch(self, failures: List[Dict[str, Any]]) -> List[str]:
+        keyed = {f"n{i}": failure for i, failure in enumerate(failures)}
+        prompt = (
+            "You are an AI troubleshooting assistant. "
+            "For each failed Pi Network node below (keyed by ID, with its node info and error), suggest a concise, "
+            "actionable fix or workaround (e.g., reset handshake, increase timeout, use backup path).\n"
+            f"Failures:\n{json.dumps(keyed)}\n"
+            "Reply with JSON only: one object mapping every key to its fix as a string."
+        )
+        logger.info(f"Requesting AI for fix suggestions for {len(failures)} nodes in one batch")
+        reply = _loads_object(await self._call_openai(prompt, max_tokens=min(40 * len(failures), 4096))) or {}
+        results = []
+        for key in keyed:
+            fix = reply.get(key)
+            if not isinstance(fix, str) or not fix.strip():
+                self.stats["batch_fallbacks"] += 1
+                fix = DEFAULT_FIX
+            results.append(fix.strip())
+        return results
+
+    async def _call_openai(self, prompt: str, max_tokens: int = 50, timeout: Optional[float] = None) -> str:
+        """
+        Async OpenAI completion. Waits for a free slot, then runs the request with a
+        deadline; timeouts and API errors return the default answer, while cancelling
+        the caller cancels the request.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            self.stats["calls"] += 1
+            self.stats["in_flight"] += 1
+            try:
+                content = await asyncio.wait_for(
+                    self._complete(prompt, max_tokens), timeout if timeout is not None else self.timeout
+                )
+                return content.strip()
+            except asyncio.TimeoutError:
+                self.stats["timeouts"] += 1
+                logger.error(f"OpenAI API call timed out after {timeout or self.timeout}s")
+            except Exception as e:
+                self.stats["failures"] += 1
+                logger.error(f"OpenAI API call failed: {e}")
+            finally:
+                self.stats["in_flight"] -= 1
+        return "default-strategy" if "strategy" in prompt.lower() else "{}"
+
+    async def _complete(self, prompt: str, max_tokens: int) -> str:
+        messages = [{"role": "system", "content": prompt}]
+        if hasattr(openai, "AsyncOpenAI"):
+            if self._client is None:
+                self._client = openai.AsyncOpenAI(api_key=self.api_key, max_retries=0)
+            response = await self._client.chat.completions.create(
                 model=self.model,
-                messages=[{"role": "system", "content": prompt}],
+                messages=messages,
                 max_tokens=max_tokens,
                 temperature=0.2,
             )
-            content = response.choices[0].message.content
-            return content.strip()
-        except Exception as e:
-            logger.error(f"OpenAI API call failed: {e}")
-            return "default-strategy" if "strategy" in prompt.lower() else "{}"
+        else:
+            # Pre-1.0 openai only ships a blocking client: keep it off the event loop.
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_concurrency, thread_name_prefix="AIAgent")
+            response = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                lambda: openai.ChatCompletion.create(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=0.2,
+                ),
+            )
+        return response.choices[0].message.content
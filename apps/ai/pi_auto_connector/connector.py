@@ -1,14 +1,77 @@
 # apps/ai/pi_auto_connector/connector.py
 
 import asyncio
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict, deque
+from typing import AsyncIterator, Deque, List, Dict, Any, Optional, Tuple
+from urllib.parse import urlsplit
 import logging
 from .pi_api_client import AsyncPiClient
 from .ai_agent import AIAgent
+from .params_cache import ConnectionParamsCache
+from .health_scheduler import HealthCheckScheduler
+from .reconnect_queue import ReconnectQueue
+from .node_registry import NodeRegistry
+from .node_state import MetadataStore, NodeState, NodeStatus
+from .node_stats import NodeRanking
 
 logger = logging.getLogger("PiAutoConnector")
 logging.basicConfig(level=logging.INFO)
 
+
+def _node_id(node: Dict[str, Any]) -> str:
+    return node.get("id") or node.get("address") or str(node)
+
+
+def _node_host(node: Dict[str, Any]) -> str:
+    """Host a node is served from, used to spread connection attempts fairly across hosts."""
+    address = node.get("host") or node.get("address") or node.get("ip")
+    if not address:
+        return _node_id(node)
+    address = str(address)
+    return urlsplit(address if "//" in address else f"//{address}").hostname or address
+
+
+class HostFairQueue:
+    """
+    Work queue of nodes grouped by host. pop() hands out nodes round-robin across
+    hosts and skips hosts that already have `per_host_limit` attempts in flight,
+    so one large host cannot starve the others.
+    """
+
+    def __init__(self, per_host_limit: int = 4):
+        self.per_host_limit = per_host_limit
+        self._pending: "OrderedDict[str, Deque[Dict[str, Any]]]" = OrderedDict()
+        self._active: Dict[str, int] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def put(self, node: Dict[str, Any]):
+        self._pending.setdefault(_node_host(node), deque()).append(node)
+        self._size += 1
+
+    def pop(self) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Next (host, node) whose host is under its limit, or None if all pending hosts are busy."""
+        for host, nodes in self._pending.items():
+            if self._active.get(host, 0) < self.per_host_limit:
+                node = nodes.popleft()
+                if nodes:
+                    self._pending.move_to_end(host)
+                else:
+                    del self._pending[host]
+                self._active[host] = self._active.get(host, 0) + 1
+                self._size -= 1
+                return host, node
+        return None
+
+    def release(self, host: str):
+        active = self._active.get(host, 0) - 1
+        if active > 0:
+            self._active[host] = active
+        else:
+            self._active.pop(host, None)
+
 class PiAutoConnector:
     """
     Ultra high-tech, feature-rich, AI-driven auto-connector for Pi Network.
@@ -23,17 +86,75 @@ class PiAutoConnector:
         openai_api_key: str,
         node_discovery_interval: int = 600,
         health_check_interval: int = 300,
+        max_concurrency: int = 32,
+        per_host_limit: int = 4,
+        params_cache: Optional[ConnectionParamsCache] = None,
+        llm_batch_window: float = 0.05,
+        retire_after_missed: int = 2,
+        retire_min_fraction: float = 0.5,
+        health_check_concurrency: int = 64,
+        reconnect_concurrency: int = 8,
+        reconnect_base_delay: float = 1.0,
+        reconnect_max_delay: float = 300.0,
+        registry: Optional[NodeRegistry] = None,
+        registry_flush_interval: float = 5.0,
     ):
+        """
+        :param max_concurrency: Max node connections (Pi API + LLM calls) in flight at once
+        :param per_host_limit: Max concurrent connection attempts against one host
+        :param params_cache: Cache for AI connection params (default: in-memory, 1h TTL);
+            pass ConnectionParamsCache(path=...) to keep it across restarts
+        :param llm_batch_window: Seconds to gather concurrent params/fix requests into one
+            multi-node LLM prompt (0 disables batching)
+        :param retire_after_missed: Consecutive discovery passes a known node may be absent
+            from before it is retired (2 by default, so a single bad response retires nothing)
+        :param retire_min_fraction: A discovery result listing fewer nodes than this fraction
+            of the known nodes (e.g. an empty or truncated /nodes response) is treated as
+            partial: no node is counted as missing or retired on that pass
+        :param health_check_concurrency: Max health probes in flight at once; probe intervals
+            adapt per node between health_check_interval / 4 and health_check_interval * 4
+        :param reconnect_concurrency: Max reconnects of failed nodes in flight at once
+        :param reconnect_base_delay: Backoff before a failed node's first retry, in seconds;
+            doubles (with jitter) per consecutive failure up to reconnect_max_delay
+        :param registry: Optional NodeRegistry(path) persisting nodes, last-known-good params and
+            health history; run() warm-starts from it
+        :param registry_flush_interval: Seconds between registry writes
+        """
         self.client = AsyncPiClient(pi_api_base, pi_api_key)
-        self.ai_agent = AIAgent(openai_api_key)
+        if params_cache is None:
+            params_cache = ConnectionParamsCache()
+        self.ai_agent = AIAgent(openai_api_key, params_cache=params_cache, batch_window=llm_batch_window)
         self.node_discovery_interval = node_discovery_interval
         self.health_check_interval = health_check_interval
-        self.connected_nodes: Dict[str, Dict[str, Any]] = {}  # node_id: {status, metadata}
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.retire_after_missed = retire_after_missed
+        self.retire_min_fraction = retire_min_fraction
+        self.health_scheduler = HealthCheckScheduler(health_check_interval, max_concurrency=health_check_concurrency)
+        self.reconnect_queue = ReconnectQueue(
+            base_delay=reconnect_base_delay,
+            max_delay=reconnect_max_delay,
+            max_concurrency=reconnect_concurrency,
+        )
+        self.registry = registry
+        self.registry_flush_interval = registry_flush_interval
+        self.metadata_store = MetadataStore()  # Raw node metadata, decoded on demand
+        self.node_stats = NodeRanking()  # RTT / success-rate per node, fed by connects and health checks
+        self.connected_nodes: Dict[str, NodeState] = {}
+        self.progress = {"queued": 0, "in_flight": 0, "completed": 0, "connected": 0, "failed": 0}
+        self._progress_started: Optional[float] = None
+        self._progress_finished: Optional[float] = None
+        self.discovery_stats = {
+            "discovered": 0, "added": 0, "retried": 0, "backing_off": 0, "updated": 0, "unchanged": 0, "retired": 0,
+            "partial": 0,
+        }
         self._running = False
 
     async def auto_discover_and_connect(self):
         """
-        Discovers new nodes and connects using AI-optimized strategies.
+        Discovers nodes and applies the difference to the registry: connects new nodes
+        (and known nodes in error), retires nodes that have disappeared and leaves
+        existing healthy connections alone. Returns the connection results.
         """
         logger.info("Auto-discovery and connection process started.")
         strategy = await self.ai_agent.select_discovery_strategy()
@@ -41,84 +162,371 @@ class PiAutoConnector:
         nodes = await self.client.discover_nodes(strategy=strategy)
         logger.info(f"Discovered {len(nodes)} Pi nodes.")
 
-        connect_tasks = []
-        for node in nodes:
-            connect_tasks.append(self.connect_node_with_ai(node))
-        results = await asyncio.gather(*connect_tasks)
-        logger.info("Connection results: %s", results)
+        to_connect, vanished = self.diff_discovery(nodes)
+        for node_id in vanished:
+            self.retire_node(node_id)
+        stats = self.discovery_stats
+        logger.info(
+            "Discovery diff: %d new, %d retried, %d backing off, %d updated, %d unchanged, %d retired",
+            stats["added"], stats["retried"], stats["backing_off"], stats["updated"], stats["unchanged"], stats["retired"],
+        )
+        if not to_connect:
+            return []
+        results = [result async for result in self.connect_nodes(to_connect)]
+        logger.info(
+            "Connection results: %d connected, %d failed (params cache hit ratio %.0f%%)",
+            self.progress["connected"],
+            self.progress["failed"],
+            self.ai_agent.params_cache.stats()["hit_ratio"] * 100,
+        )
         return results
 
+    def diff_discovery(self, nodes: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Compares a discovery result with connected_nodes. Returns the nodes that need a
+        connection attempt (new, or known but in error and not waiting in the reconnect
+        queue) and the ids of known nodes that have now been missing for
+        retire_after_missed passes. Other known nodes only get their metadata refreshed.
+        A result much smaller than the registry (see retire_min_fraction) retires nothing.
+        """
+        stats = dict.fromkeys(self.discovery_stats, 0)
+        stats["discovered"] = len(nodes)
+        to_connect: List[Dict[str, Any]] = []
+        seen = set()
+        for node in nodes:
+            node_id = _node_id(node)
+            if node_id in seen:
+                continue
+            seen.add(node_id)
+            info = self.connected_nodes.get(node_id)
+            if info is None:
+                stats["added"] += 1
+                to_connect.append(node)
+                continue
+            info.missed = 0
+            if info.status is NodeStatus.ERROR and node_id not in self.reconnect_queue:
+                stats["retried"] += 1
+                to_connect.append(node)
+                continue
+            changed = self.metadata_store.put(node_id, node)
+            if node_id in self.reconnect_queue:
+                stats["backing_off"] += 1
+            elif changed:
+                stats["updated"] += 1
+            else:
+                stats["unchanged"] += 1
+            if changed and self.registry is not None:
+                self.registry.update_metadata(node_id, node)
+        vanished = []
+        known = len(self.connected_nodes)
+        if known and len(seen) < self.retire_min_fraction * known:
+            logger.warning(
+                f"Discovery returned {len(seen)} nodes for {known} known; "
+                "treating it as partial and retiring nothing."
+            )
+            stats["partial"] = 1
+            self.discovery_stats = stats
+            return to_connect, vanished
+        for node_id in self.connected_nodes.keys() - seen:
+            info = self.connected_nodes[node_id]
+            info.missed += 1
+            if info.missed >= self.retire_after_missed:
+                vanished.append(node_id)
+        stats["retired"] = len(vanished)
+        self.discovery_stats = stats
+        return to_connect, vanished
+
+    def retire_node(self, node_id: str):
+        """
+        Drops a node that is no longer discovered from the registry.
+        """
+        info = self.connected_nodes.pop(node_id, None)
+        if info is not None:
+            logger.info(f"Retiring node {node_id}: no longer discovered.")
+            self.health_scheduler.remove(node_id)
+            self.reconnect_queue.remove(node_id)
+            self.node_stats.remove(node_id)
+            if self.registry is not None:
+                self.registry.delete(node_id)
+            self.on_retire(node_id, info)
+            self.metadata_store.discard(node_id)
+
+    async def connect_nodes(self, nodes: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Connects nodes through a bounded, host-fair work queue and yields each result as
+        soon as its connection attempt finishes. At most max_concurrency attempts run at
+        once, and at most per_host_limit against any single host.
+        """
+        queue = HostFairQueue(self.per_host_limit)
+        for node in nodes:
+            queue.put(node)
+        loop = asyncio.get_running_loop()
+        self.progress.update(queued=len(queue), in_flight=0, completed=0, connected=0, failed=0)
+        self._progress_started, self._progress_finished = loop.time(), None
+        running: Dict[asyncio.Task, str] = {}
+        try:
+            while queue or running:
+                while len(running) < self.max_concurrency:
+                    item = queue.pop()
+                    if item is None:
+                        break
+                    host, node = item
+                    running[asyncio.ensure_future(self.connect_node_with_ai(node))] = host
+                self.progress["queued"] = len(queue)
+                self.progress["in_flight"] = len(running)
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    queue.release(running.pop(task))
+                    result = task.result()
+                    self.progress["completed"] += 1
+                    self.progress["connected" if result["status"] == "connected" else "failed"] += 1
+                    self.progress["in_flight"] = len(running)
+                    yield result
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            self.progress["in_flight"] = 0
+            self._progress_finished = loop.time()
+
+    def connection_progress(self) -> Dict[str, Any]:
+        """
+        Snapshot of the current (or last) connection fan-out: queued, in-flight and
+        completed counts plus completions per second.
+        """
+        snapshot: Dict[str, Any] = dict(self.progress)
+        if self._progress_started is None:
+            snapshot.update(elapsed=0.0, per_second=0.0)
+            return snapshot
+        elapsed = (self._progress_finished or asyncio.get_event_loop().time()) - self._progress_started
+        snapshot["elapsed"] = elapsed
+        snapshot["per_second"] = self.progress["completed"] / elapsed if elapsed > 0 else 0.0
+        return snapshot
+
     async def connect_node_with_ai(self, node: Dict[str, Any]):
         """
         Connects to a node using AI-suggested parameters and handles errors with AI assistance.
         """
-        node_id = node.get("id") or node.get("address") or str(node)
+        node_id = _node_id(node)
         try:
             params = await self.ai_agent.get_connection_params(node)
             logger.info(f"Connecting to node {node_id} with params: {params}")
+            started = asyncio.get_event_loop().time()
             result = await self.client.connect_node(node_id, params)
-            self.connected_nodes[node_id] = {
-                "status": "connected",
-                "metadata": node,
-                "last_success": asyncio.get_event_loop().time(),
-            }
+            self.node_stats.record(node_id, True, asyncio.get_event_loop().time() - started)
+            self.connected_nodes[node_id] = NodeState(
+                node_id,
+                NodeStatus.CONNECTED,
+                self.metadata_store,
+                metadata=node,
+                last_success=asyncio.get_event_loop().time(),
+            )
+            self.reconnect_queue.reset(node_id)
+            self.health_scheduler.add(node_id)
+            if self.registry is not None:
+                self.registry.record_connected(node_id, node, params)
             logger.info(f"Connected to node {node_id}")
             self.on_connect(node_id, result)
             return {"node": node_id, "status": "connected"}
         except Exception as e:
             logger.error(f"Error connecting to node {node_id}: {e}")
+            self.node_stats.record(node_id, False)
+            self.ai_agent.invalidate_connection_params(node)
             fix = await self.ai_agent.suggest_fix(node, str(e))
             logger.info(f"AI suggested fix for node {node_id}: {fix}")
-            self.connected_nodes[node_id] = {
-                "status": "error",
-                "metadata": node,
-                "last_error": asyncio.get_event_loop().time(),
-                "error": str(e),
-                "ai_fix": fix,
-            }
+            self.connected_nodes[node_id] = NodeState(
+                node_id,
+                NodeStatus.ERROR,
+                self.metadata_store,
+                metadata=node,
+                last_error=asyncio.get_event_loop().time(),
+                error=str(e),
+                ai_fix=fix,
+            )
+            self.schedule_reconnect(node_id)
+            if self.registry is not None:
+                self.registry.record_error(node_id, node, str(e), fix)
             self.on_error(node_id, str(e), fix)
             return {"node": node_id, "status": "error", "error": str(e), "fix": fix}
 
     async def health_check_loop(self):
         """
-        Periodically checks the health of all connected nodes and auto-heals using AI if needed.
+        Runs the health-check scheduler: probes are spread over the interval with jitter,
+        run concurrently, and repeated more often for flapping nodes and less often for
+        long-stable ones.
         """
         logger.info("Health check loop started.")
+        for node_id in self.connected_nodes:
+            if node_id not in self.reconnect_queue:
+                self.health_scheduler.add(node_id)
+        await self.health_scheduler.run(self.check_node)
+
+    async def check_node(self, node_id: str) -> bool:
+        """
+        Checks one node and auto-heals it using AI if needed. Returns True if the node was healthy.
+        """
+        info = self.connected_nodes.get(node_id)
+        if info is None:
+            self.health_scheduler.remove(node_id)
+            return True
+        try:
+            started = asyncio.get_event_loop().time()
+            healthy = await self.client.check_node_health(node_id)
+            self.node_stats.record(node_id, healthy, asyncio.get_event_loop().time() - started if healthy else None)
+            if self.registry is not None:
+                self.registry.record_health(node_id, healthy)
+            if healthy:
+                logger.debug(f"Node {node_id} is healthy.")
+                self._set_status(info, NodeStatus.CONNECTED)
+                return True
+            logger.warning(f"Node {node_id} is unhealthy. Attempting self-heal.")
+            fix = await self.ai_agent.suggest_fix(info.metadata, "Unhealthy node")
+            await self.client.reconnect_node(node_id, fix)
+            self._set_status(info, NodeStatus.RECOVERED)
+            logger.info(f"Node {node_id} recovered using AI fix.")
+            self.on_recover(node_id, fix)
+        except Exception as e:
+            logger.error(f"Health check failed for node {node_id}: {e}")
+            self._set_status(info, NodeStatus.ERROR)
+            self.on_error(node_id, str(e), None)
+            self.schedule_reconnect(node_id)
+        return False
+
+    def _set_status(self, info: NodeState, status: NodeStatus):
+        if info.status is not status:
+            info.status = status
+            if self.registry is not None:
+                self.registry.record_status(info.node_id, status.value)
+
+    def best_nodes(self, n: int = 1) -> List[str]:
+        """
+        Ids of the `n` best nodes to route traffic to: lowest EWMA RTT, penalized by failure
+        rate, among nodes that are not waiting to reconnect. Cheap enough to call per
+        transaction (the ranking is kept sorted as results come in).
+        """
+        return self.node_stats.best_nodes(n)
+
+    def node_priority(self, node: Dict[str, Any]) -> float:
+        """
+        Reconnect priority of a node: its reported traffic (or weight), so the busiest
+        nodes come back first after an incident. Override for a custom ranking.
+        """
+        try:
+            return float(node.get("traffic") or node.get("weight") or 0)
+        except (TypeError, ValueError):
+            return 0.0
+
+    def schedule_reconnect(self, node_id: str):
+        """
+        Hands a failed node to the reconnect queue (and stops health-probing it until it is back).
+        """
+        info = self.connected_nodes.get(node_id)
+        if info is None:
+            return
+        self.health_scheduler.remove(node_id)
+        self.node_stats.exclude(node_id)
+        delay = self.reconnect_queue.schedule(node_id, self.node_priority(info.metadata))
+        if delay is not None:
+            logger.info(
+                f"Node {node_id} will be reconnected in {delay:.1f}s "
+                f"(attempt {self.reconnect_queue.attempts(node_id)})"
+            )
+
+    async def reconnect_loop(self):
+        """
+        Reconnects failed nodes from the reconnect queue as their backoff expires,
+        highest-traffic nodes first.
+        """
+        logger.info("Reconnect loop started.")
+        await self.reconnect_queue.run(self.retry_node)
+
+    async def retry_node(self, node_id: str) -> bool:
+        """
+        One reconnect attempt for a failed node. Returns True if it is connected again
+        (or is no longer known); a failure re-queues it with a longer backoff.
+        """
+        info = self.connected_nodes.get(node_id)
+        if info is None:
+            return True
+        result = await self.connect_node_with_ai(info.metadata)
+        return result["status"] == "connected"
+
+    async def warm_start(self) -> List[Dict[str, Any]]:
+        """
+        Restores connected_nodes from the registry. Nodes that were up at shutdown are
+        reconnected with their last-known-good params (seeded into the params cache, so
+        no LLM calls); nodes that were in error go to the reconnect queue. Returns the
+        connection results.
+        """
+        if self.registry is None:
+            return []
+        stored = self.registry.load()
+        to_connect = []
+        for node_id, record in stored.items():
+            self.connected_nodes[node_id] = NodeState(
+                node_id,
+                record["status"],
+                self.metadata_store,
+                metadata=record["metadata"],
+                error=record["error"],
+                ai_fix=record["ai_fix"],
+            )
+            if record["status"] == "error":
+                self.schedule_reconnect(node_id)
+                continue
+            if record["params"] is not None:
+                self.ai_agent.params_cache.put(record["metadata"], record["params"])
+            to_connect.append(record["metadata"])
+        logger.info(
+            f"Warm start: loaded {len(stored)} nodes from the registry in "
+            f"{self.registry.metrics['load_seconds'] * 1000:.1f}ms; reconnecting {len(to_connect)}"
+        )
+        if not to_connect:
+            return []
+        return [result async for result in self.connect_nodes(to_connect)]
+
+    async def registry_loop(self):
+        """
+        Periodically writes buffered registry changes to disk. A failed flush is logged
+        and its changes are retried on the next pass; stop() does the final flush.
+        """
         while self._running:
-            await asyncio.sleep(self.health_check_interval)
-            logger.info("Running health checks for all connected nodes.")
-            for node_id, info in list(self.connected_nodes.items()):
-                try:
-                    healthy = await self.client.check_node_health(node_id)
-                    if healthy:
-                        logger.info(f"Node {node_id} is healthy.")
-                        self.connected_nodes[node_id]["status"] = "connected"
-                    else:
-                        logger.warning(f"Node {node_id} is unhealthy. Attempting self-heal.")
-                        fix = await self.ai_agent.suggest_fix(info["metadata"], "Unhealthy node")
-                        await self.client.reconnect_node(node_id, fix)
-                        self.connected_nodes[node_id]["status"] = "recovered"
-                        logger.info(f"Node {node_id} recovered using AI fix.")
-                        self.on_recover(node_id, fix)
-                except Exception as e:
-                    logger.error(f"Health check failed for node {node_id}: {e}")
-                    self.connected_nodes[node_id]["status"] = "error"
-                    self.on_error(node_id, str(e), None)
+            await asyncio.sleep(self.registry_flush_interval)
+            if not self._running:
+                break
+            try:
+                await self.registry.aflush()
+            except Exception as e:
+                logger.error(f"Registry flush failed: {e}")
 
     async def run(self):
         """
         Starts the unstoppable Pi auto-connector loop.
         """
         self._running = True
+        await self.warm_start()
         await self.auto_discover_and_connect()
         asyncio.create_task(self.discovery_loop())
         asyncio.create_task(self.health_check_loop())
+        asyncio.create_task(self.reconnect_loop())
+        if self.registry is not None:
+            asyncio.create_task(self.registry_loop())
 
     async def stop(self):
         """
-        Stops the auto-connector.
+        Stops the auto-connector, closes the Pi API and LLM connection pools and
+        flushes the registry.
         """
         self._running = False
+        self.health_scheduler.stop()
+        self.reconnect_queue.stop()
+        if self.registry is not None:
+            try:
+                self.registry.close()
+            except Exception as e:
+                logger.error(f"Final registry flush failed: {e}")
+        await self.client.aclose()
+        await self.ai_agent.aclose()
 
     async def discovery_loop(self):
         """
@@ -139,6 +547,9 @@ class PiAutoConnector:
     def on_recover(self, node_id: str, ai_fix: str):
         logger.info(f"[Event] Node recovered: {node_id}, AI Fix: {ai_fix}")
 
+    def on_retire(self, node_id: str, info: NodeState):
+        logger.info(f"[Event] Node retired: {node_id}, Last status: {info.status}")
+
 # Example of launching the unstoppable connector (to be used in your main app or async runner)
 # if __name__ == "__main__":
 #     import os
@@ -0,0 +1,188 @@
+# apps/ai/pi_auto_connector/health_scheduler.py
+
+import asyncio
+import heapq
+import logging
+import random
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger("HealthScheduler")
+
+
+class _ProbeState:
+    __slots__ = ("interval", "due", "last_healthy", "streak", "flaps", "probes")
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.due: Optional[float] = None  # None while a probe is running
+        self.last_healthy: Optional[bool] = None
+        self.streak = 0  # Consecutive healthy probes
+        self.flaps = 0
+        self.probes = 0
+
+
+class HealthCheckScheduler:
+    """
+    Adaptive health-check scheduler.
+    - Keeps one timer per node in a heap keyed by due time, so probes are spread over the
+      interval instead of firing in one synchronized sweep.
+    - Runs due probes concurrently, at most `max_concurrency` at a time.
+    - Each node's interval adapts: it is halved (down to min_interval) when the node flaps
+      or stays unhealthy, and stretched by `growth` (up to max_interval) once the node has
+      been healthy for `stable_after` probes in a row. Every delay gets +/- `jitter`.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        jitter: float = 0.2,
+        max_concurrency: int = 64,
+        stable_after: int = 3,
+        growth: float = 1.5,
+        clock: Optional[Callable[[], float]] = None,
+    ):
+        """
+        :param interval: Probe interval for a newly tracked node, in seconds
+        :param min_interval: Fastest probe interval for flapping/unhealthy nodes (default interval / 4)
+        :param max_interval: Slowest probe interval for long-stable nodes (default interval * 4)
+        :param jitter: Random +/- fraction applied to every delay
+        :param max_concurrency: Max probes in flight at once
+        :param stable_after: Consecutive healthy probes before the interval starts growing
+        :param growth: Interval multiplier per further healthy probe
+        :param clock: Monotonic time source in seconds (default: the running event loop's clock)
+        """
+        self.interval = interval
+        self.min_interval = min_interval if min_interval is not None else interval / 4
+        self.max_interval = max_interval if max_interval is not None else interval * 4
+        self.jitter = jitter
+        self.max_concurrency = max_concurrency
+        self.stable_after = stable_after
+        self.growth = growth
+        self._clock = clock
+        self.metrics = {"probes": 0, "unhealthy": 0, "flaps": 0, "errors": 0, "in_flight": 0}
+        self._nodes: Dict[str, _ProbeState] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self._wakeup = asyncio.Event()
+        self._running = False
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._nodes
+
+    def _now(self) -> float:
+        if self._clock is not None:
+            return self._clock()
+        return asyncio.get_event_loop().time()
+
+    def _jittered(self, delay: float) -> float:
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _schedule(self, node_id: str, state: _ProbeState, due: float):
+        state.due = due
+        if self._heap and due >= self._heap[0][0]:
+            heapq.heappush(self._heap, (due, node_id))
+            return
+        heapq.heappush(self._heap, (due, node_id))
+        self._wakeup.set()  # New earliest deadline
+
+    def add(self, node_id: str, delay: Optional[float] = None):
+        """
+        Starts tracking a node. Its first probe runs after `delay` seconds (default: a
+        random point within one interval, so bulk additions do not probe in lockstep).
+        """
+        if node_id in self._nodes:
+            return
+        state = self._nodes[node_id] = _ProbeState(self.interval)
+        self._schedule(node_id, state, self._now() + (delay if delay is not None else random.uniform(0, self.interval)))
+
+    def remove(self, node_id: str):
+        """Stops tracking a node (its heap entry is skipped when it comes due)."""
+        self._nodes.pop(node_id, None)
+
+    def _record(self, node_id: str, healthy: bool):
+        state = self._nodes.get(node_id)
+        if state is None:
+            return
+        state.probes += 1
+        if state.last_healthy is not None and healthy != state.last_healthy:
+            state.flaps += 1
+            self.metrics["flaps"] += 1
+            state.streak = 0
+            state.interval = max(self.min_interval, state.interval / 2)
+        elif healthy:
+            state.streak += 1
+            if state.streak >= self.stable_after:
+                state.interval = min(self.max_interval, state.interval * self.growth)
+        else:
+            state.streak = 0
+            state.interval = max(self.min_interval, state.interval / 2)
+        state.last_healthy = healthy
+        self._schedule(node_id, state, self._now() + self._jittered(state.interval))
+
+    async def _probe(self, node_id: str, probe: Callable[[str], Awaitable[bool]]):
+        self.metrics["in_flight"] += 1
+        try:
+            healthy = bool(await probe(node_id))
+        except Exception as e:
+            logger.error(f"Health probe for node {node_id} failed: {e}")
+            self.metrics["errors"] += 1
+            healthy = False
+        finally:
+            self.metrics["in_flight"] -= 1
+        self.metrics["probes"] += 1
+        if not healthy:
+            self.metrics["unhealthy"] += 1
+        self._record(node_id, healthy)
+
+    async def run(self, probe: Callable[[str], Awaitable[bool]]):
+        """
+        Probes nodes as they come due until stop() is called.
+        :param probe: Coroutine function returning True when the node is healthy
+        """
+        self._running = True
+        slots = asyncio.Semaphore(self.max_concurrency)
+        tasks = set()
+        try:
+            while self._running:
+                while self._heap and self._heap[0][0] <= self._now():
+                    await slots.acquire()
+                    if not self._heap or self._heap[0][0] > self._now():
+                        slots.release()
+                        break
+                    due, node_id = heapq.heappop(self._heap)
+                    state = self._nodes.get(node_id)
+                    if state is None or state.due != due:
+                        slots.release()  # Removed, or superseded by a newer entry
+                        continue
+                    state.due = None
+                    task = asyncio.ensure_future(self._probe(node_id, probe))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                    task.add_done_callback(lambda _: slots.release())
+                timeout = self._heap[0][0] - self._now() if self._heap else None
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop(self):
+        self._running = False
+        self._wakeup.set()
+
+    def stats(self) -> Dict[str, Any]:
+        intervals = [state.interval for state in self._nodes.values()]
+        return {
+            **self.metrics,
+            "tracked": len(self._nodes),
+            "flapping": sum(1 for state in self._nodes.values() if state.interval <= self.min_interval),
+            "mean_interval": sum(intervals) / len(intervals) if intervals else 0.0,
+        }
@@ -0,0 +1,213 @@
+# apps/ai/pi_auto_connector/node_registry.py
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger("NodeRegistry")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    node_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    params TEXT,
+    last_success REAL,
+    last_error REAL,
+    error TEXT,
+    ai_fix TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS health (
+    node_id TEXT NOT NULL,
+    ts REAL NOT NULL,
+    healthy INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS health_node_ts ON health (node_id, ts);
+"""
+
+_JSON_COLUMNS = ("metadata", "params")
+
+
+class NodeRegistry:
+    """
+    SQLite-backed registry of known nodes for warm restarts.
+    - Stores each node's status, metadata, last-known-good connection params, last
+      error / AI fix, and a bounded health-check history (wall-clock timestamps).
+    - Writes are buffered in memory and applied in one transaction by flush() (or
+      aflush() from the event loop), so recording a result never blocks on disk.
+    - load() reads the whole registry in a single query on startup.
+    """
+
+    def __init__(self, path: str, history_size: int = 20):
+        """
+        :param path: SQLite database file (created if missing; ":memory:" for tests)
+        :param history_size: Health-check results kept per node
+        """
+        self.path = path
+        self.history_size = history_size
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()  # Guards the write buffers
+        self._db_lock = threading.Lock()  # Serializes use of the connection across threads
+        self._pending: Dict[str, Dict[str, Any]] = {}  # node_id: {column: value}
+        self._health: List[Tuple[str, float, int]] = []
+        self._deleted: set = set()
+        self.metrics = {"flushes": 0, "flush_errors": 0, "rows_written": 0, "loaded": 0, "load_seconds": 0.0}
+
+    def _update(self, node_id: str, **columns):
+        with self._lock:
+            self._deleted.discard(node_id)
+            self._pending.setdefault(node_id, {}).update(columns, updated_at=time.time())
+
+    # --- Recording ---
+    def record_connected(self, node_id: str, metadata: Dict[str, Any], params: Dict[str, Any]):
+        self._update(node_id, status="connected", metadata=metadata, params=params, last_success=time.time())
+
+    def record_error(self, node_id: str, metadata: Dict[str, Any], error: str, ai_fix: Optional[str] = None):
+        self._update(node_id, status="error", metadata=metadata, last_error=time.time(), error=error, ai_fix=ai_fix)
+
+    def record_status(self, node_id: str, status: str):
+        self._update(node_id, status=status)
+
+    def update_metadata(self, node_id: str, metadata: Dict[str, Any]):
+        self._update(node_id, metadata=metadata)
+
+    def record_health(self, node_id: str, healthy: bool):
+        with self._lock:
+            self._health.append((node_id, time.time(), int(healthy)))
+
+    def delete(self, node_id: str):
+        with self._lock:
+            self._pending.pop(node_id, None)
+            self._health = [row for row in self._health if row[0] != node_id]
+            self._deleted.add(node_id)
+
+    # --- Persistence ---
+    def _requeue(self, pending: Dict[str, Dict[str, Any]], health: List[Tuple[str, float, int]], deleted: set):
+        """Puts the changes of a failed flush back in front of anything recorded since."""
+        with self._lock:
+            for node_id, columns in pending.items():
+                if node_id not in self._deleted:
+                    self._pending[node_id] = {**columns, **self._pending.get(node_id, {})}
+            self._health[:0] = [row for row in health if row[0] not in self._deleted]
+            self._deleted |= deleted - self._pending.keys()
+
+    def flush(self) -> int:
+        """
+        Write buffered changes in one transaction. Returns the number of rows written.
+        If the write fails (e.g. database locked or disk full) the changes stay buffered
+        for the next flush and the sqlite3.Error is raised.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            health, self._health = self._health, []
+            deleted, self._deleted = self._deleted, set()
+        if not (pending or health or deleted):
+            return 0
+        # Rows that set the same columns share one executemany()
+        groups: Dict[Tuple[str, ...], List[Tuple[Any, ...]]] = {}
+        for node_id, columns in pending.items():
+            names = tuple(sorted(columns))
+            values = [json.dumps(columns[name]) if name in _JSON_COLUMNS else columns[name] for name in names]
+            groups.setdefault(names, []).append((node_id, *values))
+        try:
+            self._write(groups, health, deleted)
+        except sqlite3.Error:
+            self.metrics["flush_errors"] += 1
+            self._requeue(pending, health, deleted)
+            raise
+        written = len(pending) + len(health) + len(deleted)
+        self.metrics["flushes"] += 1
+        self.metrics["rows_written"] += written
+        return written
+
+    def _write(
+        self,
+        groups: Dict[Tuple[str, ...], List[Tuple[Any, ...]]],
+        health: List[Tuple[str, float, int]],
+        deleted: set,
+    ):
+        with self._db_lock, self._db:
+            if deleted:
+                self._db.executemany("DELETE FROM nodes WHERE node_id = ?", [(node_id,) for node_id in deleted])
+                self._db.executemany("DELETE FROM health WHERE node_id = ?", [(node_id,) for node_id in deleted])
+            for names, rows in groups.items():
+                # New rows need status and metadata; partial updates for unknown nodes are dropped
+                insert = "status" in names and "metadata" in names
+                assignments = ", ".join(f"{name} = excluded.{name}" for name in names)
+                if insert:
+                    sql = (
+                        f"INSERT INTO nodes (node_id, {', '.join(names)}) VALUES ({', '.join('?' * (len(names) + 1))}) "
+                        f"ON CONFLICT(node_id) DO UPDATE SET {assignments}"
+                    )
+                else:
+                    sql = f"UPDATE nodes SET {', '.join(f'{name} = ?' for name in names)} WHERE node_id = ?"
+                    rows = [(*row[1:], row[0]) for row in rows]
+                self._db.executemany(sql, rows)
+            if health:
+                self._db.executemany("INSERT INTO health (node_id, ts, healthy) VALUES (?, ?, ?)", health)
+                self._db.executemany(
+                    "DELETE FROM health WHERE node_id = ? AND ts < ("
+                    "SELECT ts FROM health WHERE node_id = ? ORDER BY ts DESC LIMIT 1 OFFSET ?)",
+                    [(node_id, node_id, self.history_size - 1) for node_id in {row[0] for row in health}],
+                )
+
+    async def aflush(self) -> int:
+        """flush() on a worker thread, so large batches do not stall the event loop."""
+        return await asyncio.get_running_loop().run_in_executor(None, self.flush)
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        All stored nodes as {node_id: {status, metadata, params, last_success, last_error, error, ai_fix}}.
+        """
+        started = time.perf_counter()
+        with self._db_lock:
+            rows = self._db.execute(
+                "SELECT node_id, status, metadata, params, last_success, last_error, error, ai_fix FROM nodes"
+            ).fetchall()
+        nodes = {}
+        for node_id, status, metadata, params, last_success, last_error, error, ai_fix in rows:
+            nodes[node_id] = {
+                "status": status,
+                "metadata": json.loads(metadata),
+                "params": json.loads(params) if params else None,
+                "last_success": last_success,
+                "last_error": last_error,
+                "error": error,
+                "ai_fix": ai_fix,
+            }
+        self.metrics["loaded"] = len(nodes)
+        self.metrics["load_seconds"] = time.perf_counter() - started
+        return nodes
+
+    def health_history(self, node_id: str) -> List[Tuple[float, bool]]:
+        """Stored (timestamp, healthy) results for a node, oldest first."""
+        with self._db_lock:
+            rows = self._db.execute(
+                "SELECT ts, healthy FROM health WHERE node_id = ? ORDER BY ts", (node_id,)
+            ).fetchall()
+        return [(ts, bool(healthy)) for ts, healthy in rows]
+
+    def __len__(self) -> int:
+        with self._db_lock:
+            return self._db.execute("SELECT COUNT(*) FROM nodes").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            pending = len(self._pending) + len(self._health) + len(self._deleted)
+        return {**self.metrics, "pending": pending}
+
+    def close(self):
+        """Flush outstanding writes and close the database (also when the flush fails)."""
+        try:
+            self.flush()
+        finally:
+            with self._db_lock:
+                self._db.close()
@@ -0,0 +1,116 @@
+# apps/ai/pi_auto_connector/node_state.py
+
+import json
+from enum import Enum
+from typing import Dict, Any, Iterator, Optional
+
+
+class NodeStatus(str, Enum):
+    """Connection status of a node. Members are singletons and compare equal to their string values."""
+
+    CONNECTED = "connected"
+    RECOVERED = "recovered"
+    ERROR = "error"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+def _encode(metadata: Dict[str, Any]) -> bytes:
+    return json.dumps(metadata, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class MetadataStore:
+    """
+    Raw node metadata kept out of the hot node-state records: one compact JSON blob per
+    node, decoded only when something asks for it (AI prompts, reconnects, hooks).
+    """
+
+    __slots__ = ("_blobs",)
+
+    def __init__(self):
+        self._blobs: Dict[str, bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def get(self, node_id: str) -> Optional[Dict[str, Any]]:
+        blob = self._blobs.get(node_id)
+        return json.loads(blob) if blob is not None else None
+
+    def put(self, node_id: str, metadata: Dict[str, Any]) -> bool:
+        """Stores a node's metadata. Returns True if it differs from what was stored."""
+        blob = _encode(metadata)
+        if self._blobs.get(node_id) == blob:
+            return False
+        self._blobs[node_id] = blob
+        return True
+
+    def discard(self, node_id: str):
+        self._blobs.pop(node_id, None)
+
+    def nbytes(self) -> int:
+        """Total size of the stored metadata blobs."""
+        return sum(len(blob) for blob in self._blobs.values())
+
+
+class NodeState:
+    """
+    Compact per-node registry record. Only the fields the connector reads on hot paths
+    live on the record; `metadata` is fetched from the shared MetadataStore on access.
+    Supports info["status"] / info.get("status") for code written against the old dict records.
+    """
+
+    __slots__ = ("node_id", "status", "last_success", "last_error", "error", "ai_fix", "missed", "_store")
+
+    FIELDS = ("status", "metadata", "last_success", "last_error", "error", "ai_fix", "missed")
+
+    def __init__(
+        self,
+        node_id: str,
+        status: NodeStatus,
+        store: MetadataStore,
+        metadata: Optional[Dict[str, Any]] = None,
+        last_success: Optional[float] = None,
+        last_error: Optional[float] = None,
+        error: Optional[str] = None,
+        ai_fix: Optional[str] = None,
+    ):
+        self.node_id = node_id
+        self.status = NodeStatus(status)
+        self._store = store
+        self.last_success = last_success
+        self.last_error = last_error
+        self.error = error
+        self.ai_fix = ai_fix
+        self.missed = 0  # Consecutive discovery passes the node was absent from
+        if metadata is not None:
+            store.put(node_id, metadata)
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self._store.get(self.node_id) or {}
+
+    @metadata.setter
+    def metadata(self, metadata: Dict[str, Any]):
+        self._store.put(self.node_id, metadata)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self.FIELDS:
+            return default
+        value = getattr(self, key)
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.FIELDS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in self.FIELDS}
+
+    def __repr__(self) -> str:
+        return f"NodeState({self.node_id!r}, status={self.status.value!r})"
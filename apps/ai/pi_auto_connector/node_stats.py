@@ -0,0 +1,157 @@
+# apps/ai/pi_auto_connector/node_stats.py
+
+import heapq
+import math
+from collections import deque
+from typing import Deque, Dict, Any, List, Optional, Tuple
+
+
+class NodeStats:
+    """Latency and reliability of one node: EWMAs plus a sliding window of recent RTTs."""
+
+    __slots__ = ("rtt_ewma", "success_ewma", "window", "samples", "failures", "score", "ranked", "seq")
+
+    def __init__(self, window: int):
+        self.rtt_ewma: Optional[float] = None
+        self.success_ewma = 1.0
+        self.window: Deque[float] = deque(maxlen=window)
+        self.samples = 0
+        self.failures = 0
+        self.score = math.inf
+        self.ranked = False
+        self.seq = 0  # Sequence number of the node's live heap entry
+
+    def percentile(self, q: float) -> Optional[float]:
+        """q-th percentile (0-100) of the RTTs in the window, nearest-rank."""
+        if not self.window:
+            return None
+        ordered = sorted(self.window)
+        return ordered[min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))]
+
+
+class NodeRanking:
+    """
+    Per-node RTT / success-rate statistics and a ranking of the best nodes to route to.
+    - Every connect or health-check call feeds record(): RTTs and outcomes update
+      exponentially weighted averages (weight `alpha`) and a window of the last
+      `window` RTTs for percentiles.
+    - Ranked nodes are kept in a min-heap keyed by score with lazy invalidation: an update
+      pushes a new entry and leaves the old one in place, to be skipped as stale. Updates
+      are O(log N) instead of the O(N) shifting of a sorted list; best_nodes(n) walks the
+      top of the heap in O(n log n) plus the stale entries it meets, and the heap is
+      rebuilt once stale entries outnumber live ones. The score is the expected time to a
+      successful call: RTT plus `failure_penalty` for each expected failed attempt (lower
+      is better).
+    - A successful call ranks a node; exclude() takes it out of the ranking (e.g. while
+      it waits to reconnect) without dropping its history.
+    """
+
+    def __init__(self, alpha: float = 0.2, window: int = 100, failure_penalty: float = 1.0):
+        """
+        :param alpha: EWMA weight of the newest sample (0-1)
+        :param window: RTT samples kept per node for percentiles
+        :param failure_penalty: Seconds a failed call is assumed to cost (timeout + retry)
+        """
+        self.alpha = alpha
+        self.window = window
+        self.failure_penalty = failure_penalty
+        self._stats: Dict[str, NodeStats] = {}
+        self._heap: List[Tuple[float, str, int]] = []  # (score, node_id, seq), live and stale
+        self._ranked = 0
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return self._ranked
+
+    def __contains__(self, node_id: str) -> bool:
+        stats = self._stats.get(node_id)
+        return stats is not None and stats.ranked
+
+    def _is_live(self, entry: Tuple[float, str, int]) -> bool:
+        stats = self._stats.get(entry[1])
+        return stats is not None and stats.ranked and stats.seq == entry[2]
+
+    def _rank(self, node_id: str, stats: NodeStats):
+        self._seq += 1
+        stats.seq = self._seq
+        stats.ranked = True
+        self._ranked += 1
+        heapq.heappush(self._heap, (stats.score, node_id, stats.seq))
+
+    def _unrank(self, node_id: str, stats: NodeStats):
+        if stats.ranked:
+            stats.ranked = False
+            self._ranked -= 1
+            if len(self._heap) > 2 * self._ranked + 64:
+                self._heap = [entry for entry in self._heap if self._is_live(entry)]
+                heapq.heapify(self._heap)
+
+    def record(self, node_id: str, ok: bool, rtt: Optional[float] = None):
+        """
+        Records one call to a node.
+        :param ok: Whether the call succeeded
+        :param rtt: Round-trip time in seconds (successful calls only)
+        """
+        stats = self._stats.get(node_id)
+        if stats is None:
+            stats = self._stats[node_id] = NodeStats(self.window)
+        was_ranked = stats.ranked
+        self._unrank(node_id, stats)
+        stats.samples += 1
+        stats.success_ewma += self.alpha * ((1.0 if ok else 0.0) - stats.success_ewma)
+        if not ok:
+            stats.failures += 1
+        if rtt is not None:
+            stats.window.append(rtt)
+            stats.rtt_ewma = rtt if stats.rtt_ewma is None else stats.rtt_ewma + self.alpha * (rtt - stats.rtt_ewma)
+        if stats.rtt_ewma is not None and stats.success_ewma > 0:
+            success = stats.success_ewma
+            stats.score = stats.rtt_ewma + (1 - success) / success * self.failure_penalty
+        else:
+            stats.score = math.inf
+        if ok or was_ranked:
+            self._rank(node_id, stats)
+
+    def exclude(self, node_id: str):
+        """Takes a node out of the ranking until its next successful call."""
+        stats = self._stats.get(node_id)
+        if stats is not None:
+            self._unrank(node_id, stats)
+
+    def remove(self, node_id: str):
+        """Forgets a node entirely."""
+        stats = self._stats.pop(node_id, None)
+        if stats is not None:
+            self._unrank(node_id, stats)
+
+    def best_nodes(self, n: int = 1) -> List[str]:
+        """The `n` ranked nodes with the lowest score (fastest, most reliable first)."""
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+        best: List[str] = []
+        frontier = [(self._heap[0], 0)] if self._heap else []
+        while frontier and len(best) < n:
+            entry, index = heapq.heappop(frontier)
+            if self._is_live(entry):
+                best.append(entry[1])
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(self._heap):
+                    heapq.heappush(frontier, (self._heap[child], child))
+        return best
+
+    def get(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Statistics snapshot for one node, or None if it has no samples."""
+        stats = self._stats.get(node_id)
+        if stats is None:
+            return None
+        return {
+            "rtt_ewma": stats.rtt_ewma,
+            "success_rate": stats.success_ewma,
+            "p50": stats.percentile(50),
+            "p95": stats.percentile(95),
+            "p99": stats.percentile(99),
+            "samples": stats.samples,
+            "failures": stats.failures,
+            "score": stats.score,
+            "ranked": stats.ranked,
+        }
@@ -0,0 +1,146 @@
+# apps/ai/pi_auto_connector/params_cache.py
+
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+logger = logging.getLogger("ParamsCache")
+
+# Node attributes that change between discovery passes without changing how to connect.
+VOLATILE_FIELDS = frozenset(
+    ("last_seen", "timestamp", "updated_at", "latency", "rtt", "uptime", "load", "status", "peers")
+)
+
+
+def node_fingerprint(node: Dict[str, Any], fields: Optional[Iterable[str]] = None) -> str:
+    """
+    Stable hash of the node attributes that matter for its connection parameters.
+    :param fields: Attributes to include (default: everything except VOLATILE_FIELDS)
+    """
+    if fields is not None:
+        relevant = {k: node.get(k) for k in sorted(fields)}
+    else:
+        relevant = {k: v for k, v in node.items() if k not in VOLATILE_FIELDS}
+    encoded = json.dumps(relevant, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ConnectionParamsCache:
+    """
+    LRU + TTL cache of AI-generated connection parameters, keyed by node fingerprint.
+    - Entries expire after `ttl` seconds and the least recently used entries are evicted past `max_entries`.
+    - With `path`, entries are loaded on start and written back by save() (JSON, atomic replace).
+    - Callers invalidate an entry when a connection using its parameters fails.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 3600.0,
+        max_entries: int = 10000,
+        path: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+    ):
+        """
+        :param ttl: Seconds a cached parameter set stays valid
+        :param max_entries: Max fingerprints kept (least recently used are evicted first)
+        :param path: Optional JSON file for persisting the cache across restarts
+        :param fields: Node attributes hashed into the fingerprint (default: all non-volatile ones)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.path = path
+        self.fields = tuple(fields) if fields is not None else None
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()  # key: (expires_at, params)
+        self.metrics = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0, "invalidations": 0}
+        if path:
+            self.load()
+
+    def fingerprint(self, node: Dict[str, Any]) -> str:
+        return node_fingerprint(node, self.fields)
+
+    def get(self, node: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        key = self.fingerprint(node)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.metrics["misses"] += 1
+            return None
+        expires_at, params = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.metrics["expired"] += 1
+            self.metrics["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.metrics["hits"] += 1
+        return dict(params)
+
+    def put(self, node: Dict[str, Any], params: Dict[str, Any]):
+        key = self.fingerprint(node)
+        self._entries[key] = (time.time() + self.ttl, dict(params))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.metrics["evictions"] += 1
+
+    def invalidate(self, node: Dict[str, Any]) -> bool:
+        """Drop the cached parameters for a node (e.g. after they failed to connect)."""
+        if self._entries.pop(self.fingerprint(node), None) is None:
+            return False
+        self.metrics["invalidations"] += 1
+        return True
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.metrics["hits"] + self.metrics["misses"]
+        return {
+            **self.metrics,
+            "entries": len(self._entries),
+            "hit_ratio": self.metrics["hits"] / lookups if lookups else 0.0,
+        }
+
+    # --- Persistence ---
+    def load(self):
+        """Load unexpired entries from `path` (a missing, unreadable or malformed file starts empty)."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable params cache {self.path}: {e}")
+            return
+        try:
+            entries = []
+            for key, expires_at, params in data["entries"]:
+                if not isinstance(key, str) or not isinstance(params, dict):
+                    raise TypeError(f"bad entry for {key!r}")
+                entries.append((key, float(expires_at), params))
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring malformed params cache {self.path}: {e!r}")
+            return
+        now = time.time()
+        entries.sort(key=lambda entry: entry[1])
+        for key, expires_at, params in entries[-self.max_entries:]:
+            if expires_at > now:
+                self._entries[key] = (expires_at, params)
+        logger.info(f"Loaded {len(self._entries)} cached connection param sets from {self.path}")
+
+    def save(self):
+        """Write the cache to `path` atomically."""
+        if not self.path:
+            return
+        now = time.time()
+        entries = [[key, expires_at, params] for key, (expires_at, params) in self._entries.items() if expires_at > now]
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "entries": entries}, f)
+        os.replace(tmp_path, self.path)
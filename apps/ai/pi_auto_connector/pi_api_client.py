@@ -9,13 +9,58 @@ class AsyncPiClient:
     Async Pi Network API Client
     - Handles node discovery, connection, health checks, and reconnection.
     - Designed for use in ultra high-tech, AI-driven automation systems.
+    - Owns one pooled httpx.AsyncClient shared by all calls; close it with aclose()
+      or use the client as an async context manager.
     """
 
-    def __init__(self, api_base: str, api_key: str, timeout: int = 10):
+    def __init__(
+        self,
+        api_base: str,
+        api_key: str,
+        timeout: int = 10,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+    ):
+        """
+        :param max_connections: Max connections open at once (further requests wait for a free one)
+        :param max_keepalive_connections: Max idle connections kept for reuse
+        :param keepalive_expiry: Seconds an idle connection is kept alive
+        """
         self.api_base = api_base.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
         self.headers = {"Authorization": f"Bearer {self.api_key}"}
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared pooled client, created on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.api_base,
+                headers=self.headers,
+                timeout=self.timeout,
+                limits=self.limits,
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close the pooled client and its connections. The next call opens a fresh pool."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    async def __aenter__(self) -> "AsyncPiClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
 
     async def discover_nodes(self, strategy: str = "default") -> List[Dict[str, Any]]:
         """
@@ -23,13 +68,11 @@ class AsyncPiClient:
         :param strategy: Discovery strategy (AI-suggested or default)
         :return: List of node dicts
         """
-        url = f"{self.api_base}/nodes"
         params = {"strategy": strategy}
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.get(url, headers=self.headers, params=params)
-            resp.raise_for_status()
-            data = resp.json()
-            return data.get("nodes", [])
+        resp = await self.client.get("/nodes", params=params)
+        resp.raise_for_status()
+        data = resp.json()
+        return data.get("nodes", [])
 
     async def connect_node(self, node_id: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -38,11 +81,9 @@ class AsyncPiClient:
         :param params: Connection parameters (AI-generated)
         :return: Connection result dict
         """
-        url = f"{self.api_base}/nodes/{node_id}/connect"
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.post(url, headers=self.headers, json=params)
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self.client.post(f"/nodes/{node_id}/connect", json=params)
+        resp.raise_for_status()
+        return resp.json()
 
     async def check_node_health(self, node_id: str) -> bool:
         """
@@ -50,13 +91,11 @@ class AsyncPiClient:
         :param node_id: Node identifier
         :return: True if healthy, False otherwise
         """
-        url = f"{self.api_base}/nodes/{node_id}/health"
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                resp = await client.get(url, headers=self.headers)
-                resp.raise_for_status()
-                data = resp.json()
-                return data.get("status", "unhealthy") == "healthy"
+            resp = await self.client.get(f"/nodes/{node_id}/health")
+            resp.raise_for_status()
+            data = resp.json()
+            return data.get("status", "unhealthy") == "healthy"
         except Exception as e:
             # Log or handle as needed
             return False
@@ -68,17 +107,13 @@ class AsyncPiClient:
         :param fix_params: AI-suggested fix parameters
         :return: Result dict
         """
-        url = f"{self.api_base}/nodes/{node_id}/reconnect"
         payload = fix_params or {}
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.post(url, headers=self.headers, json=payload)
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self.client.post(f"/nodes/{node_id}/reconnect", json=payload)
+        resp.raise_for_status()
+        return resp.json()
 
     # Optional: Additional Pi Network API calls (wallets, transactions, etc.)
     async def get_node_info(self, node_id: str) -> Dict[str, Any]:
-        url = f"{self.api_base}/nodes/{node_id}/info"
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            resp = await client.get(url, headers=self.headers)
-            resp.raise_for_status()
-            return resp.json()
+        resp = await self.client.get(f"/nodes/{node_id}/info")
+        resp.raise_for_status()
+        return resp.json()
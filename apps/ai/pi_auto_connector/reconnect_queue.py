@@ -0,0 +1,182 @@
+# apps/ai/pi_auto_connector/reconnect_queue.py
+
+import asyncio
+import heapq
+import logging
+import random
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Set, Tuple
+
+logger = logging.getLogger("ReconnectQueue")
+
+
+class ReconnectQueue:
+    """
+    Priority queue of failed nodes waiting to be reconnected.
+    - Each failure pushes the node's next-eligible time out exponentially
+      (base_delay * factor ** (attempts - 1), capped at max_delay) with jitter, so a fleet
+      that failed together does not retry together.
+    - Nodes whose time has come are reconnected highest priority first (e.g. by traffic),
+      at most `max_concurrency` at a time.
+    - A node is queued at most once; scheduling a node that is already waiting, or whose
+      reconnect is in flight, is a no-op. A failed attempt re-queues the node itself.
+    """
+
+    def __init__(
+        self,
+        base_delay: float = 1.0,
+        max_delay: float = 300.0,
+        factor: float = 2.0,
+        jitter: float = 0.5,
+        max_concurrency: int = 8,
+    ):
+        """
+        :param base_delay: Delay before the first retry, in seconds
+        :param max_delay: Upper bound on the delay between retries
+        :param factor: Backoff multiplier per consecutive failure
+        :param jitter: Fraction of each delay that is randomized (0 = fixed, 1 = full jitter)
+        :param max_concurrency: Max reconnects in flight at once
+        """
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.factor = factor
+        self.jitter = jitter
+        self.max_concurrency = max_concurrency
+        self.metrics = {"scheduled": 0, "attempts": 0, "recovered": 0, "failed": 0, "in_flight": 0}
+        self._attempts: Dict[str, int] = {}  # Consecutive failures per node
+        self._waiting: Dict[str, Tuple[float, float]] = {}  # node_id: (eligible_at, priority)
+        self._delayed: List[Tuple[float, str]] = []  # (eligible_at, node_id)
+        self._ready: List[Tuple[float, float, str]] = []  # (-priority, eligible_at, node_id)
+        self._in_flight: Set[str] = set()  # Popped nodes whose reconnect has not finished
+        self._wakeup = asyncio.Event()
+        self._running = False
+
+    def __len__(self) -> int:
+        return len(self._waiting)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._waiting or node_id in self._in_flight
+
+    def _now(self) -> float:
+        return asyncio.get_event_loop().time()
+
+    def backoff(self, attempts: int) -> float:
+        """Jittered delay before retry number `attempts` (1-based)."""
+        delay = min(self.max_delay, self.base_delay * self.factor ** (attempts - 1))
+        return delay * (1 - self.jitter * random.random())
+
+    def schedule(self, node_id: str, priority: float = 0.0) -> Optional[float]:
+        """
+        Queues a failed node for reconnection after its backoff delay. Returns the delay,
+        or None if the node was already waiting or being reconnected.
+        :param priority: Higher values are reconnected first among eligible nodes
+        """
+        if node_id in self:
+            return None
+        attempts = self._attempts.get(node_id, 0) + 1
+        self._attempts[node_id] = attempts
+        delay = self.backoff(attempts)
+        eligible_at = self._now() + delay
+        self._waiting[node_id] = (eligible_at, priority)
+        if not self._delayed or eligible_at < self._delayed[0][0]:
+            self._wakeup.set()  # New earliest deadline
+        heapq.heappush(self._delayed, (eligible_at, node_id))
+        self.metrics["scheduled"] += 1
+        return delay
+
+    def reset(self, node_id: str):
+        """Forgets a node's failure history (after it connected by any route)."""
+        self._attempts.pop(node_id, None)
+
+    def remove(self, node_id: str):
+        """
+        Drops a node from the queue and its failure history (stale heap entries are skipped).
+        An in-flight reconnect of the node is not re-queued if it fails.
+        """
+        self._waiting.pop(node_id, None)
+        self._in_flight.discard(node_id)
+        self._attempts.pop(node_id, None)
+
+    def attempts(self, node_id: str) -> int:
+        return self._attempts.get(node_id, 0)
+
+    def _promote(self):
+        """Moves nodes whose eligible time has passed from the delay heap to the priority heap."""
+        now = self._now()
+        while self._delayed and self._delayed[0][0] <= now:
+            eligible_at, node_id = heapq.heappop(self._delayed)
+            entry = self._waiting.get(node_id)
+            if entry is not None and entry[0] == eligible_at:
+                heapq.heappush(self._ready, (-entry[1], eligible_at, node_id))
+
+    def _pop_ready(self) -> Optional[Tuple[str, float]]:
+        """Highest-priority eligible (node_id, priority), or None. The node is in flight until its attempt ends."""
+        while self._ready:
+            _, eligible_at, node_id = heapq.heappop(self._ready)
+            entry = self._waiting.get(node_id)
+            if entry is not None and entry[0] == eligible_at:
+                del self._waiting[node_id]
+                self._in_flight.add(node_id)
+                return node_id, entry[1]
+        return None
+
+    async def _attempt(self, node_id: str, priority: float, reconnect: Callable[[str], Awaitable[bool]]):
+        self.metrics["attempts"] += 1
+        self.metrics["in_flight"] += 1
+        try:
+            ok = bool(await reconnect(node_id))
+        except Exception as e:
+            logger.error(f"Reconnect of node {node_id} failed: {e}")
+            ok = False
+        finally:
+            self.metrics["in_flight"] -= 1
+            removed = node_id not in self._in_flight  # remove()d while the reconnect was running
+            self._in_flight.discard(node_id)
+        if removed:
+            return
+        if ok:
+            self.metrics["recovered"] += 1
+            self.reset(node_id)
+        else:
+            self.metrics["failed"] += 1
+            self.schedule(node_id, priority)
+
+    async def run(self, reconnect: Callable[[str], Awaitable[bool]]):
+        """
+        Reconnects nodes as they become eligible until stop() is called.
+        :param reconnect: Coroutine function returning True when the node is back
+        """
+        self._running = True
+        slots = asyncio.Semaphore(self.max_concurrency)
+        tasks = set()
+        try:
+            while self._running:
+                self._promote()
+                while self._ready:
+                    await slots.acquire()
+                    self._promote()  # Higher-priority nodes may have become eligible meanwhile
+                    item = self._pop_ready()
+                    if item is None:
+                        slots.release()
+                        break
+                    node_id, priority = item
+                    task = asyncio.ensure_future(self._attempt(node_id, priority, reconnect))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                    task.add_done_callback(lambda _: slots.release())
+                timeout = max(0.0, self._delayed[0][0] - self._now()) if self._delayed else None
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop(self):
+        self._running = False
+        self._wakeup.set()
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.metrics, "waiting": len(self._waiting), "backing_off": len(self._attempts)}
@@ -0,0 +1,446 @@
+"""
+GlobalConnect SDK load tests.
+
+Starts the stub partner API (stub_server.py) in a separate process and drives the
+sync client, the async client, the EventBatcher bulk pipeline and the webhook
+receiver at increasing concurrency.
+Each scenario reports requests/sec, latency percentiles and memory; the full run
+is written as JSON so results can be compared between SDK versions.
+
+Usage:
+    python run_benchmarks.py --concurrency 1,8,32,128 --duration 5 --output results.json
+    python run_benchmarks.py --latency 0.01 --error-rate 0.02 --targets sync,async
+    python run_benchmarks.py --compare baseline.json --max-regression 10
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import stub_server  # noqa: E402
+from globalconnect import AsyncGlobalConnect, GlobalConnect, GlobalConnectError, WebhookReceiver  # noqa: E402
+
+SYNC_OPS: Dict[str, Callable[[GlobalConnect], Any]] = {
+    "status": lambda gc: gc.get_status(),
+    "event": lambda gc: gc.trigger_event("bench", {"value": 1}),
+    "register": lambda gc: gc.register_webhook(["bench"], "http://127.0.0.1/hook"),
+}
+ASYNC_OPS: Dict[str, Callable[[AsyncGlobalConnect], Any]] = {
+    "status": lambda gc: gc.get_status(),
+    "event": lambda gc: gc.trigger_event("bench", {"value": 1}),
+    "register": lambda gc: gc.register_webhook(["bench"], "http://127.0.0.1/hook"),
+}
+
+
+# --------- Measurement helpers ---------
+def rss_kb() -> int:
+    """Current resident set size (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    latencies.sort()
+    count = len(latencies)
+
+    def pct(q: float) -> float:
+        return round(latencies[min(count - 1, int(q * count))] * 1000, 3) if count else 0.0
+
+    return {
+        "requests": count,
+        "errors": errors,
+        "error_rate": round(errors / count, 4) if count else 0.0,
+        "elapsed": round(elapsed, 3),
+        "rps": round(count / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(sum(latencies) / count * 1000, 3) if count else 0.0,
+            "p50": pct(0.50),
+            "p90": pct(0.90),
+            "p95": pct(0.95),
+            "p99": pct(0.99),
+            "max": round(latencies[-1] * 1000, 3) if count else 0.0,
+        },
+    }
+
+
+class MemoryProbe:
+    """RSS delta for a scenario, plus Python heap peak when tracemalloc is enabled."""
+
+    def __init__(self, trace: bool):
+        self.trace = trace
+
+    def __enter__(self) -> "MemoryProbe":
+        self.result: Dict[str, Any] = {}
+        self.rss_before = rss_kb()
+        if self.trace:
+            tracemalloc.start()
+        return self
+
+    def __exit__(self, *exc):
+        if self.trace:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.result["heap_peak_kb"] = peak // 1024
+        rss_after = rss_kb()
+        self.result.update({"rss_kb": rss_after, "rss_delta_kb": rss_after - self.rss_before})
+
+
+# --------- Scenarios ---------
+def run_sync(base: str, op: str, concurrency: int, duration: float, args) -> Dict[str, Any]:
+    call = SYNC_OPS[op]
+    gc = GlobalConnect(
+        api_key="bench",
+        api_base=base,
+        max_retries=args.max_retries,
+        backoff_factor=args.backoff,
+        pool_maxsize=concurrency,
+        coalesce=False,
+        http2=args.http2,
+    )
+    per_thread: List[List[float]] = [[] for _ in range(concurrency)]
+    errors = [0] * concurrency
+
+    def worker(index: int, deadline: float, record: bool):
+        latencies = per_thread[index]
+        while True:
+            started = time.perf_counter()
+            if started >= deadline:
+                return
+            try:
+                call(gc)
+            except GlobalConnectError:
+                errors[index] += record
+            if record:
+                latencies.append(time.perf_counter() - started)
+
+    with gc, ThreadPoolExecutor(max_workers=concurrency) as pool:
+        warmup = time.perf_counter() + args.warmup
+        list(pool.map(lambda i: worker(i, warmup, False), range(concurrency)))
+        with MemoryProbe(args.trace_memory) as memory:
+            started = time.perf_counter()
+            deadline = started + duration
+            list(pool.map(lambda i: worker(i, deadline, True), range(concurrency)))
+            elapsed = time.perf_counter() - started
+        connections = gc.connection_stats()
+    latencies = [x for chunk in per_thread for x in chunk]
+    return {**summarize(latencies, sum(errors), elapsed), "memory": memory.result, "connections": connections}
+
+
+def run_batcher(base: str, concurrency: int, duration: float, args) -> Dict[str, Any]:
+    """`concurrency` threads submit events into one EventBatcher; latency is submit-to-result per event."""
+    gc = GlobalConnect(
+        api_key="bench",
+        api_base=base,
+        max_retries=args.max_retries,
+        backoff_factor=args.backoff,
+        coalesce=False,
+        http2=args.http2,
+    )
+    latencies: List[float] = []
+    errors = [0]
+
+    def done(started: float, record: bool, future):
+        if not record:
+            return
+        latencies.append(time.perf_counter() - started)
+        if future.exception() is not None:
+            errors[0] += 1
+
+    def producer(batcher, deadline: float, record: bool):
+        while True:
+            started = time.perf_counter()
+            if started >= deadline:
+                return
+            future = batcher.submit("bench", {"value": 1})
+            future.add_done_callback(lambda f, started=started: done(started, record, f))
+
+    batcher = gc.event_batcher(
+        max_batch_size=args.batch_size,
+        flush_interval=args.batch_interval,
+        max_buffer=args.batch_size * 4,
+        compress=not args.no_compress,
+        flush_on_exit=False,
+    )
+    with gc, batcher, ThreadPoolExecutor(max_workers=concurrency) as pool:
+        warmup = time.perf_counter() + args.warmup
+        list(pool.map(lambda i: producer(batcher, warmup, False), range(concurrency)))
+        batcher.flush()
+        with MemoryProbe(args.trace_memory) as memory:
+            started = time.perf_counter()
+            deadline = started + duration
+            list(pool.map(lambda i: producer(batcher, deadline, True), range(concurrency)))
+            batcher.flush()
+            elapsed = time.perf_counter() - started
+        batches = dict(batcher.stats)
+    return {**summarize(latencies, errors[0], elapsed), "memory": memory.result, "batches": batches}
+
+
+def run_async(base: str, op: str, concurrency: int, duration: float, args) -> Dict[str, Any]:
+    call = ASYNC_OPS[op]
+
+    async def main():
+        latencies: List[float] = []
+        errors = 0
+
+        async def worker(deadline: float, record: bool):
+            nonlocal errors
+            while True:
+                started = time.perf_counter()
+                if started >= deadline:
+                    return
+                try:
+                    await call(gc)
+                except GlobalConnectError:
+                    errors += record
+                if record:
+                    latencies.append(time.perf_counter() - started)
+
+        async with AsyncGlobalConnect(
+            api_key="bench",
+            api_base=base,
+            max_retries=args.max_retries,
+            backoff_factor=args.backoff,
+            max_concurrency=concurrency,
+            coalesce=False,
+            http2=args.http2,
+        ) as gc:
+            warmup = time.perf_counter() + args.warmup
+            await asyncio.gather(*[worker(warmup, False) for _ in range(concurrency)])
+            with MemoryProbe(args.trace_memory) as memory:
+                started = time.perf_counter()
+                deadline = started + duration
+                await asyncio.gather(*[worker(deadline, True) for _ in range(concurrency)])
+                elapsed = time.perf_counter() - started
+        return {**summarize(latencies, errors, elapsed), "memory": memory.result}
+
+    return asyncio.run(main())
+
+
+def _serve_receiver(port: int, handler_delay: float, ready, stop, conn):
+    """Child process: run a WebhookReceiver until `stop` is set, then report its metrics."""
+
+    async def handler(payload: Dict):
+        if handler_delay:
+            await asyncio.sleep(handler_delay)
+
+    async def main():
+        receiver = WebhookReceiver(handler, secret="bench-secret", concurrency=64)
+        await receiver.start("127.0.0.1", port)
+        ready.set()
+        await asyncio.get_running_loop().run_in_executor(None, stop.wait)
+        await receiver.stop()
+        conn.send({"metrics": dict(receiver.metrics), "rss_kb": rss_kb()})
+
+    asyncio.run(main())
+
+
+def run_webhook(port: int, concurrency: int, duration: float, args) -> Dict[str, Any]:
+    import aiohttp
+
+    ready, stop = multiprocessing.Event(), multiprocessing.Event()
+    parent_conn, child_conn = multiprocessing.Pipe()
+    process = multiprocessing.Process(
+        target=_serve_receiver, args=(port, args.handler_delay, ready, stop, child_conn), daemon=True
+    )
+    process.start()
+    if not ready.wait(10):
+        process.terminate()
+        raise RuntimeError("webhook receiver did not start")
+    url = f"http://127.0.0.1:{port}/webhook"
+    body = json.dumps({"event": "bench", "data": {"value": 1}}).encode()
+
+    async def main():
+        latencies: List[float] = []
+        errors = 0
+
+        async def worker(session: aiohttp.ClientSession, deadline: float, record: bool):
+            nonlocal errors
+            while True:
+                started = time.perf_counter()
+                if started >= deadline:
+                    return
+                headers = {"X-GC-Secret": "bench-secret", "Idempotency-Key": uuid.uuid4().hex}
+                try:
+                    async with session.post(url, data=body, headers=headers) as resp:
+                        await resp.read()
+                        failed = resp.status >= 400
+                except aiohttp.ClientError:
+                    failed = True
+                if record:
+                    errors += failed
+                    latencies.append(time.perf_counter() - started)
+
+        connector = aiohttp.TCPConnector(limit=concurrency)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            warmup = time.perf_counter() + args.warmup
+            await asyncio.gather(*[worker(session, warmup, False) for _ in range(concurrency)])
+            started = time.perf_counter()
+            deadline = started + duration
+            await asyncio.gather(*[worker(session, deadline, True) for _ in range(concurrency)])
+            elapsed = time.perf_counter() - started
+        return summarize(latencies, errors, elapsed)
+
+    try:
+        result = asyncio.run(main())
+    finally:
+        stop.set()
+        report = parent_conn.recv() if parent_conn.poll(30) else {}
+        process.join(5)
+    result["memory"] = {"receiver_rss_kb": report.get("rss_kb")}
+    result["receiver"] = report.get("metrics", {})
+    return result
+
+
+# --------- Orchestration ---------
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL, text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: List[Dict], baseline_path: str, max_regression: Optional[float]) -> bool:
+    """Print rps / p99 deltas against a previous results file; False if rps regressed past the limit."""
+    with open(baseline_path) as f:
+        baseline = {
+            (r["target"], r["op"], r["concurrency"]): r for r in json.load(f)["results"]
+        }
+    ok = True
+    print(f"\nCompared with {baseline_path}:")
+    for r in results:
+        old = baseline.get((r["target"], r["op"], r["concurrency"]))
+        if old is None or not old["rps"]:
+            continue
+        rps_change = (r["rps"] - old["rps"]) / old["rps"] * 100
+        p99_change = r["latency_ms"]["p99"] - old["latency_ms"]["p99"]
+        flag = ""
+        if max_regression is not None and rps_change < -max_regression:
+            ok, flag = False, "  REGRESSION"
+        print(
+            f"  {r['target']:<8}{r['op']:<10}c={r['concurrency']:<5}"
+            f"rps {old['rps']:>9.1f} -> {r['rps']:>9.1f} ({rps_change:+.1f}%)  p99 {p99_change:+.2f}ms{flag}"
+        )
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="GlobalConnect SDK load tests against a local stub")
+    parser.add_argument(
+        "--targets", default="sync,async,batcher,webhook", help="comma list of sync, async, batcher, webhook"
+    )
+    parser.add_argument("--ops", default="status,event,register", help="client calls: status, event, register")
+    parser.add_argument("--concurrency", default="1,8,32,128", help="comma list of concurrency levels")
+    parser.add_argument("--duration", type=float, default=5.0, help="measured seconds per scenario")
+    parser.add_argument("--warmup", type=float, default=1.0, help="unmeasured seconds before each scenario")
+    parser.add_argument("--latency", type=float, default=0.0, help="stub base latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="stub random extra latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of stub responses that fail")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--max-retries", type=int, default=3)
+    parser.add_argument("--backoff", type=float, default=0.01, help="client backoff_factor")
+    parser.add_argument("--http2", action="store_true", help="use the clients' HTTP/2 transport (httpx[http2])")
+    parser.add_argument("--batch-size", type=int, default=500, help="EventBatcher max_batch_size")
+    parser.add_argument("--batch-interval", type=float, default=0.05, help="EventBatcher flush_interval in seconds")
+    parser.add_argument("--no-compress", action="store_true", help="send EventBatcher batches uncompressed")
+    parser.add_argument("--handler-delay", type=float, default=0.0, help="webhook handler time in seconds")
+    parser.add_argument("--trace-memory", action="store_true", help="also record Python heap peaks (slower)")
+    parser.add_argument("--port", type=int, default=8099, help="stub port (receiver uses port + 1)")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--compare", help="previous results file to diff against")
+    parser.add_argument("--max-regression", type=float, help="fail when rps drops by more than this percent")
+    args = parser.parse_args()
+
+    targets = [t.strip() for t in args.targets.split(",") if t.strip()]
+    ops = [o.strip() for o in args.ops.split(",") if o.strip()]
+    levels = [int(c) for c in args.concurrency.split(",")]
+    base = f"http://127.0.0.1:{args.port}"
+    if args.http2:
+        print(
+            "note: the stub serves plain-http HTTP/1.1, so --http2 measures the httpx transport "
+            "without HTTP/2 multiplexing (see README)",
+            file=sys.stderr,
+        )
+
+    ready, stop = multiprocessing.Event(), multiprocessing.Event()
+    stub = multiprocessing.Process(
+        target=stub_server.serve,
+        kwargs=dict(
+            port=args.port, ready=ready, stop=stop, latency=args.latency, jitter=args.jitter,
+            error_rate=args.error_rate, error_status=args.error_status,
+        ),
+        daemon=True,
+    )
+    stub.start()
+    if not ready.wait(10):
+        stub.terminate()
+        print("Stub server did not start", file=sys.stderr)
+        return 1
+
+    results: List[Dict[str, Any]] = []
+    try:
+        for target in targets:
+            for op in {"webhook": ["deliver"], "batcher": ["batch"]}.get(target, ops):
+                for concurrency in levels:
+                    if target == "sync":
+                        result = run_sync(base, op, concurrency, args.duration, args)
+                    elif target == "async":
+                        result = run_async(base, op, concurrency, args.duration, args)
+                    elif target == "batcher":
+                        result = run_batcher(base, concurrency, args.duration, args)
+                    elif target == "webhook":
+                        result = run_webhook(args.port + 1, concurrency, args.duration, args)
+                    else:
+                        raise SystemExit(f"Unknown target: {target}")
+                    result = {"target": target, "op": op, "concurrency": concurrency, **result}
+                    results.append(result)
+                    print(
+                        f"{target:<8}{op:<10}c={concurrency:<5}{result['rps']:>9.1f} rps  "
+                        f"p50 {result['latency_ms']['p50']:.2f}ms  p99 {result['latency_ms']['p99']:.2f}ms  "
+                        f"errors {result['errors']}"
+                    )
+    finally:
+        stop.set()
+        stub.join(5)
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "config": {k: v for k, v in vars(args).items() if k not in ("output", "compare", "max_regression")},
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {len(results)} results to {args.output}")
+
+    if args.compare and not compare(results, args.compare, args.max_regression):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""
+Local stub of the GlobalConnect partner API for load tests.
+
+Serves /partners/*, /events/*, /batches/events and /webhooks/register
+with configurable latency, jitter and error injection.
+
+Usage:
+    python stub_server.py --port 8099 --latency 0.005 --jitter 0.002 --error-rate 0.01
+"""
+
+import argparse
+import asyncio
+import json
+import random
+
+from aiohttp import web
+
+
+class StubConfig:
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        retry_after: str = "0",
+        payload_bytes: int = 256
+    ):
+        """
+        :param latency: Base delay added to every response, in seconds
+        :param jitter: Extra uniformly random delay (0..jitter), in seconds
+        :param error_rate: Fraction of requests answered with error_status
+        :param error_status: Status code used for injected errors
+        :param retry_after: Retry-After header sent with injected 429/503 errors
+        :param payload_bytes: Approximate size of GET response bodies
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.payload_bytes = payload_bytes
+
+
+def make_app(config: StubConfig) -> web.Application:
+    stats = {"requests": 0, "errors_injected": 0}
+    filler = "x" * max(0, config.payload_bytes - 64)
+
+    async def delay_or_fail():
+        stats["requests"] += 1
+        delay = config.latency + (random.uniform(0, config.jitter) if config.jitter else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if config.error_rate and random.random() < config.error_rate:
+            stats["errors_injected"] += 1
+            headers = {"Retry-After": config.retry_after} if config.error_status in (429, 503) else None
+            return web.json_response({"error": "injected"}, status=config.error_status, headers=headers)
+        return None
+
+    async def partners(request: web.Request) -> web.Response:
+        return await delay_or_fail() or web.json_response(
+            {"resource": request.match_info["resource"], "status": "ok", "data": filler}
+        )
+
+    async def event(request: web.Request) -> web.Response:
+        body = await request.read()
+        failure = await delay_or_fail()
+        if failure is not None:
+            return failure
+        return web.json_response({"accepted": True, "event": request.match_info["name"]})
+
+    async def event_batch(request: web.Request) -> web.Response:
+        body = await request.read()  # aiohttp has already undone Content-Encoding: gzip
+        failure = await delay_or_fail()
+        if failure is not None:
+            return failure
+        events = json.loads(body).get("events", [])
+        return web.json_response({"results": [{"accepted": True} for _ in events]})
+
+    async def register_webhook(request: web.Request) -> web.Response:
+        payload = await request.json()
+        return await delay_or_fail() or web.json_response({"registered": payload.get("events", [])})
+
+    async def stub_stats(request: web.Request) -> web.Response:
+        return web.json_response(stats)
+
+    app = web.Application()
+    app.router.add_get("/partners/{resource}", partners)
+    app.router.add_post("/events/{name}", event)
+    app.router.add_post("/batches/events", event_batch)
+    app.router.add_post("/webhooks/register", register_webhook)
+    app.router.add_get("/_stub/stats", stub_stats)
+    app["stats"] = stats
+    return app
+
+
+def serve(host: str = "127.0.0.1", port: int = 8099, ready=None, stop=None, **config):
+    """Run the stub until `stop` (a multiprocessing.Event) is set, or forever."""
+
+    async def main():
+        runner = web.AppRunner(make_app(StubConfig(**config)), access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, host, port, backlog=4096).start()
+        if ready is not None:
+            ready.set()
+        try:
+            if stop is None:
+                await asyncio.Event().wait()
+            else:
+                await asyncio.get_running_loop().run_in_executor(None, stop.wait)
+        finally:
+            await runner.cleanup()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub GlobalConnect partner API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--latency", type=float, default=0.0, help="base response delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random delay in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests that fail")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--payload-bytes", type=int, default=256)
+    args = parser.parse_args()
+    print(f"Stub partner API on http://{args.host}:{args.port}")
+    serve(
+        args.host,
+        args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        payload_bytes=args.payload_bytes,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,1234 @@
 # sdk/python/globalconnect.py
 
 import os
-import requests
+import atexit
+import bisect
+import copy
+import hashlib
+import importlib
+import json as jsonlib
 import logging
+import threading
 import time
-from typing import Any, Dict, List, Optional, Callable, Union
+from collections import OrderedDict, deque
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Callable, Tuple, Union
 
-try:
-    import aiohttp
-except ImportError:
-    aiohttp = None  # Async support is optional
 
-# Configure logging
+class _LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access, so that
+    `import globalconnect` stays cheap for short-lived processes.
+    Attributes are cached on the proxy after the first lookup.
+    """
+
+    def __init__(self, name: str, install_hint: Optional[str] = None):
+        self.__dict__["_name"] = name
+        self.__dict__["_install_hint"] = install_hint
+        self.__dict__["_module"] = None
+
+    def _load(self):
+        module = self._module
+        if module is None:
+            try:
+                module = importlib.import_module(self._name)
+            except ImportError:
+                if self._install_hint is None:
+                    raise
+                raise ImportError(self._install_hint)
+            self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        value = getattr(self._load(), attr)
+        self.__dict__[attr] = value
+        return value
+
+
+asyncio = _LazyModule("asyncio")
+futures = _LazyModule("concurrent.futures")
+requests = _LazyModule("requests", "requests is required for the sync client: pip install requests")
+aiohttp = _LazyModule("aiohttp", "aiohttp is required for async support: pip install aiohttp")  # Optional
+aiohttp_web = _LazyModule("aiohttp.web", "aiohttp is required for the webhook receiver: pip install aiohttp")
+httpx = _LazyModule("httpx", "httpx is required for HTTP/2 support: pip install 'httpx[http2]'")  # Optional
+
 logger = logging.getLogger("GlobalConnect")
-if not logger.handlers:
-    handler = logging.StreamHandler()
-    handler.setFormatter(logging.Formatter("[%(asctime)s] %(levelname)s:%(name)s: %(message)s"))
-    logger.addHandler(handler)
-logger.setLevel(logging.INFO)
+logger.addHandler(logging.NullHandler())
+_logging_configured = False
+
+
+def _configure_logging():
+    """Install the SDK's stderr log handler; runs once, when the first client is created."""
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+    if not any(not isinstance(h, logging.NullHandler) for h in logger.handlers):
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("[%(asctime)s] %(levelname)s:%(name)s: %(message)s"))
+        logger.addHandler(handler)
+    if logger.level == logging.NOTSET:
+        logger.setLevel(logging.INFO)
 
 
 class GlobalConnectError(Exception):
     """Custom exception for GlobalConnect SDK errors."""
 
 
+class CircuitOpenError(GlobalConnectError):
+    """Raised without contacting the API while an endpoint's circuit breaker is open."""
+
+
+class JSONCodec:
+    """
+    JSON encoder/decoder pair used by the SDK.
+    loads() accepts bytes or bytearray; dumps() returns compact UTF-8 bytes.
+    """
+
+    def __init__(self, name: str, loads: Callable[[Any], Any], dumps: Callable[[Any], bytes]):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self) -> str:
+        return f"JSONCodec({self.name!r})"
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return jsonlib.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _make_codec(name: str) -> JSONCodec:
+    if name == "orjson":
+        import orjson
+
+        def orjson_dumps(obj):
+            try:
+                # Like the stdlib encoder, accept non-str dict keys (e.g. {1: "a"} -> {"1":"a"})
+                return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                return _stdlib_dumps(obj)  # e.g. integers beyond 64 bits
+
+        def orjson_loads(data):
+            try:
+                return orjson.loads(data)
+            except ValueError:
+                return jsonlib.loads(data)  # e.g. NaN / Infinity literals
+
+        return JSONCodec("orjson", orjson_loads, orjson_dumps)
+    if name == "ujson":
+        import ujson
+
+        def ujson_loads(data):
+            return ujson.loads(bytes(data) if isinstance(data, bytearray) else data)
+
+        return JSONCodec("ujson", ujson_loads, lambda obj: ujson.dumps(obj, ensure_ascii=False).encode("utf-8"))
+    if name == "json":
+        return JSONCodec("json", jsonlib.loads, _stdlib_dumps)
+    raise ValueError(f"Unknown JSON codec: {name}")
+
+
+_default_codec: Optional[JSONCodec] = None
+_fast_codec: Optional[JSONCodec] = None
+
+
+def get_json_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    Return a JSONCodec by name: "json" (the stdlib, also the default when name is None),
+    "orjson", "ujson", or "fast" for the fastest one installed (orjson, then ujson,
+    then the stdlib).
+    The fast codecs are opt-in because they are not drop-in replacements: orjson falls
+    back to the stdlib for integers beyond 64 bits and NaN / Infinity literals it cannot
+    handle, but still sends NaN as null and decodes integers beyond 64 bits as floats.
+    """
+    global _default_codec, _fast_codec
+    if name is None or name == "json":
+        if _default_codec is None:
+            _default_codec = _make_codec("json")
+        return _default_codec
+    if name != "fast":
+        return _make_codec(name)
+    if _fast_codec is None:
+        for candidate in ("orjson", "ujson", "json"):
+            try:
+                _fast_codec = _make_codec(candidate)
+                break
+            except ImportError:
+                continue
+    return _fast_codec
+
+
+def _decode_json(codec: JSONCodec, body: Any) -> Any:
+    try:
+        return codec.loads(body) if body else None
+    except ValueError as e:
+        raise GlobalConnectError(f"Invalid JSON response: {e}")
+
+
+def _encode_json(codec: JSONCodec, obj: Any) -> bytes:
+    try:
+        return codec.dumps(obj)
+    except (TypeError, ValueError, OverflowError) as e:
+        raise GlobalConnectError(f"Request body is not JSON serializable: {e}")
+
+
+def _preview(body: Any, limit: int = 300) -> str:
+    """Short printable prefix of a response body, for debug logs only."""
+    return bytes(body[:limit]).decode("utf-8", errors="replace")
+
+
+class _CacheEntry:
+    __slots__ = ("body", "etag", "expires_at")
+
+    def __init__(self, body: bytes, etag: Optional[str], expires_at: float):
+        self.body = body
+        self.etag = etag
+        self.expires_at = expires_at
+
+
+class ResponseCache:
+    """
+    Opt-in, thread-safe response cache for read-only (GET) endpoints.
+    - Per-endpoint TTLs; endpoints without a TTL are never cached.
+    - Expired entries carrying an ETag are revalidated with If-None-Match
+      (a 304 refreshes the entry without re-downloading the body).
+    - LRU eviction once the cached bodies exceed max_bytes.
+    Share one instance between GlobalConnect and AsyncGlobalConnect clients if desired;
+    entries are keyed per credential, so clients with different API keys stay isolated.
+    """
+
+    DEFAULT_TTLS = {
+        "/partners/status": 5.0,
+        "/partners/analytics": 30.0,
+        "/partners/compliance": 60.0,
+        "/partners/recommendations": 30.0,
+    }
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 0.0,
+        max_bytes: int = 16 * 1024 * 1024
+    ):
+        """
+        :param ttls: Seconds to cache each endpoint (merged over DEFAULT_TTLS)
+        :param default_ttl: TTL for GET endpoints not listed in ttls (0 = don't cache)
+        :param max_bytes: Total cached body size before least-recently-used entries are evicted
+        """
+        self.ttls = {**self.DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    def ttl_for(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict], credential: Optional[str] = None) -> str:
+        """
+        Cache key for a GET. `credential` (the Authorization header) is folded in as a
+        hash, so clients with different API keys sharing a cache never see each other's data.
+        """
+        key = url
+        if params:
+            key += "?" + "&".join(f"{k}={params[k]}" for k in sorted(params))
+        if credential:
+            key = hashlib.sha256(credential.encode("utf-8")).hexdigest()[:32] + " " + key
+        return key
+
+    def get_fresh(self, key: str) -> Optional[bytes]:
+        """Return the cached body if it has not expired (counts as a hit)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= time.monotonic():
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.body
+
+    def etag_for(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.etag if entry is not None else None
+
+    def revalidated(self, key: str, ttl: float) -> Optional[bytes]:
+        """Handle a 304: extend the entry's lifetime and return its body."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.expires_at = time.monotonic() + ttl
+            self._entries.move_to_end(key)
+            self.revalidations += 1
+            return entry.body
+
+    def put(self, key: str, body: bytes, etag: Optional[str], ttl: float):
+        """Store a freshly downloaded body (counts as a miss)."""
+        with self._lock:
+            self.misses += 1
+            size = len(body)
+            if size > self.max_bytes:
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old.body)
+            self._entries[key] = _CacheEntry(body, etag, time.monotonic() + ttl)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.body)
+                self.evictions += 1
+
+    def invalidate(self, key: Optional[str] = None):
+        """Drop one entry, or everything when key is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._size = 0
+            else:
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self._size -= len(entry.body)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.revalidations + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "hit_ratio": (self.hits + self.revalidations) / lookups if lookups else 0.0,
+            }
+
+
+class _SingleFlight:
+    """
+    Thread-based de-duplication: concurrent calls with the same key share one execution.
+    Waiters get a deep copy of the leader's result, so no caller can mutate another's data.
+    """
+
+    class _Call:
+        __slots__ = ("done", "result", "error")
+
+        def __init__(self):
+            self.done = threading.Event()
+            self.result = None
+            self.error: Optional[BaseException] = None
+
+    def __init__(self):
+        self._calls: Dict[Any, "_SingleFlight._Call"] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key: Any, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = self._Call()
+            else:
+                self.coalesced += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class _AsyncSingleFlight:
+    """
+    asyncio de-duplication: concurrent awaits with the same key share one task.
+    Waiters get a deep copy of the leader's result, so no caller can mutate another's data.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Any, "asyncio.Task"] = {}
+        self.coalesced = 0
+
+    async def do(self, key: Any, fn: Callable[[], Any]) -> Any:
+        task = self._tasks.get(key)
+        leader = task is None
+        if leader:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda _t: self._tasks.pop(key, None))
+        else:
+            self.coalesced += 1
+        # Shield so one cancelled waiter does not cancel the call for the others
+        result = await asyncio.shield(task)
+        return result if leader else copy.deepcopy(result)
+
+
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable stand-in for a param/header value (lists and tuples become tuples, dicts sorted item tuples)."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def _coalesce_key(method: str, url: str, params: Optional[Dict], headers: Optional[Dict]) -> Any:
+    """
+    Single-flight key for a request, or None when it cannot be hashed (the request is then sent uncoalesced).
+    `headers` are the effective request headers; their Authorization credential is folded in as a
+    hash (as in ResponseCache.make_key), so callers with different API keys never share a call.
+    """
+    headers = dict(headers or {})
+    credential = headers.pop("Authorization", None)
+    if credential:
+        credential = hashlib.sha256(credential.encode("utf-8")).hexdigest()[:32]
+    try:
+        key = (method, url, credential, _freeze(params or {}), _freeze(headers))
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class TokenBucket:
+    """Thread-safe token bucket. reserve() takes a token and returns how long to wait for it."""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+
+class RateLimiter:
+    """
+    Client-side request rate limiter.
+    - rate/burst: requests per second allowed for each API key (each key gets its own bucket).
+    - endpoint_limits: {endpoint_prefix: rate or (rate, burst)}; the longest matching prefix applies,
+      e.g. {"/events/": 200, "/partners/analytics": (2, 5)}.
+    Share one instance between clients to enforce a combined limit.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        endpoint_limits: Optional[Dict[str, Union[float, Tuple[float, float]]]] = None
+    ):
+        self.rate = rate
+        self.burst = burst
+        self._key_buckets: Dict[str, TokenBucket] = {}
+        self._endpoint_buckets: Dict[str, TokenBucket] = {}
+        for prefix, limit in (endpoint_limits or {}).items():
+            limit_rate, limit_burst = limit if isinstance(limit, tuple) else (limit, None)
+            self._endpoint_buckets[prefix] = TokenBucket(limit_rate, limit_burst)
+        self._prefixes = sorted(self._endpoint_buckets, key=len, reverse=True)
+        self._resolved: Dict[str, Optional[TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    def _endpoint_bucket(self, endpoint: str) -> Optional[TokenBucket]:
+        try:
+            return self._resolved[endpoint]
+        except KeyError:
+            bucket = next((self._endpoint_buckets[p] for p in self._prefixes if endpoint.startswith(p)), None)
+            if len(self._resolved) < 4096:
+                self._resolved[endpoint] = bucket
+            return bucket
+
+    def _key_bucket(self, api_key: Optional[str]) -> Optional[TokenBucket]:
+        if self.rate is None:
+            return None
+        key = api_key or ""
+        bucket = self._key_buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._key_buckets.setdefault(key, TokenBucket(self.rate, self.burst))
+        return bucket
+
+    def reserve(self, endpoint: str, api_key: Optional[str] = None) -> float:
+        """Reserve a request slot; returns seconds the caller must wait before sending."""
+        wait = 0.0
+        for bucket in (self._key_bucket(api_key), self._endpoint_bucket(endpoint)):
+            if bucket is not None:
+                wait = max(wait, bucket.reserve())
+        return wait
+
+
+class RetryBudget:
+    """
+    Caps retries at a fraction of recent request volume, shared by every endpoint
+    (and every client it is passed to) so retries against one slow endpoint
+    cannot starve the rest. Each request deposits `ratio` tokens, each retry
+    withdraws one; `min_per_second` tokens trickle in so low traffic can still retry.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 5.0, max_tokens: Optional[float] = None):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens if max_tokens is not None else max(10.0, min_per_second * 10)
+        self._tokens = self.max_tokens
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.exhausted = 0
+
+    def record_request(self):
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_retry(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.max_tokens, self._tokens + (now - self._updated) * self.min_per_second)
+            self._updated = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            self.exhausted += 1
+            return False
+
+
+# Statuses worth retrying; other 4xx responses fail immediately.
+_RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        from email.utils import parsedate_to_datetime
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _backoff_delay(backoff_factor: float, max_backoff: float, attempt: int, retry_after: Optional[float]) -> float:
+    """Full-jitter exponential backoff; a server-provided Retry-After takes precedence."""
+    import random
+    if retry_after is not None:
+        return retry_after + random.uniform(0, backoff_factor)
+    return random.uniform(0, min(max_backoff, backoff_factor * (2 ** (attempt - 1))))
+
+
+def _check_retry(client: Any, attempt: int, attempts: int, retry_after: Optional[float], error: Exception, label: str):
+    """Raise instead of retrying when out of attempts, retry budget, or patience for Retry-After."""
+    if attempt >= attempts:
+        logger.error(f"Request failed after {attempt} attempts")
+        raise GlobalConnectError(f"{label}: {error}")
+    if retry_after is not None and retry_after > client.max_retry_after:
+        logger.error(f"Retry-After of {retry_after:.0f}s exceeds max_retry_after")
+        raise GlobalConnectError(f"{label}: {error}")
+    if client.retry_budget is not None and not client.retry_budget.try_retry():
+        logger.error("Retry budget exhausted, not retrying")
+        raise GlobalConnectError(f"{label} (retry budget exhausted): {error}")
+    logger.info(f"Retrying (attempt {attempt + 1}/{attempts})...")
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker for one endpoint.
+    - closed: calls flow; outcomes go into a sliding window of the last window_size calls.
+    - open: once the window holds min_calls and its failure rate reaches the threshold,
+      calls fail fast for open_timeout seconds.
+    - half_open: up to half_open_max_calls trial calls; all succeeding closes the
+      circuit, any failure re-opens it. A trial that ends without an outcome (e.g. it
+      was cancelled) must release() its slot.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        min_calls: int = 10,
+        open_timeout: float = 30.0,
+        half_open_max_calls: int = 1
+    ):
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min_calls
+        self.open_timeout = open_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._window: deque = deque(maxlen=window_size)
+        self._failures = 0
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trials = 0
+        self._trial_successes = 0
+        self._lock = threading.Lock()
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    @property
+    def failure_rate(self) -> float:
+        return self._failures / len(self._window) if self._window else 0.0
+
+    def _maybe_half_open(self):
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.open_timeout:
+            self._state = self.HALF_OPEN
+            self._trials = 0
+            self._trial_successes = 0
+
+    def allow(self) -> bool:
+        """Whether a call may proceed right now."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and self._trials < self.half_open_max_calls:
+                self._trials += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def release(self):
+        """Give back a half-open trial whose call ended without an outcome (e.g. it was cancelled)."""
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._trials > 0:
+                self._trials -= 1
+
+    def record(self, success: bool):
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                if not success:
+                    self._open()
+                    return
+                self._trial_successes += 1
+                if self._trial_successes >= self.half_open_max_calls:
+                    self._state = self.CLOSED
+                    self._window.clear()
+                    self._failures = 0
+                return
+            if self._state == self.OPEN:
+                return
+            if len(self._window) == self._window.maxlen and not self._window[0]:
+                self._failures -= 1
+            self._window.append(success)
+            if not success:
+                self._failures += 1
+                if len(self._window) >= self.min_calls and self.failure_rate >= self.failure_rate_threshold:
+                    self._open()
+
+    def _open(self):
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self.times_opened += 1
+        logger.warning("Circuit breaker opened")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "failure_rate": self.failure_rate,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+        }
+
+
+class CircuitBreakers:
+    """Per-endpoint CircuitBreaker registry; keyword arguments configure each breaker."""
+
+    def __init__(self, **breaker_kwargs):
+        self.breaker_kwargs = breaker_kwargs
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(endpoint)
+                if breaker is None:
+                    breaker = self._breakers[endpoint] = CircuitBreaker(**self.breaker_kwargs)
+        return breaker
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {endpoint: breaker.stats() for endpoint, breaker in list(self._breakers.items())}
+
+
+# Statuses that count against an endpoint's circuit breaker (429 is throttling, not ill health).
+_BREAKER_FAILURE_STATUSES = frozenset({408, 500, 502, 503, 504})
+
+
+def _settle_breaker(breaker: CircuitBreaker, error: BaseException):
+    """
+    Settle an attempt that ended before its outcome was recorded: an unexpected error
+    counts as a failure, cancellation (or another BaseException) frees its trial.
+    """
+    if isinstance(error, Exception):
+        breaker.record(False)
+    else:
+        breaker.release()
+
+
+class HedgePolicy:
+    """
+    Hedged requests for idempotent GETs: when an attempt is still running after the
+    endpoint's recent latency percentile, a second identical request is sent and
+    whichever finishes first wins. Hedging starts once min_samples latencies are known.
+    The delay is measured from when the first attempt starts running, not from when it
+    was queued (on the hedge thread pool or the async concurrency limit), and at most
+    `max_hedge_ratio` of requests are hedged: each request deposits that many tokens,
+    each hedge withdraws one, so a slow or saturated upstream is not hit with extra load.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        window: int = 256,
+        min_delay: float = 0.005,
+        max_hedge_ratio: float = 0.1,
+        max_tokens: float = 10.0,
+    ):
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window = window
+        self.min_delay = min_delay
+        self.max_hedge_ratio = max_hedge_ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._samples: Dict[str, deque] = {}
+        self._delays: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.budget_exhausted = 0
+
+    def record(self, endpoint: str, latency: float):
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(latency)
+            # Re-sorting a small window every few samples keeps the percentile cheap
+            if len(samples) >= self.min_samples and len(samples) % 8 == 0:
+                ordered = sorted(samples)
+                index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+                self._delays[endpoint] = max(self.min_delay, ordered[index])
+
+    def delay_for(self, endpoint: str) -> Optional[float]:
+        return self._delays.get(endpoint)
+
+    def _count(self, won: bool = False):
+        with self._lock:
+            if won:
+                self.hedge_wins += 1
+            else:
+                self.requests += 1
+                self._tokens = min(self.max_tokens, self._tokens + self.max_hedge_ratio)
+
+    def _try_hedge(self) -> bool:
+        """Withdraw a hedge from the budget; False when it is spent."""
+        with self._lock:
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                self.hedged += 1
+                return True
+            self.budget_exhausted += 1
+            return False
+
+    def call(self, endpoint: str, send: Callable[[], Any], executor: "futures.ThreadPoolExecutor") -> Any:
+        """Run send() with hedging on a thread pool (sync clients)."""
+        self._count()
+        delay = self.delay_for(endpoint)
+        started = time.monotonic()
+        if delay is None:
+            result = send()
+            self.record(endpoint, time.monotonic() - started)
+            return result
+        running = threading.Event()
+
+        def send_primary():
+            running.set()
+            return send()
+
+        primary = executor.submit(send_primary)
+        running.wait()  # Time spent queued on the pool does not count towards the delay
+        started = time.monotonic()
+        done, _ = futures.wait([primary], timeout=delay)
+        if not done and not self._try_hedge():
+            done, _ = futures.wait([primary])
+        if not done:
+            hedge = executor.submit(send)
+            done, _ = futures.wait([primary, hedge], return_when=futures.FIRST_COMPLETED)
+            winner = done.pop()
+            loser = hedge if winner is primary else primary
+            if winner.exception() is not None:
+                winner, loser = loser, winner
+            elif winner is hedge:
+                self._count(won=True)
+            loser.add_done_callback(_close_discarded_response)
+        else:
+            winner = primary
+        result = winner.result()
+        self.record(endpoint, time.monotonic() - started)
+        return result
+
+    async def acall(self, endpoint: str, send: Callable[[], Any], running: Optional["asyncio.Event"] = None) -> Any:
+        """
+        Await send() with hedging (async clients).
+        :param running: Event the first send() sets once it is past any queueing; the
+            hedge delay and the recorded latency start then (immediately when not given)
+        """
+        self._count()
+        delay = self.delay_for(endpoint)
+        started = time.monotonic()
+        if running is None and delay is None:
+            result = await send()
+            self.record(endpoint, time.monotonic() - started)
+            return result
+        primary = asyncio.ensure_future(send())
+        if running is not None:
+            waiter = asyncio.ensure_future(running.wait())
+            await asyncio.wait({primary, waiter}, return_when=asyncio.FIRST_COMPLETED)
+            waiter.cancel()
+            started = time.monotonic()
+        if delay is None:
+            result = await primary
+            self.record(endpoint, time.monotonic() - started)
+            return result
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if not done and not self._try_hedge():
+            done, _ = await asyncio.wait({primary})
+        if not done:
+            hedge = asyncio.ensure_future(send())
+            done, pending = await asyncio.wait({primary, hedge}, return_when=asyncio.FIRST_COMPLETED)
+            winner = done.pop()
+            if winner.exception() is not None and pending:
+                winner = pending.pop()
+                await asyncio.wait({winner})
+            else:
+                for task in pending:
+                    task.cancel()
+                if winner is hedge:
+                    self._count(won=True)
+        else:
+            winner = primary
+        result = winner.result()
+        self.record(endpoint, time.monotonic() - started)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "hedge_rate": self.hedged / self.requests if self.requests else 0.0,
+            "budget_exhausted": self.budget_exhausted,
+            "delays": dict(self._delays),
+        }
+
+
+def _close_discarded_response(future: "futures.Future"):
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+class RequestRecord:
+    """Outcome of one logical SDK call (all attempts), handed to a MetricsSink."""
+
+    __slots__ = (
+        "method", "endpoint", "start_time_ns", "latency", "status", "attempts", "backoff_seconds",
+        "throttle_seconds", "bytes_sent", "bytes_received", "cache", "error",
+    )
+
+    def __init__(self, method: str, endpoint: str):
+        self.method = method
+        self.endpoint = endpoint
+        self.start_time_ns = time.time_ns()
+        self.latency = 0.0
+        self.status: Optional[int] = None
+        self.attempts = 0
+        self.backoff_seconds = 0.0
+        self.throttle_seconds = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.cache: Optional[str] = None  # "hit" / "revalidated" when served from ResponseCache
+        self.error: Optional[str] = None
+
+    @property
+    def retries(self) -> int:
+        return max(0, self.attempts - 1)
+
+
+class MetricsSink:
+    """
+    Instrumentation interface. Pass an instance as `instrumentation=` to a client;
+    with no sink attached the SDK skips all bookkeeping.
+    """
+
+    def on_request(self, record: RequestRecord):
+        """Called once per logical call after it succeeds or fails."""
+
+
+class CallbackSink(MetricsSink):
+    """Adapts plain callables, e.g. CallbackSink(lambda r: statsd.timing(r.endpoint, r.latency))."""
+
+    def __init__(self, *callbacks: Callable[[RequestRecord], None]):
+        self.callbacks = callbacks
+
+    def on_request(self, record: RequestRecord):
+        for callback in self.callbacks:
+            callback(record)
+
+
+class InMemoryMetrics(MetricsSink):
+    """
+    Thread-safe in-process metrics registry: per-endpoint latency histograms,
+    status counts, retry/backoff counters and byte totals.
+    """
+
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+    def __init__(self, buckets: Optional[Tuple[float, ...]] = None):
+        self.buckets = tuple(buckets) if buckets else self.BUCKETS
+        self._endpoints: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _series(self, name: str) -> Dict[str, Any]:
+        series = self._endpoints.get(name)
+        if series is None:
+            series = self._endpoints[name] = {
+                "count": 0,
+                "errors": 0,
+                "latency_sum": 0.0,
+                "histogram": [0] * len(self.buckets),
+                "statuses": {},
+                "retries": 0,
+                "backoff_seconds": 0.0,
+                "throttle_seconds": 0.0,
+                "bytes_sent": 0,
+                "bytes_received": 0,
+                "cache_hits": 0,
+            }
+        return series
+
+    def on_request(self, record: RequestRecord):
+        index = bisect.bisect_left(self.buckets, record.latency)
+        with self._lock:
+            series = self._series(f"{record.method} {record.endpoint}")
+            series["count"] += 1
+            series["latency_sum"] += record.latency
+            series["histogram"][min(index, len(self.buckets) - 1)] += 1
+            status = record.status if record.status is not None else "error"
+            series["statuses"][status] = series["statuses"].get(status, 0) + 1
+            if record.error is not None:
+                series["errors"] += 1
+            series["retries"] += record.retries
+            series["backoff_seconds"] += record.backoff_seconds
+            series["throttle_seconds"] += record.throttle_seconds
+            series["bytes_sent"] += record.bytes_sent
+            series["bytes_received"] += record.bytes_received
+            if record.cache is not None:
+                series["cache_hits"] += 1
+
+    def _percentile(self, histogram: List[int], count: int, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile."""
+        target = q * count
+        seen = 0
+        for bound, n in zip(self.buckets, histogram):
+            seen += n
+            if seen >= target:
+                return bound
+        return self.buckets[-1]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            result = {}
+            for name, series in self._endpoints.items():
+                count = series["count"]
+                histogram = list(series["histogram"])
+                result[name] = {
+                    **series,
+                    "statuses": dict(series["statuses"]),
+                    "histogram": dict(zip(self.buckets, histogram)),
+                    "mean": series["latency_sum"] / count if count else 0.0,
+                    "p50": self._percentile(histogram, count, 0.50),
+                    "p95": self._percentile(histogram, count, 0.95),
+                    "p99": self._percentile(histogram, count, 0.99),
+                }
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+class OpenTelemetrySink(MetricsSink):
+    """Emits one CLIENT span per call through opentelemetry-api (optional dependency)."""
+
+    def __init__(self, tracer: Any = None):
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError("opentelemetry-api is required for OpenTelemetrySink: pip install opentelemetry-api")
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("globalconnect")
+
+    def on_request(self, record: RequestRecord):
+        trace = self._trace
+        span = self.tracer.start_span(
+            f"{record.method} {record.endpoint}",
+            kind=trace.SpanKind.CLIENT,
+            start_time=record.start_time_ns,
+            attributes={
+                "http.request.method": record.method,
+                "url.path": record.endpoint,
+                "http.response.status_code": record.status or 0,
+                "globalconnect.attempts": record.attempts,
+                "globalconnect.backoff_seconds": record.backoff_seconds,
+                "globalconnect.cache": record.cache or "miss",
+            },
+        )
+        if record.error is not None:
+            span.set_status(trace.Status(trace.StatusCode.ERROR, record.error))
+        span.end(end_time=record.start_time_ns + int(record.latency * 1e9))
+
+
+def _emit(sink: MetricsSink, record: RequestRecord):
+    try:
+        sink.on_request(record)
+    except Exception as e:
+        logger.warning(f"Metrics sink failed: {e}")
+
+
+_HOP_BY_HOP_HEADERS = frozenset(
+    ("connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade", "te", "host", "content-length")
+)
+
+
+def _require_http2():
+    httpx._load()
+    try:
+        importlib.import_module("h2")
+    except ImportError:
+        raise ImportError("HTTP/2 support needs the h2 package: pip install 'httpx[http2]'")
+
+
+def _http2_headers(headers: Any) -> Dict[str, str]:
+    """Drop connection-specific headers, which HTTP/2 forbids (httpx sets its own framing headers)."""
+    return {k: v for k, v in headers.items() if k.lower() not in _HOP_BY_HOP_HEADERS}
+
+
+def _http2_limits(max_connections: int, keepalive_expiry: float = 5.0) -> "httpx.Limits":
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def _open_connections(client: Any) -> int:
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    return len(getattr(pool, "connections", ()))
+
+
+def _count_protocol(protocols: Dict[str, int], version: str):
+    protocols[version] = protocols.get(version, 0) + 1
+
+
+def _http2_ssl_context(verify: Any, cert: Any) -> Any:
+    """httpx `verify` for requests-style verify (bool or CA bundle path) and cert (path or (cert, key))."""
+    if verify is True and not cert:
+        return True
+    import ssl
+    if verify is False:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    else:
+        ca = requests.utils.DEFAULT_CA_BUNDLE_PATH if verify is True else verify
+        if os.path.isdir(ca):
+            context = ssl.create_default_context(capath=ca)
+        else:
+            context = ssl.create_default_context(cafile=ca)
+    if cert:
+        if isinstance(cert, (tuple, list)):
+            context.load_cert_chain(*cert)
+        else:
+            context.load_cert_chain(cert)
+    return context
+
+
+class _HTTP2Adapter:
+    """
+    requests transport adapter that sends through httpx with HTTP/2 enabled, so
+    concurrent calls to the same host share a multiplexed connection. HTTP/2 is
+    negotiated via ALPN; servers without it (and plain http://) are spoken to over
+    HTTP/1.1 on the same pool. Mounted by GlobalConnect(http2=True).
+    One httpx client is kept per (verify, cert, proxy) combination the session asks
+    for, so TLS settings and proxies behave as with the default requests adapter.
+    """
+
+    def __init__(self, max_streams: int, max_connections: int):
+        self._max_connections = max_connections
+        self._clients: Dict[tuple, "httpx.Client"] = {}
+        self._clients_lock = threading.Lock()
+        self._streams = threading.BoundedSemaphore(max_streams)
+        self.protocols: Dict[str, int] = {}
+
+    def _client_for(self, url: str, verify: Any, cert: Any, proxies: Optional[Dict[str, str]]) -> "httpx.Client":
+        proxy = requests.utils.select_proxy(url, proxies) if proxies else None
+        key = (verify, tuple(cert) if isinstance(cert, list) else cert, proxy)
+        client = self._clients.get(key)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    options: Dict[str, Any] = {}
+                    if proxy:
+                        options["proxy"] = proxy
+                    client = httpx.Client(
+                        http2=True,
+                        limits=_http2_limits(self._max_connections),
+                        verify=_http2_ssl_context(verify, cert),
+                        trust_env=False,  # requests already merged the environment into verify/proxies
+                        **options,
+                    )
+                    self._clients[key] = client
+        return client
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        client = self._client_for(request.url, verify, cert, proxies)
+        with self._streams:
+            try:
+                upstream = client.request(
+                    request.method,
+                    request.url,
+                    headers=_http2_headers(request.headers),
+                    content=request.body,
+                    timeout=timeout,
+                )
+            except httpx.TimeoutException as e:
+                raise requests.Timeout(e, request=request)
+            except httpx.TransportError as e:
+                raise requests.ConnectionError(e, request=request)
+        _count_protocol(self.protocols, upstream.http_version)
+
+        import io
+        response = requests.Response()
+        response.status_code = upstream.status_code
+        response.reason = upstream.reason_phrase
+        response.headers = requests.structures.CaseInsensitiveDict(upstream.headers.items())
+        response._content = upstream.content
+        response.raw = io.BytesIO(response._content)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def open_connections(self) -> int:
+        return sum(_open_connections(client) for client in list(self._clients.values()))
+
+    def close(self):
+        with self._clients_lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
+
+
+class _HTTP2Response:
+    """The aiohttp.ClientResponse surface AsyncGlobalConnect reads, over an httpx response."""
+
+    __slots__ = ("_response", "method", "url", "status", "headers", "content_type", "charset")
+
+    def __init__(self, response: "httpx.Response", method: str, url: str):
+        self._response = response
+        self.method = method
+        self.url = url
+        self.status = response.status_code
+        self.headers = response.headers
+        self.content_type = response.headers.get("Content-Type", "application/octet-stream").split(";")[0].strip().lower()
+        self.charset = response.charset_encoding
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            import multidict
+            import yarl
+            url = yarl.URL(self.url)
+            request_headers = multidict.CIMultiDictProxy(multidict.CIMultiDict())
+            raise aiohttp.ClientResponseError(
+                aiohttp.RequestInfo(url, self.method, request_headers, url),
+                (),
+                status=self.status,
+                message=self._response.reason_phrase,
+                headers=self.headers,
+            )
+
+
+def _split_page(page: Any, records_key: str, cursor_key: str, first: bool) -> Tuple[List[Any], Optional[str]]:
+    """
+    Split one page response into (records, next_cursor). Pagination contract:
+    - A JSON array is a single, final page of records.
+    - An object carries its records in `records_key` (a list) and, if more pages
+      follow, an opaque `cursor_key` to send back as `cursor`.
+    - A first response that is an object without `records_key` is not paginated:
+      it is returned whole as the only record.
+    Anything else is a contract violation and raises GlobalConnectError rather than
+    silently ending the stream.
+    """
+    if isinstance(page, list):
+        return page, None
+    if isinstance(page, dict):
+        if records_key not in page:
+            if first:
+                return [page], None
+        else:
+            records = page[records_key]
+            if records is None:
+                records = []
+            if isinstance(records, list):
+                return records, page.get(cursor_key) or None
+    raise GlobalConnectError(
+        f"Paginated response has no '{records_key}' list (got {type(page).__name__}"
+        f"{' with keys ' + ', '.join(map(str, page)) if isinstance(page, dict) else ''})"
+    )
+
+
 class GlobalConnect:
     def __init__(
         self,
@@ -32,14 +1237,76 @@ class GlobalConnect:
         timeout: int = 10,
         max_retries: int = 3,
         backoff_factor: float = 0.5,
-        debug: bool = False
+        debug: bool = False,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        max_backoff: float = 30.0,
+        max_retry_after: float = 120.0,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        hedge: Optional[HedgePolicy] = None,
+        json_codec: Optional[JSONCodec] = None,
+        stream_threshold: Optional[int] = None,
+        instrumentation: Optional[MetricsSink] = None,
+        http2: bool = False,
+        http2_max_streams: int = 100
     ):
+        """
+        :param pool_connections: Number of per-host connection pools to cache
+        :param pool_maxsize: Max connections kept open per host (shared across threads)
+        :param pool_block: Block when a host's pool is exhausted instead of opening extra connections
+        :param keep_alive: Reuse connections between calls (sends `Connection: close` when False)
+        :param cache: Optional ResponseCache for read-only endpoints
+        :param coalesce: Share one upstream call between concurrent identical GET/HEAD requests
+        :param rate_limiter: Optional client-side RateLimiter applied before every attempt
+        :param retry_budget: Optional RetryBudget shared across endpoints (and clients)
+        :param max_backoff: Upper bound for the jittered exponential backoff, in seconds
+        :param max_retry_after: Give up instead of waiting when Retry-After exceeds this
+        :param circuit_breakers: Optional per-endpoint CircuitBreakers that fail fast when the API degrades
+        :param hedge: Optional HedgePolicy for hedged GET requests
+        :param json_codec: JSONCodec for request/response bodies (default: stdlib json;
+            get_json_codec("fast") opts in to orjson / ujson)
+        :param stream_threshold: Stream responses and decode bodies of at least this many bytes
+            straight from one preallocated buffer (None reads bodies the usual way)
+        :param instrumentation: Optional MetricsSink receiving a RequestRecord per call
+        :param http2: Send through httpx with HTTP/2 so concurrent calls share one multiplexed
+            connection (needs httpx[http2]; servers without HTTP/2 are used over HTTP/1.1)
+        :param http2_max_streams: Max requests in flight at once over the HTTP/2 transport
+        """
+        if http2:
+            _require_http2()
         self.api_key = api_key or os.getenv("GLOBALCONNECT_API_KEY")
         self.api_base = api_base or os.getenv("GLOBALCONNECT_API_BASE") or "http://localhost:3000"
         self.timeout = timeout
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.rate_limiter = rate_limiter
+        self.retry_budget = retry_budget
+        self.circuit_breakers = circuit_breakers
+        self.hedge = hedge
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.http2 = http2
+        self.http2_max_streams = http2_max_streams
+        self.json_codec = json_codec or get_json_codec()
+        self.stream_threshold = stream_threshold
+        self.instrumentation = instrumentation
+        self.cache = cache
+        self._single_flight = _SingleFlight() if coalesce else None
+        self._session: Optional["requests.Session"] = None
+        self._session_lock = threading.Lock()
+        self._hedge_executor: Optional["futures.ThreadPoolExecutor"] = None
 
+        _configure_logging()
         if debug:
             logger.setLevel(logging.DEBUG)
         if not self.api_key:
@@ -47,8 +1314,103 @@ class GlobalConnect:
             raise GlobalConnectError("API key is required.")
 
         self.headers = {"Authorization": f"Bearer {self.api_key}"}
+        if not keep_alive:
+            self.headers["Connection"] = "close"
         logger.debug(f"Initialized GlobalConnect with base: {self.api_base}")
 
+    # --------- Connection Pool ---------
+    @property
+    def session(self) -> "requests.Session":
+        """Pooled keep-alive session, created on first use and shared by all threads."""
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                session = self._session
+                if session is None:
+                    session = self._create_session()
+                    self._session = session
+        return session
+
+    def _create_session(self) -> "requests.Session":
+        session = requests.Session()
+        if self.http2:
+            adapter = _HTTP2Adapter(self.http2_max_streams, self.pool_maxsize)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            logger.debug(
+                f"Created HTTP/2 transport (streams={self.http2_max_streams}, connections={self.pool_maxsize})"
+            )
+            return session
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=0,  # Retries are handled by _request
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        logger.debug(
+            f"Created connection pool (hosts={self.pool_connections}, per_host={self.pool_maxsize}, "
+            f"block={self.pool_block})"
+        )
+        return session
+
+    def connection_stats(self) -> Dict[str, Any]:
+        """Connections opened vs requests sent through the pool (reuse_ratio = 1 - opened/requests)."""
+        opened = sent = 0
+        protocols: Dict[str, int] = {}
+        session = self._session
+        if session is not None:
+            for adapter in set(session.adapters.values()):
+                if isinstance(adapter, _HTTP2Adapter):
+                    opened += adapter.open_connections()
+                    for version, count in adapter.protocols.items():
+                        sent += count
+                        protocols[version] = protocols.get(version, 0) + count
+                    continue
+                pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+                if pools is None:
+                    continue
+                for key in list(pools.keys()):
+                    pool = pools.get(key)
+                    if pool is not None:
+                        opened += pool.num_connections
+                        sent += pool.num_requests
+                        protocols["HTTP/1.1"] = protocols.get("HTTP/1.1", 0) + pool.num_requests
+        return {
+            "connections_opened": opened,
+            "requests": sent,
+            "reuse_ratio": 1 - opened / sent if sent else 0.0,
+            "protocols": protocols,
+        }
+
+    @property
+    def hedge_executor(self) -> "futures.ThreadPoolExecutor":
+        if self._hedge_executor is None:
+            with self._session_lock:
+                if self._hedge_executor is None:
+                    self._hedge_executor = futures.ThreadPoolExecutor(
+                        max_workers=self.pool_maxsize * 2, thread_name_prefix="GlobalConnectHedge"
+                    )
+        return self._hedge_executor
+
+    def close(self):
+        """Close the connection pool. The client re-opens a fresh pool if used again."""
+        with self._session_lock:
+            session, self._session = self._session, None
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if session is not None:
+            session.close()
+            logger.debug("Closed connection pool")
+
+    def __enter__(self) -> "GlobalConnect":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     def _request(
         self,
         method: str,
@@ -57,36 +1419,186 @@ class GlobalConnect:
         json: Optional[Dict] = None,
         params: Optional[Dict] = None,
         retries: Optional[int] = None,
+        headers: Optional[Dict] = None,
+        **kwargs
+    ) -> Any:
+        method = method.upper()
+        if self._single_flight is not None and method in _IDEMPOTENT_METHODS and json is None and not kwargs:
+            key = _coalesce_key(
+                method, f"{self.api_base}{endpoint}", params, {**self.headers, **headers} if headers else self.headers
+            )
+        else:
+            key = None
+        if key is not None:
+            return self._single_flight.do(
+                key,
+                lambda: self._send_request(method, endpoint, params=params, retries=retries, headers=headers),
+            )
+        return self._send_request(
+            method, endpoint, json=json, params=params, retries=retries, headers=headers, **kwargs
+        )
+
+    def _send_request(self, method: str, endpoint: str, **kwargs) -> Any:
+        sink = self.instrumentation
+        if sink is None:
+            return self._perform(None, method, endpoint, **kwargs)
+        record = RequestRecord(method, endpoint)
+        started = time.perf_counter()
+        try:
+            return self._perform(record, method, endpoint, **kwargs)
+        except Exception as e:
+            record.error = str(e) or type(e).__name__
+            raise
+        finally:
+            record.latency = time.perf_counter() - started
+            _emit(sink, record)
+
+    def _perform(
+        self,
+        record: Optional[RequestRecord],
+        method: str,
+        endpoint: str,
+        *,
+        json: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        retries: Optional[int] = None,
+        headers: Optional[Dict] = None,
         **kwargs
     ) -> Any:
         url = f"{self.api_base}{endpoint}"
         attempts = retries if retries is not None else self.max_retries
+        request_headers = {**self.headers, **headers} if headers else self.headers
+
+        cache_key, cache_ttl = None, 0.0
+        if self.cache is not None and method == "GET":
+            cache_ttl = self.cache.ttl_for(endpoint)
+            if cache_ttl > 0:
+                cache_key = self.cache.make_key(url, params, request_headers.get("Authorization"))
+                body = self.cache.get_fresh(cache_key)
+                if body is not None:
+                    logger.debug("Cache hit %s", url)
+                    if record is not None:
+                        record.cache = "hit"
+                    return _decode_json(self.json_codec, body)
+                etag = self.cache.etag_for(cache_key)
+                if etag:
+                    request_headers = {**request_headers, "If-None-Match": etag}
+
+        data = kwargs.pop("data", None)
+        if json is not None:
+            data = _encode_json(self.json_codec, json)
+            request_headers = {**request_headers, "Content-Type": "application/json"}
+        if record is not None and data:
+            record.bytes_sent = len(data)
+        stream = self.stream_threshold is not None
+        breaker = self.circuit_breakers.get(endpoint) if self.circuit_breakers is not None else None
+        hedge = self.hedge if method == "GET" else None
+        if self.retry_budget is not None:
+            self.retry_budget.record_request()
         for attempt in range(1, attempts + 1):
+            if record is not None:
+                record.attempts = attempt
+            if breaker is not None and not breaker.allow():
+                raise CircuitOpenError(f"Circuit open for {endpoint}")
+            settled = breaker is None  # Whether the breaker has this attempt's outcome
+            retry_after = None
             try:
-                logger.debug(f"Request {method} {url} attempt {attempt}")
-                response = requests.request(
-                    method,
-                    url,
-                    headers=self.headers,
-                    json=json,
-                    params=params,
-                    timeout=self.timeout,
-                    **kwargs
-                )
+                if self.rate_limiter is not None:
+                    wait = self.rate_limiter.reserve(endpoint, self.api_key)
+                    if wait > 0:
+                        if record is not None:
+                            record.throttle_seconds += wait
+                        time.sleep(wait)
+                logger.debug("Request %s %s attempt %d", method, url, attempt)
+
+                def send():
+                    return self.session.request(
+                        method,
+                        url,
+                        headers=request_headers,
+                        data=data,
+                        params=params,
+                        timeout=self.timeout,
+                        stream=stream,
+                        **kwargs
+                    )
+
+                response = hedge.call(endpoint, send, self.hedge_executor) if hedge is not None else send()
+                body = self._read_body(response) if stream else response.content
+                if record is not None:
+                    record.status = response.status_code
+                    record.bytes_received += len(body)
+                if breaker is not None:
+                    breaker.record(response.status_code not in _BREAKER_FAILURE_STATUSES)
+                    settled = True
                 response.raise_for_status()
-                logger.debug(f"Response: {response.status_code} {response.text[:300]}")
-                if response.content:
-                    return response.json()
-                return None
-            except requests.RequestException as e:
-                logger.warning(f"Request failed: {e}")
-                if attempt < attempts:
-                    sleep_time = self.backoff_factor * (2 ** (attempt - 1))
-                    logger.info(f"Retrying in {sleep_time:.2f}s...")
-                    time.sleep(sleep_time)
-                else:
-                    logger.error(f"Request failed after {attempt} attempts")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Response: %s %s", response.status_code, _preview(body))
+                if cache_key is not None:
+                    if response.status_code == 304:
+                        cached = self.cache.revalidated(cache_key, cache_ttl)
+                        if cached is not None:
+                            if record is not None:
+                                record.cache = "revalidated"
+                            return _decode_json(self.json_codec, cached)
+                    else:
+                        self.cache.put(cache_key, body, response.headers.get("ETag"), cache_ttl)
+                return _decode_json(self.json_codec, body)
+            except requests.HTTPError as e:
+                status = e.response.status_code if e.response is not None else None
+                if status not in _RETRY_STATUSES:
+                    logger.error(f"Request failed: {e}")
                     raise GlobalConnectError(f"HTTP error: {e}")
+                retry_after = _parse_retry_after(e.response.headers.get("Retry-After"))
+                error: Exception = e
+            except requests.RequestException as e:
+                if not settled:
+                    breaker.record(False)
+                    settled = True
+                error = e
+            except BaseException as e:
+                if not settled:
+                    _settle_breaker(breaker, e)
+                raise
+            logger.warning(f"Request failed: {error}")
+            _check_retry(self, attempt, attempts, retry_after, error, "HTTP error")
+            delay = _backoff_delay(self.backoff_factor, self.max_backoff, attempt, retry_after)
+            if record is not None:
+                record.backoff_seconds += delay
+            time.sleep(delay)
+
+    def _read_body(self, response: "requests.Response") -> Any:
+        """
+        Read a streamed response body. Bodies of at least stream_threshold bytes
+        with a known length and no content-encoding are read directly into one
+        preallocated buffer, skipping the chunk list and join of response.content.
+        """
+        length = response.headers.get("Content-Length")
+        if (
+            length is None
+            or not length.isdigit()
+            or int(length) < self.stream_threshold
+            or response.headers.get("Content-Encoding", "identity") != "identity"
+        ):
+            return response.content
+        buffer = bytearray(int(length))
+        view = memoryview(buffer)
+        filled = 0
+        try:
+            while filled < len(buffer):
+                read = response.raw.readinto(view[filled:])
+                if not read:
+                    break
+                filled += read
+        except Exception as e:
+            response.close()
+            raise requests.ConnectionError(f"Failed reading response body: {e}")
+        finally:
+            view.release()
+        if filled < len(buffer):
+            response.close()
+            raise requests.ConnectionError(f"Response body truncated ({filled} of {len(buffer)} bytes)")
+        return buffer
 
     # --------- Partner APIs ---------
     def get_status(self) -> Dict:
@@ -117,38 +1629,82 @@ class GlobalConnect:
         """Call a custom endpoint (advanced/extensible)"""
         return self._request(method, endpoint, **kwargs)
 
+    # --------- Streaming Pagination ---------
+    def iter_pages(
+        self,
+        endpoint: str,
+        page_size: int = 1000,
+        params: Optional[Dict] = None,
+        prefetch: bool = True,
+        records_key: str = "records",
+        cursor_key: str = "next_cursor"
+    ) -> Iterator[Any]:
+        """
+        Yield records from a cursor-paginated GET endpoint one page at a time.
+        Requests carry `limit` and (after the first page) `cursor`; pages look like
+        {"records": [...], "next_cursor": "..."} and the last page omits next_cursor.
+        A first response without `records_key` (e.g. a plain /partners/analytics
+        document) is yielded whole as a single item; a later page without it raises
+        GlobalConnectError. With prefetch the next page is fetched on a background
+        thread while the current one is consumed, so at most two pages are held in memory.
+        """
+        base_params = {**(params or {}), "limit": page_size}
+
+        def fetch(cursor: Optional[str]) -> Any:
+            page_params = {**base_params, "cursor": cursor} if cursor else base_params
+            return self._request("GET", endpoint, params=page_params)
+
+        executor = futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="GlobalConnectPrefetch") if prefetch else None
+        pending = None
+        try:
+            records, cursor = _split_page(fetch(None), records_key, cursor_key, first=True)
+            while True:
+                if cursor and executor is not None:
+                    pending = executor.submit(fetch, cursor)
+                yield from records
+                records = None
+                if not cursor:
+                    return
+                page = pending.result() if pending is not None else fetch(cursor)
+                pending = None
+                records, cursor = _split_page(page, records_key, cursor_key, first=False)
+        finally:
+            if executor is not None:
+                if pending is not None:
+                    pending.cancel()
+                executor.shutdown(wait=False)
+
+    def iter_analytics(self, page_size: int = 1000, **kwargs) -> Iterator[Dict]:
+        """Stream partner analytics records page by page (see iter_pages)."""
+        return self.iter_pages("/partners/analytics", page_size=page_size, **kwargs)
+
+    def event_batcher(self, **kwargs) -> "EventBatcher":
+        """
+        Create a buffered bulk-submission pipeline for trigger_event.
+        Usage:
+            with gc.event_batcher(max_batch_size=500) as batcher:
+                batcher.submit("signup", {...})
+        """
+        return EventBatcher(self, **kwargs)
+
     # --------- Webhook/Event Helpers ---------
     def listen_webhook(
         self,
         events: List[str],
-        handler: Callable[[Dict], None],
+        handler: Callable[[Dict], Any],
         host: str = "0.0.0.0",
         port: int = 8080,
         path: str = "/webhook",
-        secret: Optional[str] = None
+        secret: Optional[str] = None,
+        **receiver_kwargs
     ):
         """
-        Start a local Flask webhook listener.
+        Run a WebhookReceiver until interrupted (blocking).
+        Deliveries are acknowledged immediately and handled by a worker pool;
+        extra keyword arguments (concurrency, max_queue, ...) go to WebhookReceiver.
         Usage: gc.listen_webhook(["event"], handler)
         """
-        try:
-            from flask import Flask, request, abort
-        except ImportError:
-            raise ImportError("Please install Flask to use webhook listener: pip install flask")
-        app = Flask(__name__)
-
-        @app.route(path, methods=["POST"])
-        def _webhook():
-            if secret and request.headers.get("X-GC-Secret") != secret:
-                abort(401)
-            payload = request.json
-            logger.info(f"Received webhook: {payload}")
-            if payload and payload.get("event") in events:
-                handler(payload)
-            return "", 204
-
-        logger.info(f"Listening for webhooks on {host}:{port}{path} for events: {events}")
-        app.run(host=host, port=port)
+        WebhookReceiver(handler, events=events, path=path, secret=secret, **receiver_kwargs).run(host, port)
 
     # --------- Async Support (optional) ---------
     async def async_request(
@@ -160,8 +1716,6 @@ class GlobalConnect:
         params: Optional[Dict] = None,
         **kwargs
     ) -> Any:
-        if aiohttp is None:
-            raise ImportError("aiohttp is required for async support: pip install aiohttp")
         url = f"{self.api_base}{endpoint}"
         headers = self.headers.copy()
         async with aiohttp.ClientSession() as session:
@@ -188,6 +1742,829 @@ class GlobalConnect:
         return await self.async_request("GET", "/partners/status")
 
     # --------- Advanced Features ---------
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of circuit breaker states, hedging, cache, connection reuse and request metrics."""
+        return {
+            "circuit_breakers": self.circuit_breakers.stats() if self.circuit_breakers is not None else {},
+            "hedge": self.hedge.stats() if self.hedge is not None else None,
+            "cache": self.cache.stats() if self.cache is not None else None,
+            "connections": self.connection_stats(),
+            "metrics": self.instrumentation.snapshot() if isinstance(self.instrumentation, InMemoryMetrics) else None,
+        }
+
+    def set_debug(self, enabled: bool = True):
+        """Enable or disable debug logging for SDK."""
+        logger.setLevel(logging.DEBUG if enabled else logging.INFO)
+
+    def set_api_key(self, api_key: str):
+        """Change API key at runtime"""
+        self.api_key = api_key
+        self.headers["Authorization"] = f"Bearer {api_key}"
+
+
+class EventBatcher:
+    """
+    Buffered bulk submission for trigger_event.
+    - Collects events in memory and flushes them as one gzip-compressed batch
+      when max_batch_size events are queued or flush_interval seconds pass.
+    - Bounded: submit() blocks (or raises) once max_buffer events are pending.
+    - Flushes remaining events on close() and, by default, at interpreter exit.
+    - Every submit() returns a Future resolved with that event's own result.
+
+    Requires the bulk endpoint POST /batches/events on the server (see
+    api/docs/openapi.yaml). It receives {"events": [{"event": ..., "data": ...}, ...]}
+    (gzip-compressed unless compress=False) and replies with {"results": [...]} in the
+    same order; an item containing an "error" key fails only that event's Future.
+    """
+
+    def __init__(
+        self,
+        client: GlobalConnect,
+        max_batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_buffer: int = 10000,
+        compress: bool = True,
+        compress_level: int = 5,
+        endpoint: str = "/batches/events",
+        block: bool = True,
+        submit_timeout: Optional[float] = None,
+        flush_on_exit: bool = True,
+        on_result: Optional[Callable[[str, Dict, Any, Optional[Exception]], None]] = None
+    ):
+        """
+        :param max_batch_size: Events per HTTP request
+        :param flush_interval: Max seconds an event waits in the buffer
+        :param max_buffer: Max pending events before submit() applies backpressure
+        :param block: Block submit() when the buffer is full (False raises immediately)
+        :param submit_timeout: Max seconds a blocked submit() waits before raising
+        :param on_result: Optional callback(event, data, result, error) per event
+        """
+        if max_batch_size < 1 or max_buffer < max_batch_size:
+            raise ValueError("Require 1 <= max_batch_size <= max_buffer")
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.compress = compress
+        self.compress_level = compress_level
+        self.endpoint = endpoint
+        self.block = block
+        self.submit_timeout = submit_timeout
+        self.on_result = on_result
+
+        self._buffer: deque = deque()
+        self._cond = threading.Condition()
+        self._inflight = 0
+        self._flush_requested = False
+        self._closed = False
+        self.stats = {"submitted": 0, "succeeded": 0, "failed": 0, "batches": 0, "bytes_sent": 0}
+
+        self._worker = threading.Thread(target=self._run, name="GlobalConnectEventBatcher", daemon=True)
+        self._worker.start()
+        self._flush_on_exit = flush_on_exit
+        if flush_on_exit:
+            atexit.register(self.close)
+
+    def submit(self, event: str, data: Dict) -> "futures.Future":
+        """Queue an event for bulk submission. Returns a Future for its result."""
+        future = futures.Future()
+        with self._cond:
+            if self._closed:
+                raise GlobalConnectError("EventBatcher is closed")
+            if len(self._buffer) >= self.max_buffer:
+                if not self.block:
+                    raise GlobalConnectError("Event buffer is full")
+                deadline = None if self.submit_timeout is None else time.monotonic() + self.submit_timeout
+                while len(self._buffer) >= self.max_buffer and not self._closed:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise GlobalConnectError("Timed out waiting for space in event buffer")
+                    self._cond.wait(remaining)
+                if self._closed:
+                    raise GlobalConnectError("EventBatcher is closed")
+            self._buffer.append((event, data, future))
+            self.stats["submitted"] += 1
+            if len(self._buffer) >= self.max_batch_size:
+                self._cond.notify_all()
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Send everything buffered now and wait for it. Returns False on timeout."""
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: not self._buffer and not self._inflight, timeout)
+
+    def close(self, timeout: Optional[float] = None):
+        """Flush pending events and stop the background worker."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._worker.join(timeout)
+        if self._flush_on_exit:
+            atexit.unregister(self.close)
+
+    def __enter__(self) -> "EventBatcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                deadline = time.monotonic() + self.flush_interval
+                while (
+                    len(self._buffer) < self.max_batch_size
+                    and not self._flush_requested
+                    and not self._closed
+                ):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if not self._buffer:
+                    self._flush_requested = False
+                    self._cond.notify_all()
+                    if self._closed:
+                        return
+                    continue
+                count = min(len(self._buffer), self.max_batch_size)
+                batch = [self._buffer.popleft() for _ in range(count)]
+                self._inflight += 1
+                self._cond.notify_all()  # Wake producers blocked on a full buffer
+            try:
+                self._send(batch)
+            finally:
+                with self._cond:
+                    self._inflight -= 1
+                    self._cond.notify_all()
+
+    def _send(self, batch: List[tuple]):
+        try:
+            body = _encode_json(
+                self.client.json_codec, {"events": [{"event": event, "data": data} for event, data, _ in batch]}
+            )
+            headers = {"Content-Type": "application/json"}
+            if self.compress:
+                import gzip
+                body = gzip.compress(body, compresslevel=self.compress_level)
+                headers["Content-Encoding"] = "gzip"
+            self.stats["batches"] += 1
+            self.stats["bytes_sent"] += len(body)
+            response = self.client._request("POST", self.endpoint, data=body, headers=headers)
+        except Exception as e:
+            logger.error(f"Batch of {len(batch)} events failed: {e}")
+            for event, data, future in batch:
+                self._complete(event, data, future, None, e)
+            return
+
+        results = response.get("results") if isinstance(response, dict) else None
+        if not isinstance(results, list) or len(results) != len(batch):
+            results = [response] * len(batch)
+        for (event, data, future), result in zip(batch, results):
+            if isinstance(result, dict) and result.get("error"):
+                self._complete(event, data, future, None, GlobalConnectError(str(result["error"])))
+            else:
+                self._complete(event, data, future, result, None)
+
+    def _complete(self, event: str, data: Dict, future: "futures.Future", result: Any, error: Optional[Exception]):
+        if error is None:
+            self.stats["succeeded"] += 1
+            future.set_result(result)
+        else:
+            self.stats["failed"] += 1
+            future.set_exception(error)
+        if self.on_result is not None:
+            try:
+                self.on_result(event, data, result, error)
+            except Exception as e:
+                logger.warning(f"EventBatcher on_result callback failed: {e}")
+
+
+class WebhookReceiver:
+    """
+    asyncio webhook receiver (aiohttp.web).
+    - Verifies X-GC-Secret in constant time, acknowledges with 204 and enqueues the
+      payload into a bounded queue; answers 503 + Retry-After when the queue is full.
+    - A pool of `concurrency` workers drains the queue; coroutine handlers are awaited,
+      plain functions run in the default thread pool.
+    - Deliveries are de-duplicated by Idempotency-Key header (or payload "id").
+    Usage:
+        WebhookReceiver(handler, events=["onboarding"], secret="...").run(port=8080)
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Dict], Any],
+        events: Optional[List[str]] = None,
+        path: str = "/webhook",
+        secret: Optional[str] = None,
+        concurrency: int = 16,
+        max_queue: int = 10000,
+        dedupe_size: int = 100000,
+        dedupe_ttl: float = 3600.0,
+        idempotency_header: str = "Idempotency-Key",
+        json_codec: Optional[JSONCodec] = None
+    ):
+        """
+        :param events: Event names to accept (None accepts all)
+        :param concurrency: Number of worker tasks calling the handler
+        :param max_queue: Max deliveries waiting for a worker
+        :param dedupe_size: Max idempotency keys remembered
+        :param dedupe_ttl: Seconds an idempotency key is remembered
+        """
+        aiohttp_web._load()
+        _configure_logging()
+        import hmac
+        self._compare_digest = hmac.compare_digest
+        self.handler = handler
+        self.events = frozenset(events) if events is not None else None
+        self.path = path
+        self._secret = secret.encode("utf-8") if secret else None
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.dedupe_size = dedupe_size
+        self.dedupe_ttl = dedupe_ttl
+        self.idempotency_header = idempotency_header
+        self.json_codec = json_codec or get_json_codec()
+        self._is_coroutine = asyncio.iscoroutinefunction(handler)
+        self._seen: "OrderedDict[str, float]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List["asyncio.Task"] = []
+        self._runner = None
+        self.metrics = {
+            "received": 0,
+            "accepted": 0,
+            "duplicates": 0,
+            "ignored": 0,
+            "unauthorized": 0,
+            "bad_requests": 0,
+            "rejected_full": 0,
+            "processed": 0,
+            "failed": 0,
+            "in_flight": 0,
+            "max_queue_depth": 0,
+        }
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.metrics, "queue_depth": self.queue_depth}
+
+    def _is_duplicate(self, key: str) -> bool:
+        now = time.monotonic()
+        seen = self._seen
+        while seen:
+            expires = next(iter(seen.values()))
+            if expires > now and len(seen) < self.dedupe_size:
+                break
+            seen.popitem(last=False)
+        if key in seen:
+            return True
+        seen[key] = now + self.dedupe_ttl
+        return False
+
+    async def _handle(self, request: "aiohttp.web.Request") -> "aiohttp.web.Response":
+        web = aiohttp_web
+        metrics = self.metrics
+        metrics["received"] += 1
+        if self._secret is not None:
+            provided = request.headers.get("X-GC-Secret", "").encode("utf-8")
+            if not self._compare_digest(provided, self._secret):
+                metrics["unauthorized"] += 1
+                return web.Response(status=401)
+        try:
+            payload = self.json_codec.loads(await request.read())
+        except ValueError:
+            metrics["bad_requests"] += 1
+            return web.Response(status=400)
+        if not isinstance(payload, dict):
+            metrics["bad_requests"] += 1
+            return web.Response(status=400)
+        if self.events is not None and payload.get("event") not in self.events:
+            metrics["ignored"] += 1
+            return web.Response(status=204)
+        key = request.headers.get(self.idempotency_header) or payload.get("id")
+        if key is not None and self._is_duplicate(str(key)):
+            metrics["duplicates"] += 1
+            return web.Response(status=204)
+        try:
+            self._queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            if key is not None:
+                self._seen.pop(str(key), None)  # Let the sender's retry through
+            metrics["rejected_full"] += 1
+            return web.Response(status=503, headers={"Retry-After": "1"})
+        metrics["accepted"] += 1
+        depth = self._queue.qsize()
+        if depth > metrics["max_queue_depth"]:
+            metrics["max_queue_depth"] = depth
+        return web.Response(status=204)
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            payload = await queue.get()
+            self.metrics["in_flight"] += 1
+            try:
+                if self._is_coroutine:
+                    await self.handler(payload)
+                else:
+                    await loop.run_in_executor(None, self.handler, payload)
+                self.metrics["processed"] += 1
+            except Exception as e:
+                self.metrics["failed"] += 1
+                logger.error(f"Webhook handler failed: {e}")
+            finally:
+                self.metrics["in_flight"] -= 1
+                queue.task_done()
+
+    def make_app(self) -> "aiohttp.web.Application":
+        """Build the aiohttp application (for mounting into an existing server)."""
+        app = aiohttp_web.Application()
+        app.router.add_post(self.path, self._handle)
+        app.on_startup.append(self._on_startup)
+        app.on_cleanup.append(self._on_cleanup)
+        return app
+
+    async def _on_startup(self, app):
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._workers = [asyncio.ensure_future(self._worker()) for _ in range(self.concurrency)]
+
+    async def _on_cleanup(self, app, drain_timeout: float = 10.0):
+        if self._queue is not None and self._queue.qsize():
+            try:
+                await asyncio.wait_for(self._queue.join(), drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Dropping {self._queue.qsize()} undelivered webhooks on shutdown")
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def start(self, host: str = "0.0.0.0", port: int = 8080):
+        """Start serving in the running event loop."""
+        self._runner = aiohttp_web.AppRunner(self.make_app(), access_log=None)
+        await self._runner.setup()
+        await aiohttp_web.TCPSite(self._runner, host, port, backlog=1024).start()
+        logger.info(f"Listening for webhooks on {host}:{port}{self.path} for events: {sorted(self.events) if self.events is not None else 'all'}")
+
+    async def stop(self):
+        """Stop accepting deliveries, drain the queue and stop the workers."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def run(self, host: str = "0.0.0.0", port: int = 8080):
+        """Serve until interrupted (blocking)."""
+        logger.info(f"Listening for webhooks on {host}:{port}{self.path} for events: {sorted(self.events) if self.events is not None else 'all'}")
+        aiohttp_web.run_app(self.make_app(), host=host, port=port, access_log=None, print=None, backlog=1024)
+
+
+class AsyncGlobalConnect:
+    """
+    Long-lived asyncio client with the same partner APIs as GlobalConnect.
+    Reuses one aiohttp session/connector for its whole lifetime.
+    Usage:
+        async with AsyncGlobalConnect(api_key=...) as gc:
+            await gc.trigger_event("signup", {...})
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_base: Optional[str] = None,
+        timeout: int = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        debug: bool = False,
+        max_concurrency: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        max_backoff: float = 30.0,
+        max_retry_after: float = 120.0,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        hedge: Optional[HedgePolicy] = None,
+        json_codec: Optional[JSONCodec] = None,
+        instrumentation: Optional[MetricsSink] = None,
+        http2: bool = False,
+        http2_max_streams: int = 100
+    ):
+        """
+        :param max_concurrency: Max requests in flight at once (also caps open connections)
+        :param limit_per_host: Max connections per host (0 = only max_concurrency applies)
+        :param keepalive_timeout: Seconds an idle connection is kept for reuse
+        :param cache: Optional ResponseCache for read-only endpoints
+        :param coalesce: Share one upstream call between concurrent identical GET/HEAD requests
+        :param rate_limiter: Optional client-side RateLimiter applied before every attempt
+        :param retry_budget: Optional RetryBudget shared across endpoints (and clients)
+        :param max_backoff: Upper bound for the jittered exponential backoff, in seconds
+        :param max_retry_after: Give up instead of waiting when Retry-After exceeds this
+        :param circuit_breakers: Optional per-endpoint CircuitBreakers that fail fast when the API degrades
+        :param hedge: Optional HedgePolicy for hedged GET requests
+        :param json_codec: JSONCodec for request/response bodies (default: stdlib json;
+            get_json_codec("fast") opts in to orjson / ujson)
+        :param instrumentation: Optional MetricsSink receiving a RequestRecord per call
+        :param http2: Send through httpx with HTTP/2 so concurrent calls share one multiplexed
+            connection (needs httpx[http2]; servers without HTTP/2 are used over HTTP/1.1)
+        :param http2_max_streams: Max requests in flight at once over the HTTP/2 transport
+        """
+        aiohttp._load()
+        if http2:
+            _require_http2()
+        _configure_logging()
+        self.api_key = api_key or os.getenv("GLOBALCONNECT_API_KEY")
+        self.api_base = api_base or os.getenv("GLOBALCONNECT_API_BASE") or "http://localhost:3000"
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.rate_limiter = rate_limiter
+        self.retry_budget = retry_budget
+        self.circuit_breakers = circuit_breakers
+        self.hedge = hedge
+        self.max_concurrency = max_concurrency
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.http2 = http2
+        self.http2_max_streams = http2_max_streams
+        self.json_codec = json_codec or get_json_codec()
+        self.instrumentation = instrumentation
+        self._connections = {"opened": 0, "reused": 0}
+        self.cache = cache
+        self._single_flight = _AsyncSingleFlight() if coalesce else None
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._http2_client: Optional["httpx.AsyncClient"] = None
+        self._protocols: Dict[str, int] = {}
+        self._semaphore: Optional["asyncio.Semaphore"] = None
+
+        if debug:
+            logger.setLevel(logging.DEBUG)
+        if not self.api_key:
+            logger.error("API key is required.")
+            raise GlobalConnectError("API key is required.")
+
+        self.headers = {"Authorization": f"Bearer {self.api_key}"}
+        logger.debug(f"Initialized AsyncGlobalConnect with base: {self.api_base}")
+
+    # --------- Session Lifetime ---------
+    async def open(self) -> "AsyncGlobalConnect":
+        """Create the shared session and connector (called automatically on first request)."""
+        if self.http2:
+            if self._http2_client is None:
+                self._http2_client = httpx.AsyncClient(
+                    http2=True,
+                    limits=_http2_limits(self.limit_per_host or self.max_concurrency, self.keepalive_timeout),
+                    timeout=self.timeout,
+                )
+                self._semaphore = asyncio.Semaphore(min(self.max_concurrency, self.http2_max_streams))
+                logger.debug(f"Opened async HTTP/2 transport (streams={self.http2_max_streams})")
+            return self
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            trace_configs = []
+            if self.instrumentation is not None:
+                trace_config = aiohttp.TraceConfig()
+                trace_config.on_connection_create_end.append(self._on_connection_created)
+                trace_config.on_connection_reuseconn.append(self._on_connection_reused)
+                trace_configs.append(trace_config)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                trace_configs=trace_configs,
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            logger.debug(
+                f"Opened async session (concurrency={self.max_concurrency}, per_host={self.limit_per_host})"
+            )
+        return self
+
+    async def _on_connection_created(self, session, ctx, params):
+        self._connections["opened"] += 1
+
+    async def _on_connection_reused(self, session, ctx, params):
+        self._connections["reused"] += 1
+
+    def connection_stats(self) -> Dict[str, Any]:
+        """Connections opened vs reused (tracked only while instrumentation is attached)."""
+        if self.http2:
+            opened, sent = _open_connections(self._http2_client), sum(self._protocols.values())
+            return {
+                "connections_opened": opened,
+                "requests": sent,
+                "reuse_ratio": 1 - opened / sent if sent else 0.0,
+                "protocols": dict(self._protocols),
+            }
+        opened, reused = self._connections["opened"], self._connections["reused"]
+        sent = opened + reused
+        return {"connections_opened": opened, "requests": sent, "reuse_ratio": reused / sent if sent else 0.0}
+
+    async def close(self):
+        """Close the shared session and all pooled connections."""
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
+            logger.debug("Closed async session")
+        client, self._http2_client = self._http2_client, None
+        if client is not None:
+            await client.aclose()
+            logger.debug("Closed async HTTP/2 transport")
+
+    async def __aenter__(self) -> "AsyncGlobalConnect":
+        return await self.open()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        json: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        retries: Optional[int] = None,
+        headers: Optional[Dict] = None,
+        **kwargs
+    ) -> Any:
+        method = method.upper()
+        if self._single_flight is not None and method in _IDEMPOTENT_METHODS and json is None and not kwargs:
+            key = _coalesce_key(
+                method, f"{self.api_base}{endpoint}", params, {**self.headers, **headers} if headers else self.headers
+            )
+        else:
+            key = None
+        if key is not None:
+            return await self._single_flight.do(
+                key,
+                lambda: self._send_request(method, endpoint, params=params, retries=retries, headers=headers),
+            )
+        return await self._send_request(
+            method, endpoint, json=json, params=params, retries=retries, headers=headers, **kwargs
+        )
+
+    async def _send_request(self, method: str, endpoint: str, **kwargs) -> Any:
+        sink = self.instrumentation
+        if sink is None:
+            return await self._perform(None, method, endpoint, **kwargs)
+        record = RequestRecord(method, endpoint)
+        started = time.perf_counter()
+        try:
+            return await self._perform(record, method, endpoint, **kwargs)
+        except Exception as e:
+            record.error = str(e) or type(e).__name__
+            raise
+        finally:
+            record.latency = time.perf_counter() - started
+            _emit(sink, record)
+
+    async def _perform(
+        self,
+        record: Optional[RequestRecord],
+        method: str,
+        endpoint: str,
+        *,
+        json: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        retries: Optional[int] = None,
+        headers: Optional[Dict] = None,
+        **kwargs
+    ) -> Any:
+        await self.open()
+        url = f"{self.api_base}{endpoint}"
+        attempts = retries if retries is not None else self.max_retries
+        request_headers = {**self.headers, **headers} if headers else self.headers
+
+        cache_key, cache_ttl = None, 0.0
+        if self.cache is not None and method == "GET":
+            cache_ttl = self.cache.ttl_for(endpoint)
+            if cache_ttl > 0:
+                cache_key = self.cache.make_key(url, params, request_headers.get("Authorization"))
+                body = self.cache.get_fresh(cache_key)
+                if body is not None:
+                    logger.debug("Cache hit %s", url)
+                    if record is not None:
+                        record.cache = "hit"
+                    return _decode_json(self.json_codec, body)
+                etag = self.cache.etag_for(cache_key)
+                if etag:
+                    request_headers = {**request_headers, "If-None-Match": etag}
+
+        if json is not None:
+            kwargs["data"] = _encode_json(self.json_codec, json)
+            request_headers = {**request_headers, "Content-Type": "application/json"}
+        if record is not None and isinstance(kwargs.get("data"), (bytes, bytearray, str)):
+            record.bytes_sent = len(kwargs["data"])
+        breaker = self.circuit_breakers.get(endpoint) if self.circuit_breakers is not None else None
+        hedge = self.hedge if method == "GET" else None
+        if self.retry_budget is not None:
+            self.retry_budget.record_request()
+        for attempt in range(1, attempts + 1):
+            if record is not None:
+                record.attempts = attempt
+            if breaker is not None and not breaker.allow():
+                raise CircuitOpenError(f"Circuit open for {endpoint}")
+            settled = breaker is None  # Whether the breaker has this attempt's outcome
+            retry_after = None
+            try:
+                if self.rate_limiter is not None:
+                    wait = self.rate_limiter.reserve(endpoint, self.api_key)
+                    if wait > 0:
+                        if record is not None:
+                            record.throttle_seconds += wait
+                        await asyncio.sleep(wait)
+                logger.debug("Async request %s %s attempt %d", method, url, attempt)
+
+                running = asyncio.Event() if hedge is not None else None
+
+                def send():
+                    return self._fetch(method, url, running, headers=request_headers, params=params, **kwargs)
+
+                resp, body = await (hedge.acall(endpoint, send, running) if hedge is not None else send())
+                if record is not None:
+                    record.status = resp.status
+                    record.bytes_received += len(body)
+                if breaker is not None:
+                    breaker.record(resp.status not in _BREAKER_FAILURE_STATUSES)
+                    settled = True
+                resp.raise_for_status()
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Async response: %s %s", resp.status, _preview(body))
+                if cache_key is not None:
+                    if resp.status == 304:
+                        cached = self.cache.revalidated(cache_key, cache_ttl)
+                        if cached is not None:
+                            if record is not None:
+                                record.cache = "revalidated"
+                            return _decode_json(self.json_codec, cached)
+                    else:
+                        self.cache.put(cache_key, body, resp.headers.get("ETag"), cache_ttl)
+                if not body:
+                    return None
+                if resp.content_type == "application/json":
+                    return _decode_json(self.json_codec, body)
+                return body.decode(resp.charset or "utf-8")
+            except aiohttp.ClientResponseError as e:
+                if e.status not in _RETRY_STATUSES:
+                    logger.error(f"Async request failed: {e}")
+                    raise GlobalConnectError(f"Async HTTP error: {e}")
+                retry_after = _parse_retry_after(e.headers.get("Retry-After") if e.headers else None)
+                error: Exception = e
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if not settled:
+                    breaker.record(False)
+                    settled = True
+                error = e
+            except BaseException as e:
+                if not settled:
+                    _settle_breaker(breaker, e)
+                raise
+            logger.warning(f"Async request failed: {error!r}")
+            _check_retry(self, attempt, attempts, retry_after, error, "Async HTTP error")
+            delay = _backoff_delay(self.backoff_factor, self.max_backoff, attempt, retry_after)
+            if record is not None:
+                record.backoff_seconds += delay
+            await asyncio.sleep(delay)
+
+    async def _fetch(
+        self, method: str, url: str, running: Optional["asyncio.Event"] = None, **kwargs
+    ) -> Tuple["aiohttp.ClientResponse", bytes]:
+        """
+        Send one request and read its body so the connection returns to the pool.
+        Sets `running` (if given) once past the concurrency limit.
+        """
+        async with self._semaphore:
+            if running is not None:
+                running.set()
+            if self.http2:
+                return await self._fetch_http2(method, url, **kwargs)
+            async with self._session.request(method, url, **kwargs) as resp:
+                return resp, await resp.read()
+
+    async def _fetch_http2(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        data: Any = None
+    ) -> Tuple[_HTTP2Response, bytes]:
+        try:
+            response = await self._http2_client.request(
+                method, url, headers=_http2_headers(headers or {}), params=params, content=data
+            )
+        except httpx.TimeoutException as e:
+            raise asyncio.TimeoutError(str(e)) from e
+        except httpx.TransportError as e:
+            raise aiohttp.ClientConnectionError(str(e)) from e
+        _count_protocol(self._protocols, response.http_version)
+        return _HTTP2Response(response, method, url), response.content
+
+    # --------- Partner APIs ---------
+    async def get_status(self) -> Dict:
+        """Get partner integration status"""
+        return await self._request("GET", "/partners/status")
+
+    async def trigger_event(self, event: str, data: Dict) -> Dict:
+        """Trigger a custom event"""
+        return await self._request("POST", f"/events/{event}", json=data)
+
+    async def register_webhook(self, events: List[str], url: str) -> Dict:
+        """Register a webhook for partner events"""
+        return await self._request("POST", "/webhooks/register", json={"events": events, "url": url})
+
+    async def get_analytics(self) -> Dict:
+        """Get analytics for partner"""
+        return await self._request("GET", "/partners/analytics")
+
+    async def get_compliance(self) -> Dict:
+        """Get compliance status (if available)"""
+        return await self._request("GET", "/partners/compliance")
+
+    async def get_recommendations(self) -> Dict:
+        """Get AI-powered partner recommendations (if available)"""
+        return await self._request("GET", "/partners/recommendations")
+
+    async def custom_endpoint(self, method: str, endpoint: str, **kwargs) -> Any:
+        """Call a custom endpoint (advanced/extensible)"""
+        return await self._request(method, endpoint, **kwargs)
+
+    # --------- Streaming Pagination ---------
+    async def iter_pages(
+        self,
+        endpoint: str,
+        page_size: int = 1000,
+        params: Optional[Dict] = None,
+        prefetch: bool = True,
+        records_key: str = "records",
+        cursor_key: str = "next_cursor"
+    ) -> AsyncIterator[Any]:
+        """
+        Async version of GlobalConnect.iter_pages (same page contract): yields records
+        page by page, fetching the next page in a background task while the current one
+        is consumed. Page requests bypass request coalescing, so stopping early really
+        cancels the prefetch.
+        Usage:
+            async for record in gc.iter_analytics(page_size=5000): ...
+        """
+        base_params = {**(params or {}), "limit": page_size}
+
+        def fetch(cursor: Optional[str]):
+            page_params = {**base_params, "cursor": cursor} if cursor else base_params
+            return self._send_request("GET", endpoint, params=page_params)
+
+        pending = None
+        try:
+            records, cursor = _split_page(await fetch(None), records_key, cursor_key, first=True)
+            while True:
+                if cursor and prefetch:
+                    pending = asyncio.ensure_future(fetch(cursor))
+                for record in records:
+                    yield record
+                records = None
+                if not cursor:
+                    return
+                page = await pending if pending is not None else await fetch(cursor)
+                pending = None
+                records, cursor = _split_page(page, records_key, cursor_key, first=False)
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    def iter_analytics(self, page_size: int = 1000, **kwargs) -> AsyncIterator[Dict]:
+        """Stream partner analytics records page by page (see iter_pages)."""
+        return self.iter_pages("/partners/analytics", page_size=page_size, **kwargs)
+
+    # --------- Advanced Features ---------
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of circuit breaker states, hedging, cache, connection reuse and request metrics."""
+        return {
+            "circuit_breakers": self.circuit_breakers.stats() if self.circuit_breakers is not None else {},
+            "hedge": self.hedge.stats() if self.hedge is not None else None,
+            "cache": self.cache.stats() if self.cache is not None else None,
+            "connections": self.connection_stats(),
+            "metrics": self.instrumentation.snapshot() if isinstance(self.instrumentation, InMemoryMetrics) else None,
+        }
+
     def set_debug(self, enabled: bool = True):
         """Enable or disable debug logging for SDK."""
         logger.setLevel(logging.DEBUG if enabled else logging.INFO)
@@ -207,17 +2584,20 @@ if __name__ == "__main__":
     gc = GlobalConnect(api_key=key, debug=True)
 
     try:
-        print("Partner status:", gc.get_status())
-        print("Analytics:", gc.get_analytics())
-        print("Compliance:", gc.get_compliance())
-        print("Recommendations:", gc.get_recommendations())
-        print("Register webhook:", gc.register_webhook(["onboarding", "error"], "https://your.site/webhook"))
+        with gc:
+            print("Partner status:", gc.get_status())
+            print("Analytics:", gc.get_analytics())
+            print("Compliance:", gc.get_compliance())
+            print("Recommendations:", gc.get_recommendations())
+            print("Register webhook:", gc.register_webhook(["onboarding", "error"], "https://your.site/webhook"))
     except GlobalConnectError as e:
         logger.error(f"SDK error: {e}")
 
     # To use async methods:
-    # import asyncio
-    # asyncio.run(gc.async_get_status())
+    # async def main():
+    #     async with AsyncGlobalConnect(api_key=key, max_concurrency=200) as agc:
+    #         await asyncio.gather(*(agc.trigger_event("ping", {"n": i}) for i in range(1000)))
+    # asyncio.run(main())
 
     # To run a webhook listener:
     # def handler(payload):
@@ -0,0 +1,192 @@
+# tests/test_pi_ai_agent.py
+#
+# LLM calls of the Pi auto-connector agent (apps/ai/pi_auto_connector/ai_agent.py), made
+# against a stub AsyncOpenAI client: the timeout fallback, the max_concurrency cap and
+# cancellation reaching the in-flight request, and micro-batching of params requests.
+
+import asyncio
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("openai")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "apps", "ai"))
+
+from pi_auto_connector.ai_agent import AIAgent  # noqa: E402
+from pi_auto_connector.params_cache import ConnectionParamsCache  # noqa: E402
+
+
+class _StubClient:
+    """Stands in for openai.AsyncOpenAI; every completion waits for `gate` and echoes `reply`."""
+
+    def __init__(self, reply="ok", delay=0.0):
+        self.reply = reply
+        self.delay = delay
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.prompts = []
+        self.in_flight = 0
+        self.peak = 0
+        self.cancelled = 0
+        self.closed = False
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, model, messages, max_tokens, temperature):
+        self.prompts.append(messages[0]["content"])
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await self.gate.wait()
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        reply = self.reply(messages[0]["content"]) if callable(self.reply) else self.reply
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=reply))])
+
+    async def close(self):
+        self.closed = True
+
+
+def _agent(client, **kwargs):
+    agent = AIAgent(openai_api_key="test", **kwargs)
+    agent._client = client
+    return agent
+
+
+def test_reply_is_returned_and_client_closed():
+    async def main():
+        client = _StubClient(reply="  parallel-scan \n")
+        agent = _agent(client)
+        result = await agent.select_discovery_strategy()
+        await agent.aclose()
+        return result, client, agent.stats
+
+    result, client, stats = asyncio.run(main())
+    assert result == "parallel-scan" and client.closed
+    assert (stats["calls"], stats["timeouts"], stats["failures"], stats["in_flight"]) == (1, 0, 0, 0)
+
+
+def test_timeout_falls_back_to_default_answer():
+    async def main():
+        client = _StubClient(delay=5)
+        agent = _agent(client, timeout=0.05)
+        strategy = await agent.select_discovery_strategy()
+        params = await agent.get_connection_params({"id": "n1"})
+        return strategy, params, client, agent.stats
+
+    strategy, params, client, stats = asyncio.run(main())
+    assert strategy == "default-strategy"
+    assert params == {"handshake": True, "retries": 3, "timeout": 10}
+    assert stats["timeouts"] == 2 and stats["in_flight"] == 0 and client.cancelled == 2
+
+
+def test_api_error_falls_back_to_default_answer():
+    async def main():
+        client = _StubClient()
+
+        async def fail(**kwargs):
+            raise RuntimeError("boom")
+
+        client.chat.completions.create = fail
+        agent = _agent(client)
+        return await agent.suggest_fix({"id": "n1"}, "refused"), agent.stats
+
+    fix, stats = asyncio.run(main())
+    assert fix == "{}" and stats["failures"] == 1 and stats["in_flight"] == 0
+
+
+def test_concurrency_is_capped():
+    async def main():
+        client = _StubClient()
+        client.gate.clear()
+        agent = _agent(client, max_concurrency=3)
+        calls = [asyncio.ensure_future(agent.suggest_fix({"id": f"n{i}"}, "refused")) for i in range(10)]
+        for _ in range(20):
+            await asyncio.sleep(0)
+        waiting = (client.in_flight, agent.stats["in_flight"], agent.stats["calls"])
+        client.gate.set()
+        results = await asyncio.gather(*calls)
+        return waiting, results, client.peak
+
+    waiting, results, peak = asyncio.run(main())
+    assert waiting == (3, 3, 3) and peak == 3
+    assert results == ["ok"] * 10
+
+
+def test_cancelling_caller_cancels_request():
+    async def main():
+        client = _StubClient()
+        client.gate.clear()
+        agent = _agent(client, max_concurrency=1)
+        first = asyncio.ensure_future(agent.select_discovery_strategy())
+        second = asyncio.ensure_future(agent.select_discovery_strategy())
+        for _ in range(10):
+            await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        client.gate.set()
+        return await second, client, agent.stats
+
+    result, client, stats = asyncio.run(main())
+    assert client.cancelled == 1 and result == "ok"
+    assert stats["calls"] == 2 and stats["timeouts"] == 0 and stats["failures"] == 0 and stats["in_flight"] == 0
+
+
+def _batch_reply(answer):
+    """Stub reply for batched prompts: maps every node key in the prompt through `answer`."""
+
+    def reply(prompt):
+        nodes = json.loads(prompt.split("Nodes:\n", 1)[1].split("\nReply", 1)[0])
+        return json.dumps({key: answer(node) for key, node in nodes.items() if answer(node) is not None})
+
+    return reply
+
+
+def test_batch_falls_back_per_item():
+    async def main():
+        client = _StubClient(reply=_batch_reply(lambda node: None if node["id"] == "bad" else {"retries": node["id"]}))
+        agent = _agent(client, batch_window=0.01)
+        results = await asyncio.gather(*(agent.get_connection_params({"id": i}) for i in ("a", "bad", "b")))
+        return results, client, agent.stats
+
+    results, client, stats = asyncio.run(main())
+    assert results == [{"retries": "a"}, {"handshake": True, "retries": 3, "timeout": 10}, {"retries": "b"}]
+    assert len(client.prompts) == 1 and stats["batches"] == 1 and stats["batched_items"] == 3
+    assert stats["batch_fallbacks"] == 1
+
+
+def test_full_batch_is_sent_without_waiting_for_window():
+    async def main():
+        client = _StubClient(reply=_batch_reply(lambda node: {"retries": node["id"]}))
+        agent = _agent(client, batch_window=60, max_batch_size=3)
+        calls = [asyncio.ensure_future(agent.get_connection_params({"id": f"n{i}"})) for i in range(4)]
+        first = await asyncio.wait_for(asyncio.gather(*calls[:3]), 1)
+        pending = not calls[3].done()
+        calls[3].cancel()
+        return first, pending, client, agent.stats
+
+    first, pending, client, stats = asyncio.run(main())
+    assert first == [{"retries": "n0"}, {"retries": "n1"}, {"retries": "n2"}] and pending
+    assert len(client.prompts) == 1 and stats["batched_items"] == 3
+
+
+def test_batch_dedupes_on_cache_fingerprint():
+    async def main():
+        client = _StubClient(reply=_batch_reply(lambda node: {"retries": 7}))
+        cache = ConnectionParamsCache(fields=["host"])
+        agent = _agent(client, batch_window=0.01, params_cache=cache)
+        nodes = [{"id": "a", "host": "h1"}, {"id": "b", "host": "h1"}, {"id": "c", "host": "h2"}]
+        results = await asyncio.gather(*(agent.get_connection_params(node) for node in nodes))
+        return results, client, agent.stats, cache
+
+    results, client, stats, cache = asyncio.run(main())
+    assert results == [{"retries": 7}] * 3
+    assert len(client.prompts) == 1 and stats["batched_items"] == 2 and len(cache) == 2
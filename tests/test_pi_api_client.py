@@ -0,0 +1,107 @@
+# tests/test_pi_api_client.py
+#
+# Pi API client of the Pi auto-connector (apps/ai/pi_auto_connector/pi_api_client.py):
+# the pooled httpx.AsyncClient is created lazily, reused across calls (one keep-alive
+# connection) and closed by aclose().
+
+import asyncio
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("httpx")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "apps", "ai"))
+
+from pi_auto_connector.pi_api_client import AsyncPiClient  # noqa: E402
+
+
+class _PiHandler(BaseHTTPRequestHandler):
+    """Minimal Pi API; records the client port and Authorization header of every request."""
+
+    protocol_version = "HTTP/1.1"
+    seen = []
+
+    def _reply(self, payload):
+        type(self).seen.append((self.client_address[1], self.headers.get("Authorization")))
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.startswith("/nodes?"):
+            self._reply({"nodes": [{"id": "n1"}]})
+        else:
+            self._reply({"status": "healthy"})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self._reply({"connected": True})
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api_base():
+    _PiHandler.seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PiHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+
+
+def test_client_is_created_lazily_and_reused(api_base):
+    async def main():
+        pi = AsyncPiClient(api_base, "key")
+        assert pi._client is None
+        nodes = await pi.discover_nodes()
+        client = pi._client
+        assert await pi.check_node_health("n1")
+        assert await pi.connect_node("n1", {"retries": 3}) == {"connected": True}
+        assert pi._client is client and pi.client is client
+        await pi.aclose()
+        return nodes, client, pi
+
+    nodes, client, pi = asyncio.run(main())
+    assert nodes == [{"id": "n1"}]
+    assert client.is_closed and pi._client is None
+    assert len({port for port, _ in _PiHandler.seen}) == 1
+    assert {auth for _, auth in _PiHandler.seen} == {"Bearer key"}
+
+
+def test_aclose_then_reuse_opens_fresh_pool(api_base):
+    async def main():
+        pi = AsyncPiClient(api_base, "key")
+        await pi.aclose()  # Nothing opened yet
+        await pi.get_node_info("n1")
+        first = pi._client
+        await pi.aclose()
+        await pi.get_node_info("n1")
+        second = pi._client
+        await pi.aclose()
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert first is not second and first.is_closed and second.is_closed
+    assert len({port for port, _ in _PiHandler.seen}) == 2
+
+
+def test_context_manager_closes_client(api_base):
+    async def main():
+        async with AsyncPiClient(api_base, "key", max_connections=2) as pi:
+            await pi.reconnect_node("n1")
+            client = pi._client
+        return client, pi
+
+    client, pi = asyncio.run(main())
+    assert client.is_closed and pi._client is None
@@ -0,0 +1,128 @@
+# tests/test_pi_connect_nodes.py
+#
+# Connection fan-out of the Pi auto-connector (apps/ai/pi_auto_connector/connector.py):
+# HostFairQueue hands nodes out round-robin across hosts under a per-host cap, and
+# connect_nodes() bounds the attempts in flight and cancels them when the caller
+# abandons the iterator.
+
+import asyncio
+import os
+import sys
+from collections import Counter
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "apps", "ai"))
+
+pytest.importorskip("httpx")
+pytest.importorskip("openai")
+
+from pi_auto_connector.connector import HostFairQueue, PiAutoConnector  # noqa: E402
+
+
+def _nodes(spec):
+    """{"a": 3, "b": 1} -> a0, a1, a2 on host a and b0 on host b."""
+    return [{"id": f"{host}{i}", "host": f"{host}.example:31400"} for host, count in spec.items() for i in range(count)]
+
+
+def test_queue_round_robins_across_hosts():
+    queue = HostFairQueue(per_host_limit=10)
+    for node in _nodes({"a": 3, "b": 2, "c": 1}):
+        queue.put(node)
+    order = []
+    while queue:
+        host, node = queue.pop()
+        order.append(node["id"])
+    assert order == ["a0", "b0", "c0", "a1", "b1", "a2"]
+    assert queue.pop() is None
+
+
+def test_queue_respects_per_host_limit():
+    queue = HostFairQueue(per_host_limit=2)
+    for node in _nodes({"a": 4, "b": 1}):
+        queue.put(node)
+    popped = [queue.pop() for _ in range(3)]
+    assert [host for host, _ in popped] == ["a.example", "b.example", "a.example"]
+    assert queue.pop() is None and len(queue) == 2
+    queue.release("a.example")
+    assert queue.pop()[1]["id"] == "a2" and queue.pop() is None
+
+
+class _Connector(PiAutoConnector):
+    """Connector whose connection attempts only track concurrency and wait for `gate` (unless in `fast`)."""
+
+    def __init__(self, **kwargs):
+        super().__init__("http://127.0.0.1:9", "key", "key", **kwargs)
+        self.gate = asyncio.Event()
+        self.fast = set()
+        self.started = []
+        self.active = Counter()
+        self.peak_total = 0
+        self.peak_host = 0
+        self.cancelled = 0
+
+    async def connect_node_with_ai(self, node):
+        host = node["host"]
+        self.started.append(node["id"])
+        self.active[host] += 1
+        self.peak_total = max(self.peak_total, sum(self.active.values()))
+        self.peak_host = max(self.peak_host, self.active[host])
+        try:
+            if node["id"] not in self.fast:
+                await self.gate.wait()
+            await asyncio.sleep(0)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.active[host] -= 1
+        return {"node": node["id"], "status": "connected"}
+
+
+def test_connect_nodes_bounds_concurrency_per_host_and_globally():
+    async def main():
+        connector = _Connector(max_concurrency=5, per_host_limit=2)
+        connector.gate.set()
+        results = [result async for result in connector.connect_nodes(_nodes({"a": 6, "b": 6, "c": 1}))]
+        return connector, results
+
+    connector, results = asyncio.run(main())
+    assert len(results) == 13 and connector.peak_total == 5 and connector.peak_host == 2
+    assert connector.started[:5] == ["a0", "b0", "c0", "a1", "b1"]
+    progress = connector.connection_progress()
+    assert (progress["completed"], progress["connected"], progress["in_flight"], progress["queued"]) == (13, 13, 0, 0)
+
+
+def test_abandoned_iterator_cancels_attempts_in_flight():
+    async def main():
+        connector = _Connector(max_concurrency=4, per_host_limit=4)
+        results = connector.connect_nodes(_nodes({"a": 3, "b": 3}))
+        first = asyncio.ensure_future(results.__anext__())
+        for _ in range(5):
+            await asyncio.sleep(0)
+        in_flight = sum(connector.active.values())
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        await results.aclose()
+        return connector, in_flight, connector.cancelled, sum(connector.active.values())
+
+    connector, in_flight, cancelled, active = asyncio.run(main())
+    assert in_flight == 4 and cancelled == 4 and active == 0 and len(connector.started) == 4
+    assert connector.connection_progress()["in_flight"] == 0
+
+
+def test_breaking_out_of_iterator_cancels_attempts_in_flight():
+    async def main():
+        connector = _Connector(max_concurrency=3, per_host_limit=4)
+        connector.fast.add("b0")
+        results = connector.connect_nodes(_nodes({"a": 3, "b": 3}))
+        async for result in results:
+            break
+        await results.aclose()
+        return connector, result, connector.cancelled, sum(connector.active.values())
+
+    connector, result, cancelled, active = asyncio.run(main())
+    assert result == {"node": "b0", "status": "connected"}
+    assert cancelled == 2 and active == 0
+    assert connector.connection_progress()["completed"] == 1
@@ -0,0 +1,51 @@
+# tests/test_pi_discovery_retire.py
+#
+# Node retirement in the Pi auto-connector's discovery diff
+# (apps/ai/pi_auto_connector/connector.py): an empty or truncated /nodes response
+# must not wipe the registry.
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "apps", "ai"))
+
+pytest.importorskip("httpx")
+pytest.importorskip("openai")
+
+from pi_auto_connector.connector import PiAutoConnector  # noqa: E402
+from pi_auto_connector.node_state import NodeState, NodeStatus  # noqa: E402
+
+
+def _nodes(count):
+    return [{"id": f"node-{i}", "host": f"10.0.0.{i}"} for i in range(count)]
+
+
+@pytest.fixture
+def connector():
+    connector = PiAutoConnector("http://127.0.0.1:9", "key", "key")
+    for node in _nodes(10):
+        connector.connected_nodes[node["id"]] = NodeState(
+            node["id"], NodeStatus.CONNECTED, connector.metadata_store, metadata=node
+        )
+    return connector
+
+
+def test_missing_node_is_retired_after_two_passes(connector):
+    assert connector.diff_discovery(_nodes(9)) == ([], [])
+    assert connector.diff_discovery(_nodes(9)) == ([], ["node-9"])
+
+
+def test_reappearing_node_resets_missed_count(connector):
+    connector.diff_discovery(_nodes(9))
+    connector.diff_discovery(_nodes(10))
+    assert connector.diff_discovery(_nodes(9)) == ([], [])
+
+
+@pytest.mark.parametrize("count", [0, 3])
+def test_partial_discovery_retires_nothing(connector, count):
+    for _ in range(3):
+        assert connector.diff_discovery(_nodes(count)) == ([], [])
+    assert connector.discovery_stats["partial"] == 1
+    assert all(info.missed == 0 for info in connector.connected_nodes.values())
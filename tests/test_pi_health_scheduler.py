@@ -0,0 +1,137 @@
+# tests/test_pi_health_scheduler.py
+#
+# Health-check scheduler of the Pi auto-connector (apps/ai/pi_auto_connector/health_scheduler.py),
+# driven by an injected clock: jittered first probes, the max_concurrency cap and the
+# adaptive per-node interval.
+
+import asyncio
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "apps", "ai"))
+
+from pi_auto_connector.health_scheduler import HealthCheckScheduler  # noqa: E402
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _due_times(scheduler):
+    return sorted(due for due, _ in scheduler._heap)
+
+
+def test_first_probes_are_spread_over_one_interval():
+    random.seed(7)
+    clock = _Clock()
+    scheduler = HealthCheckScheduler(60.0, clock=clock)
+    for i in range(200):
+        scheduler.add(f"node{i}")
+    offsets = [due - clock.now for due in _due_times(scheduler)]
+    assert len(offsets) == 200 and len(set(offsets)) == 200
+    assert 0 <= offsets[0] < 6 and 54 < offsets[-1] <= 60
+    assert sum(1 for offset in offsets if offset < 30) in range(70, 131)
+
+
+def test_explicit_delay_and_duplicate_add():
+    clock = _Clock()
+    scheduler = HealthCheckScheduler(60.0, clock=clock)
+    scheduler.add("a", delay=5)
+    scheduler.add("a", delay=50)
+    assert len(scheduler) == 1 and _due_times(scheduler) == [clock.now + 5]
+
+
+def test_interval_halves_on_flaps_down_to_a_quarter():
+    clock = _Clock()
+    scheduler = HealthCheckScheduler(40.0, jitter=0, clock=clock)
+    scheduler.add("a", delay=0)
+    intervals = []
+    for healthy in (True, False, True, False, True):
+        scheduler._record("a", healthy)
+        intervals.append(scheduler.stats()["mean_interval"])
+    assert intervals == [40.0, 20.0, 10.0, 10.0, 10.0]
+    stats = scheduler.stats()
+    assert stats["flaps"] == 4 and stats["flapping"] == 1
+    assert scheduler._nodes["a"].due == clock.now + 10.0  # Older heap entries are stale
+
+
+def test_interval_stretches_when_stable_up_to_four_times():
+    clock = _Clock()
+    scheduler = HealthCheckScheduler(40.0, jitter=0, stable_after=3, growth=2.0, clock=clock)
+    scheduler.add("a", delay=0)
+    intervals = []
+    for _ in range(6):
+        scheduler._record("a", True)
+        intervals.append(scheduler.stats()["mean_interval"])
+    assert intervals == [40.0, 40.0, 80.0, 160.0, 160.0, 160.0]
+    scheduler._record("a", False)
+    assert scheduler.stats()["mean_interval"] == 80.0
+
+
+def test_unhealthy_streak_shrinks_interval():
+    scheduler = HealthCheckScheduler(40.0, jitter=0, clock=_Clock())
+    scheduler.add("a", delay=0)
+    for _ in range(5):
+        scheduler._record("a", False)
+    assert scheduler.stats()["mean_interval"] == 10.0
+
+
+def test_probes_respect_concurrency_cap():
+    clock = _Clock()
+
+    async def main():
+        scheduler = HealthCheckScheduler(3600.0, max_concurrency=3, clock=clock)
+        gate = asyncio.Event()
+        peak = 0
+
+        async def probe(node_id):
+            nonlocal peak
+            peak = max(peak, scheduler.metrics["in_flight"])
+            await gate.wait()
+            return node_id != "n0"
+
+        for i in range(10):
+            scheduler.add(f"n{i}", delay=0)
+        runner = asyncio.ensure_future(scheduler.run(probe))
+        for _ in range(20):
+            await asyncio.sleep(0)
+        in_flight = scheduler.metrics["in_flight"]
+        gate.set()
+        while scheduler.metrics["probes"] < 10:
+            await asyncio.sleep(0.01)
+        scheduler.stop()
+        await runner
+        return in_flight, peak, scheduler.stats()
+
+    in_flight, peak, stats = asyncio.run(main())
+    assert in_flight == 3 and peak == 3
+    assert stats["probes"] == 10 and stats["unhealthy"] == 1 and stats["in_flight"] == 0
+
+
+def test_removed_node_is_not_probed():
+    clock = _Clock()
+
+    async def main():
+        scheduler = HealthCheckScheduler(3600.0, clock=clock)
+        probed = []
+
+        async def probe(node_id):
+            probed.append(node_id)
+            return True
+
+        scheduler.add("keep", delay=0)
+        scheduler.add("gone", delay=0)
+        scheduler.remove("gone")
+        runner = asyncio.ensure_future(scheduler.run(probe))
+        while not probed:
+            await asyncio.sleep(0.01)
+        scheduler.stop()
+        await runner
+        return probed
+
+    assert asyncio.run(main()) == ["keep"]
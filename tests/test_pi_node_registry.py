@@ -0,0 +1,80 @@
+# tests/test_pi_node_registry.py
+#
+# Warm-start registry of the Pi auto-connector (apps/ai/pi_auto_connector/node_registry.py):
+# a failed flush must not lose buffered changes or stop the periodic flush loop.
+
+import asyncio
+import os
+import sqlite3
+import sys
+import types
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "apps", "ai"))
+
+from pi_auto_connector.connector import PiAutoConnector  # noqa: E402
+from pi_auto_connector.node_registry import NodeRegistry  # noqa: E402
+
+
+def test_failed_flush_keeps_changes_buffered():
+    registry = NodeRegistry(":memory:")
+    registry.record_connected("node-1", {"id": "node-1"}, {"timeout": 5})
+    registry.record_health("node-1", True)
+    write = registry._write
+
+    def locked(*args):
+        raise sqlite3.OperationalError("database is locked")
+
+    registry._write = locked
+    try:
+        registry.flush()
+    except sqlite3.OperationalError:
+        pass
+    else:
+        raise AssertionError("flush() should raise")
+    registry.record_status("node-1", "error")  # Newer change wins over the requeued one
+    registry._write = write
+    assert registry.flush() == 2
+    assert registry.load()["node-1"]["status"] == "error"
+    assert len(registry.health_history("node-1")) == 1
+    assert registry.metrics["flush_errors"] == 1
+    registry.close()
+
+
+def test_registry_loop_survives_flush_errors_and_stops():
+    flushes = []
+
+    class FailingRegistry:
+        async def aflush(self):
+            flushes.append(len(flushes))
+            if len(flushes) == 1:
+                raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+            if len(flushes) == 3:
+                connector._running = False
+            return 0
+
+    connector = types.SimpleNamespace(_running=True, registry_flush_interval=0.001, registry=FailingRegistry())
+
+    async def main():
+        await asyncio.wait_for(PiAutoConnector.registry_loop(connector), 5)
+
+    asyncio.run(main())
+    assert flushes == [0, 1, 2]
+
+
+def test_registry_loop_does_not_flush_after_stop():
+    flushes = []
+
+    class Registry:
+        async def aflush(self):
+            flushes.append(1)
+
+    connector = types.SimpleNamespace(_running=True, registry_flush_interval=0.05, registry=Registry())
+
+    async def main():
+        loop_task = asyncio.ensure_future(PiAutoConnector.registry_loop(connector))
+        await asyncio.sleep(0.01)
+        connector._running = False  # stop() closes the registry right after this
+        await asyncio.wait_for(loop_task, 5)
+
+    asyncio.run(main())
+    assert flushes == []
@@ -0,0 +1,77 @@
+# tests/test_pi_node_state_memory.py
+#
+# Per-node memory regression guard for the Pi auto-connector registry
+# (apps/ai/pi_auto_connector/node_state.py). At 100k+ nodes every byte per record counts.
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "apps", "ai"))
+
+from pi_auto_connector.node_state import MetadataStore, NodeState, NodeStatus  # noqa: E402
+
+NODES = 20_000
+
+# Bytes per connected node, including its connected_nodes entry and metadata blob
+# (about 350 locally; the previous dict-of-dicts records took about 600).
+PER_NODE_BUDGET = 450
+
+
+def _node(i):
+    return {
+        "id": f"node-{i}",
+        "host": f"10.0.{i // 256}.{i % 256}",
+        "port": 31400,
+        "region": "eu-west",
+        "version": "0.4.9",
+        "protocol": "stellar-core",
+        "peers": 8,
+    }
+
+
+def _per_node_bytes(build):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        registry = build()
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    assert len(registry) == NODES
+    return used / NODES
+
+
+def _build_node_states():
+    store = MetadataStore()
+    registry = {}
+    for i in range(NODES):
+        node = _node(i)  # As parsed from a discovery response; only the store's blob stays alive
+        registry[node["id"]] = NodeState(node["id"], NodeStatus.CONNECTED, store, metadata=node, last_success=1.0)
+    return registry
+
+
+def _build_dicts():
+    registry = {}
+    for i in range(NODES):
+        node = _node(i)
+        registry[node["id"]] = {"status": "connected", "metadata": node, "last_success": 1.0}
+    return registry
+
+
+def test_node_state_memory_budget():
+    per_node = _per_node_bytes(_build_node_states)
+    assert per_node < PER_NODE_BUDGET, f"{per_node:.0f} bytes per node"
+
+
+def test_node_state_smaller_than_dict_records():
+    assert _per_node_bytes(_build_node_states) < 0.75 * _per_node_bytes(_build_dicts)
+
+
+def test_node_state_is_slotted_and_status_interned():
+    store = MetadataStore()
+    state = NodeState("node-1", "error", store, metadata=_node(1))
+    assert not hasattr(state, "__dict__")
+    assert state.status is NodeStatus.ERROR and state["status"] == "error"
+    assert state.metadata == _node(1)
+    assert store.put("node-1", _node(1)) is False
@@ -0,0 +1,90 @@
+# tests/test_pi_node_stats.py
+#
+# Node ranking of the Pi auto-connector (apps/ai/pi_auto_connector/node_stats.py): EWMA
+# updates, ordering by expected time to a successful call, exclusion of nodes waiting
+# to reconnect, and the lazily invalidated heap staying consistent and bounded.
+
+import math
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "apps", "ai"))
+
+from pi_auto_connector.node_stats import NodeRanking  # noqa: E402
+
+
+def test_ewma_updates():
+    ranking = NodeRanking(alpha=0.5, failure_penalty=2.0)
+    ranking.record("a", True, 0.1)
+    ranking.record("a", True, 0.3)
+    ranking.record("a", False)
+    stats = ranking.get("a")
+    assert stats["rtt_ewma"] == pytest.approx(0.2)
+    assert stats["success_rate"] == pytest.approx(0.5)
+    assert stats["score"] == pytest.approx(0.2 + 2.0)
+    assert (stats["samples"], stats["failures"], stats["ranked"]) == (3, 1, True)
+    assert (stats["p50"], stats["p99"]) == (0.1, 0.3)
+
+
+def test_ordering_by_score_and_node_id():
+    ranking = NodeRanking(alpha=1.0)
+    ranking.record("slow", True, 0.5)
+    ranking.record("fast", True, 0.1)
+    ranking.record("tie-b", True, 0.2)
+    ranking.record("tie-a", True, 0.2)
+    assert ranking.best_nodes(10) == ["fast", "tie-a", "tie-b", "slow"]
+    ranking.record("slow", True, 0.05)
+    assert ranking.best_nodes(2) == ["slow", "fast"]
+    ranking.record("fast", False)
+    assert ranking.best_nodes(10)[-1] == "fast" and len(ranking) == 4
+
+
+def test_failed_first_call_does_not_rank():
+    ranking = NodeRanking()
+    ranking.record("a", False)
+    assert "a" not in ranking and len(ranking) == 0 and ranking.best_nodes() == []
+    assert ranking.get("a")["score"] == math.inf
+
+
+def test_excluded_nodes_are_skipped_until_next_success():
+    ranking = NodeRanking(alpha=1.0)
+    for node_id, rtt in (("a", 0.1), ("b", 0.2), ("c", 0.3)):
+        ranking.record(node_id, True, rtt)
+    ranking.exclude("a")
+    assert "a" not in ranking and ranking.best_nodes(3) == ["b", "c"] and len(ranking) == 2
+    ranking.record("a", False)
+    assert "a" not in ranking
+    ranking.record("a", True, 0.1)
+    assert ranking.best_nodes(1) == ["a"]
+    ranking.remove("b")
+    assert ranking.get("b") is None and ranking.best_nodes(3) == ["a", "c"]
+
+
+def test_matches_full_sort_under_random_updates():
+    rng = random.Random(3)
+    ranking = NodeRanking(alpha=0.3)
+    nodes = [f"node{i}" for i in range(200)]
+    for _ in range(5000):
+        node_id = rng.choice(nodes)
+        action = rng.random()
+        if action < 0.05:
+            ranking.exclude(node_id)
+        elif action < 0.07:
+            ranking.remove(node_id)
+        elif action < 0.2:
+            ranking.record(node_id, False)
+        else:
+            ranking.record(node_id, True, rng.uniform(0.01, 1.0))
+    expected = sorted(
+        (stats["score"], node_id)
+        for node_id in nodes
+        for stats in [ranking.get(node_id)]
+        if stats is not None and stats["ranked"]
+    )
+    assert ranking.best_nodes(len(nodes)) == [node_id for _, node_id in expected]
+    assert ranking.best_nodes(10) == [node_id for _, node_id in expected[:10]]
+    assert len(ranking) == len(expected)
+    assert len(ranking._heap) <= 2 * len(ranking) + 64
@@ -0,0 +1,109 @@
+# tests/test_pi_params_cache.py
+#
+# Connection-params cache of the Pi auto-connector (apps/ai/pi_auto_connector/params_cache.py):
+# fingerprints, TTL expiry, LRU eviction, the persistence round-trip, and malformed cache
+# files starting an empty cache instead of failing at startup.
+
+import json
+import logging
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "apps", "ai"))
+
+from pi_auto_connector import params_cache  # noqa: E402
+from pi_auto_connector.params_cache import ConnectionParamsCache, node_fingerprint  # noqa: E402
+
+PARAMS = {"handshake": True, "retries": 5}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(params_cache.time, "time", lambda: now[0])
+    return now
+
+
+def test_fingerprint_ignores_volatile_fields():
+    node = {"id": "n1", "host": "10.0.0.1", "port": 31400}
+    assert node_fingerprint(node) == node_fingerprint({**node, "last_seen": 5, "latency": 0.2})
+    assert node_fingerprint(node) == node_fingerprint(dict(reversed(list(node.items()))))
+    assert node_fingerprint(node) != node_fingerprint({**node, "port": 31401})
+
+
+def test_fingerprint_with_custom_fields():
+    cache = ConnectionParamsCache(fields=["host", "port"])
+    node = {"id": "n1", "host": "10.0.0.1", "port": 31400}
+    assert cache.fingerprint(node) == cache.fingerprint({**node, "id": "n2", "version": "2"})
+    assert cache.fingerprint(node) != cache.fingerprint({**node, "host": "10.0.0.2"})
+    cache.put(node, PARAMS)
+    assert cache.get({**node, "id": "n2"}) == PARAMS
+
+
+def test_ttl_expiry(clock):
+    cache = ConnectionParamsCache(ttl=60)
+    node = {"id": "n1"}
+    cache.put(node, PARAMS)
+    clock[0] += 59
+    assert cache.get(node) == PARAMS
+    clock[0] += 1
+    assert cache.get(node) is None and len(cache) == 0
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["expired"], stats["hit_ratio"]) == (1, 1, 1, 0.5)
+
+
+def test_lru_eviction_and_copies():
+    cache = ConnectionParamsCache(max_entries=2)
+    a, b, c = {"id": "a"}, {"id": "b"}, {"id": "c"}
+    cache.put(a, PARAMS)
+    cache.put(b, PARAMS)
+    cache.get(a)["retries"] = 99
+    cache.put(c, PARAMS)
+    assert cache.get(b) is None and cache.get(a) == PARAMS and cache.get(c) == PARAMS
+    assert cache.stats()["evictions"] == 1
+    assert cache.invalidate(a) and not cache.invalidate(a) and cache.get(a) is None
+
+
+def test_persistence_round_trip(tmp_path, clock):
+    path = str(tmp_path / "params.json")
+    cache = ConnectionParamsCache(ttl=60, path=path)
+    cache.put({"id": "old"}, {"retries": 1})
+    clock[0] += 30
+    cache.put({"id": "new"}, {"retries": 2})
+    cache.save()
+    assert not os.path.exists(path + ".tmp")
+
+    loaded = ConnectionParamsCache(ttl=60, path=path)
+    assert loaded.get({"id": "old"}) == {"retries": 1} and loaded.get({"id": "new"}) == {"retries": 2}
+    clock[0] += 30
+    assert len(ConnectionParamsCache(ttl=60, path=path)) == 1
+    assert len(ConnectionParamsCache(ttl=60, path=path, max_entries=1)) == 1
+    assert len(ConnectionParamsCache(path=str(tmp_path / "missing.json"))) == 0
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "not json",
+        "[]",
+        "null",
+        json.dumps({"version": 1}),
+        json.dumps({"entries": {"k": 1}}),
+        json.dumps({"entries": [["k", 2e9]]}),
+        json.dumps({"entries": [["k", "soon", {}]]}),
+        json.dumps({"entries": [["k", 2e9, ["not", "a", "dict"]]]}),
+        json.dumps({"entries": [5]}),
+    ],
+)
+def test_malformed_file_starts_empty(tmp_path, caplog, content):
+    path = tmp_path / "params.json"
+    path.write_text(content)
+    with caplog.at_level(logging.WARNING, logger="ParamsCache"):
+        cache = ConnectionParamsCache(path=str(path))
+    assert len(cache) == 0
+    assert "params cache" in caplog.text
+    cache.put({"id": "n1"}, PARAMS)
+    cache.save()
+    assert len(ConnectionParamsCache(path=str(path))) == 1
@@ -0,0 +1,62 @@
+# tests/test_pi_reconnect_queue.py
+#
+# Reconnect queue of the Pi auto-connector (apps/ai/pi_auto_connector/reconnect_queue.py):
+# a node whose reconnect is in flight must still count as queued, so discovery does
+# not connect it a second time.
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "apps", "ai"))
+
+from pi_auto_connector.reconnect_queue import ReconnectQueue  # noqa: E402
+
+
+def _run(scenario):
+    async def main():
+        queue = ReconnectQueue(base_delay=0.01, jitter=0, max_concurrency=4)
+        gate = asyncio.Event()
+        during = {}
+
+        async def reconnect(node_id):
+            during[node_id] = (node_id in queue, queue.schedule(node_id))
+            await gate.wait()
+            return node_id == "up"
+
+        runner = asyncio.ensure_future(queue.run(reconnect))
+        try:
+            await scenario(queue, gate, during)
+        finally:
+            queue.stop()
+            await runner
+        return queue
+
+    return asyncio.run(main())
+
+
+def test_in_flight_node_stays_queued_until_attempt_ends():
+    async def scenario(queue, gate, during):
+        queue.schedule("up")
+        queue.schedule("down")
+        await asyncio.sleep(0.05)
+        assert during == {"up": (True, None), "down": (True, None)}
+        gate.set()
+        await asyncio.sleep(0.005)
+        assert "up" not in queue and queue.attempts("up") == 0
+        assert "down" in queue and queue.attempts("down") == 2
+
+    _run(scenario)
+
+
+def test_removed_in_flight_node_is_not_requeued():
+    async def scenario(queue, gate, during):
+        queue.schedule("down")
+        await asyncio.sleep(0.05)
+        queue.remove("down")
+        assert "down" not in queue
+        gate.set()
+        await asyncio.sleep(0.005)
+        assert "down" not in queue and queue.stats()["scheduled"] == 1
+
+    _run(scenario)
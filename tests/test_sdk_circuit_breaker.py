@@ -0,0 +1,161 @@
+# tests/test_sdk_circuit_breaker.py
+#
+# CircuitBreaker (sdk/python/globalconnect.py): state transitions, and half-open
+# trials that are cancelled or fail unexpectedly must not wedge the breaker.
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "sdk", "python"))
+
+import globalconnect  # noqa: E402
+from globalconnect import CircuitBreaker, CircuitBreakers, CircuitOpenError, GlobalConnectError  # noqa: E402
+
+OPEN_TIMEOUT = 0.05
+
+
+def _breaker(**kwargs):
+    kwargs.setdefault("min_calls", 2)
+    kwargs.setdefault("window_size", 4)
+    kwargs.setdefault("open_timeout", OPEN_TIMEOUT)
+    return CircuitBreaker(**kwargs)
+
+
+def _trip(breaker):
+    while breaker.state == CircuitBreaker.CLOSED:
+        assert breaker.allow()
+        breaker.record(False)
+
+
+def test_opens_at_failure_rate_and_fails_fast():
+    breaker = _breaker()
+    assert breaker.allow()
+    breaker.record(True)
+    assert breaker.allow()
+    breaker.record(False)
+    assert breaker.state == CircuitBreaker.OPEN  # 1 of 2 calls failed, threshold 0.5
+    assert not breaker.allow()
+    assert breaker.stats()["rejected"] == 1 and breaker.times_opened == 1
+
+
+def test_half_open_success_closes():
+    breaker = _breaker()
+    _trip(breaker)
+    time.sleep(OPEN_TIMEOUT * 1.5)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()  # One trial at a time
+    breaker.record(True)
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.failure_rate == 0.0
+
+
+def test_half_open_failure_reopens():
+    breaker = _breaker()
+    _trip(breaker)
+    time.sleep(OPEN_TIMEOUT * 1.5)
+    assert breaker.allow()
+    breaker.record(False)
+    assert breaker.state == CircuitBreaker.OPEN and breaker.times_opened == 2
+
+
+def test_released_trial_can_be_retried():
+    breaker = _breaker()
+    _trip(breaker)
+    time.sleep(OPEN_TIMEOUT * 1.5)
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    status = 500
+    delay = 0.0
+
+    def do_GET(self):
+        time.sleep(type(self).delay)
+        body = json.dumps({"ok": True}).encode()
+        self.send_response(type(self).status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api_base():
+    _Handler.status, _Handler.delay = 500, 0.0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def _breakers():
+    return CircuitBreakers(min_calls=1, window_size=2, open_timeout=OPEN_TIMEOUT)
+
+
+def test_async_cancelled_trial_does_not_wedge_breaker(api_base):
+    pytest.importorskip("aiohttp")
+    breakers = _breakers()
+
+    async def main():
+        async with globalconnect.AsyncGlobalConnect(
+            api_key="k", api_base=api_base, max_retries=1, coalesce=False, circuit_breakers=breakers
+        ) as gc:
+            with pytest.raises(GlobalConnectError):
+                await gc.get_status()  # 500 opens the circuit
+            await asyncio.sleep(OPEN_TIMEOUT * 1.5)
+            _Handler.status, _Handler.delay = 200, 0.5
+            trial = asyncio.ensure_future(gc.get_status())
+            await asyncio.sleep(0.05)
+            trial.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await trial
+            _Handler.delay = 0.0
+            assert await gc.get_status() == {"ok": True}
+
+    asyncio.run(main())
+    assert breakers.get("/partners/status").state == CircuitBreaker.CLOSED
+
+
+def test_sync_unexpected_error_in_trial_counts_as_failure(api_base, monkeypatch):
+    pytest.importorskip("requests")
+    breakers = _breakers()
+    gc = globalconnect.GlobalConnect(
+        api_key="k", api_base=api_base, max_retries=1, coalesce=False, circuit_breakers=breakers
+    )
+    try:
+        with pytest.raises(GlobalConnectError):
+            gc.get_status()
+        time.sleep(OPEN_TIMEOUT * 1.5)
+
+        def broken(*args, **kwargs):
+            raise RuntimeError("adapter bug")
+
+        monkeypatch.setattr(gc.session, "request", broken)
+        with pytest.raises(RuntimeError):
+            gc.get_status()
+        breaker = breakers.get("/partners/status")
+        assert breaker.state == CircuitBreaker.OPEN and breaker.times_opened == 2
+        with pytest.raises(CircuitOpenError):
+            gc.get_status()
+        monkeypatch.undo()
+        time.sleep(OPEN_TIMEOUT * 1.5)
+        _Handler.status = 200
+        assert gc.get_status() == {"ok": True}
+        assert breaker.state == CircuitBreaker.CLOSED
+    finally:
+        gc.close()
@@ -0,0 +1,154 @@
+# tests/test_sdk_coalescing.py
+#
+# Request coalescing (single-flight) must never make a request fail that would
+# succeed uncoalesced, e.g. list-valued query params, must give every caller its
+# own result object, and must never share a call between different credentials.
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "sdk", "python"))
+
+import globalconnect  # noqa: E402
+
+pytest.importorskip("requests")
+pytest.importorskip("aiohttp")
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """Echoes the query string; /slow answers after 0.3s with the Authorization header it got."""
+
+    slow_hits = []
+
+    def do_GET(self):
+        if self.path == "/slow":
+            type(self).slow_hits.append(self.headers.get("Authorization"))
+            time.sleep(0.3)
+            body = json.dumps({"auth": self.headers.get("Authorization"), "items": [1, 2]}).encode()
+        else:
+            body = json.dumps(parse_qs(urlsplit(self.path).query)).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def api_base():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_coalesce_key_handles_list_and_dict_values():
+    key = globalconnect._coalesce_key("GET", "/echo", {"ids": [1, 2], "f": {"a": [3]}}, None)
+    assert key == globalconnect._coalesce_key("GET", "/echo", {"f": {"a": [3]}, "ids": (1, 2)}, None)
+    hash(key)
+
+
+def test_coalesce_key_hashes_credential():
+    key = globalconnect._coalesce_key("GET", "/echo", None, {"Authorization": "Bearer secret", "X-A": "1"})
+    assert key != globalconnect._coalesce_key("GET", "/echo", None, {"Authorization": "Bearer other", "X-A": "1"})
+    assert key != globalconnect._coalesce_key("GET", "/echo", None, {"X-A": "1"})
+    assert "secret" not in repr(key) and len(key[2]) == 32
+
+
+def test_coalesce_key_unhashable_value_skips_coalescing():
+    assert globalconnect._coalesce_key("GET", "/echo", {"ids": [bytearray(b"x")]}, None) is None
+
+
+@pytest.mark.parametrize("coalesce", [True, False])
+def test_sync_client_list_params(api_base, coalesce):
+    gc = globalconnect.GlobalConnect(api_key="k", api_base=api_base, coalesce=coalesce)
+    try:
+        assert gc.custom_endpoint("GET", "/echo", params={"ids": [1, 2]}) == {"ids": ["1", "2"]}
+    finally:
+        gc.close()
+
+
+@pytest.mark.parametrize("coalesce", [True, False])
+def test_async_client_list_params(api_base, coalesce):
+    async def main():
+        async with globalconnect.AsyncGlobalConnect(api_key="k", api_base=api_base, coalesce=coalesce) as gc:
+            return await gc.custom_endpoint("GET", "/echo", params={"ids": ["1", "2"]})
+
+    assert asyncio.run(main()) == {"ids": ["1", "2"]}
+
+
+def _run_threads(fns):
+    results = [None] * len(fns)
+
+    def run(i):
+        results[i] = fns[i]()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(fns))]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.02)
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_sync_waiters_get_their_own_copy(api_base):
+    _EchoHandler.slow_hits = []
+    gc = globalconnect.GlobalConnect(api_key="k", api_base=api_base)
+    try:
+        results = _run_threads([lambda: gc.custom_endpoint("GET", "/slow")] * 4)
+    finally:
+        gc.close()
+    assert len(_EchoHandler.slow_hits) == 1 and gc._single_flight.coalesced == 3
+    assert all(result == {"auth": "Bearer k", "items": [1, 2]} for result in results)
+    assert len({id(result) for result in results}) == 4
+    assert len({id(result["items"]) for result in results}) == 4
+
+
+def test_async_waiters_get_their_own_copy(api_base):
+    _EchoHandler.slow_hits = []
+
+    async def main():
+        async with globalconnect.AsyncGlobalConnect(api_key="k", api_base=api_base) as gc:
+            results = await asyncio.gather(*(gc.custom_endpoint("GET", "/slow") for _ in range(4)))
+            return results, gc._single_flight.coalesced
+
+    results, coalesced = asyncio.run(main())
+    assert len(_EchoHandler.slow_hits) == 1 and coalesced == 3
+    results[0]["items"].append(3)
+    assert all(result == {"auth": "Bearer k", "items": [1, 2]} for result in results[1:])
+
+
+def test_calls_with_different_credentials_are_not_shared(api_base):
+    _EchoHandler.slow_hits = []
+    gc = globalconnect.GlobalConnect(api_key="k1", api_base=api_base)
+
+    def rotate_then_call():
+        gc.set_api_key("k2")
+        return gc.custom_endpoint("GET", "/slow")
+
+    try:
+        results = _run_threads(
+            [
+                lambda: gc.custom_endpoint("GET", "/slow"),
+                rotate_then_call,
+                lambda: gc.custom_endpoint("GET", "/slow", headers={"Authorization": "Bearer k3"}),
+            ]
+        )
+    finally:
+        gc.close()
+    assert [result["auth"] for result in results] == ["Bearer k1", "Bearer k2", "Bearer k3"]
+    assert sorted(_EchoHandler.slow_hits) == ["Bearer k1", "Bearer k2", "Bearer k3"]
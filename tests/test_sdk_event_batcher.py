@@ -0,0 +1,127 @@
+# tests/test_sdk_event_batcher.py
+#
+# EventBatcher (sdk/python/globalconnect.py): flush triggers, backpressure,
+# per-item results and shutdown, against an in-process fake client.
+
+import gzip
+import json
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "sdk", "python"))
+
+import globalconnect  # noqa: E402
+from globalconnect import EventBatcher, GlobalConnectError  # noqa: E402
+
+
+class FakeClient:
+    """Records bulk requests; answers one result per event, failing events whose data has "fail"."""
+
+    def __init__(self, gate: threading.Event = None, error: Exception = None):
+        self.json_codec = globalconnect.get_json_codec("json")
+        self.gate = gate
+        self.error = error
+        self.batches = []
+        self.calls = []
+
+    def _request(self, method, endpoint, data=None, headers=None):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.calls.append((method, endpoint, headers))
+        if headers.get("Content-Encoding") == "gzip":
+            data = gzip.decompress(data)
+        events = json.loads(data)["events"]
+        self.batches.append(events)
+        if self.error is not None:
+            raise self.error
+        return {"results": [{"error": "rejected"} if e["data"].get("fail") else {"accepted": True} for e in events]}
+
+
+def _batcher(client, **kwargs):
+    kwargs.setdefault("flush_on_exit", False)
+    return EventBatcher(client, **kwargs)
+
+
+def test_flushes_when_batch_is_full():
+    client = FakeClient()
+    with _batcher(client, max_batch_size=3, flush_interval=60) as batcher:
+        results = [batcher.submit("e", {"i": i}) for i in range(3)]
+        assert [f.result(timeout=5) for f in results] == [{"accepted": True}] * 3
+    assert [len(batch) for batch in client.batches] == [3]
+    method, endpoint, headers = client.calls[0]
+    assert (method, endpoint, headers["Content-Encoding"]) == ("POST", "/batches/events", "gzip")
+
+
+def test_flushes_after_interval():
+    client = FakeClient()
+    with _batcher(client, max_batch_size=100, flush_interval=0.05) as batcher:
+        started = time.monotonic()
+        assert batcher.submit("e", {"i": 1}).result(timeout=5) == {"accepted": True}
+        assert time.monotonic() - started < 2
+    assert [len(batch) for batch in client.batches] == [1]
+
+
+def test_per_item_errors_fail_only_that_event():
+    client = FakeClient()
+    with _batcher(client, max_batch_size=2, flush_interval=60, compress=False) as batcher:
+        ok = batcher.submit("e", {"i": 1})
+        bad = batcher.submit("e", {"fail": True})
+        assert ok.result(timeout=5) == {"accepted": True}
+        with pytest.raises(GlobalConnectError, match="rejected"):
+            bad.result(timeout=5)
+        assert batcher.stats["succeeded"] == 1 and batcher.stats["failed"] == 1
+
+
+def test_request_failure_fails_whole_batch():
+    client = FakeClient(error=GlobalConnectError("boom"))
+    with _batcher(client, max_batch_size=2, flush_interval=60) as batcher:
+        futures = [batcher.submit("e", {"i": i}) for i in range(2)]
+        for future in futures:
+            with pytest.raises(GlobalConnectError, match="boom"):
+                future.result(timeout=5)
+
+
+def test_backpressure_when_buffer_is_full():
+    gate = threading.Event()
+    client = FakeClient(gate=gate)
+    batcher = _batcher(client, max_batch_size=2, max_buffer=2, flush_interval=60, block=False)
+    try:
+        batcher.submit("e", {"i": 0})
+        batcher.submit("e", {"i": 1})  # Full batch: the worker takes it and blocks on the gate
+        deadline = time.monotonic() + 5
+        while batcher.pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+        batcher.submit("e", {"i": 2})
+        batcher.submit("e", {"i": 3})
+        with pytest.raises(GlobalConnectError, match="full"):
+            batcher.submit("e", {"i": 4})
+        batcher.block, batcher.submit_timeout = True, 0.05
+        with pytest.raises(GlobalConnectError, match="Timed out"):
+            batcher.submit("e", {"i": 4})
+    finally:
+        gate.set()
+        batcher.close(timeout=5)
+    assert sum(len(batch) for batch in client.batches) == 4
+
+
+def test_close_flushes_pending_and_rejects_new_events():
+    client = FakeClient()
+    batcher = _batcher(client, max_batch_size=100, flush_interval=60)
+    futures = [batcher.submit("e", {"i": i}) for i in range(5)]
+    batcher.close(timeout=5)
+    assert all(f.result(timeout=0) == {"accepted": True} for f in futures)
+    assert [len(batch) for batch in client.batches] == [5]
+    with pytest.raises(GlobalConnectError, match="closed"):
+        batcher.submit("e", {})
+
+
+def test_unencodable_event_fails_its_batch_and_keeps_worker_alive():
+    client = FakeClient()
+    with _batcher(client, max_batch_size=1, flush_interval=60) as batcher:
+        with pytest.raises(GlobalConnectError, match="not JSON serializable"):
+            batcher.submit("e", {"x": object()}).result(timeout=5)
+        assert batcher.submit("e", {"i": 1}).result(timeout=5) == {"accepted": True}
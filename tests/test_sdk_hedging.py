@@ -0,0 +1,75 @@
+# tests/test_sdk_hedging.py
+#
+# HedgePolicy (sdk/python/globalconnect.py): hedges must be timed from when the first
+# attempt starts running, and stay within the policy's hedge budget.
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "sdk", "python"))
+
+from globalconnect import HedgePolicy  # noqa: E402
+
+
+def _policy(delay, **kwargs):
+    policy = HedgePolicy(**kwargs)
+    policy._delays["/x"] = delay
+    return policy
+
+
+def test_queue_wait_does_not_count_towards_hedge_delay():
+    policy = _policy(0.05)
+    release = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(release.wait, 5)
+        threading.Timer(0.15, release.set).start()
+        assert policy.call("/x", lambda: "ok", executor) == "ok"
+    assert policy.hedged == 0
+
+
+def test_slow_attempt_is_hedged():
+    policy = _policy(0.01)
+    calls = []
+
+    def send():
+        calls.append(1)
+        time.sleep(0.1 if len(calls) == 1 else 0)
+        return len(calls)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert policy.call("/x", send, executor) == 2
+    assert (policy.hedged, policy.hedge_wins) == (1, 1)
+
+
+def test_hedges_stay_within_budget():
+    policy = _policy(0.001, max_hedge_ratio=0.1, max_tokens=1.0)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for _ in range(20):
+            policy.call("/x", lambda: time.sleep(0.01), executor)
+    assert policy.hedged <= 3  # One token to start with, then 0.1 per request
+    assert policy.budget_exhausted == 20 - policy.hedged
+
+
+def test_async_hedge_delay_starts_when_running():
+    async def main():
+        policy = _policy(0.05)
+        gate = asyncio.Semaphore(1)
+        running = asyncio.Event()
+
+        async def send():
+            async with gate:
+                running.set()
+                await asyncio.sleep(0.001)
+                return "ok"
+
+        async with gate:  # Hold the concurrency limit past the hedge delay
+            call = asyncio.ensure_future(policy.acall("/x", send, running))
+            await asyncio.sleep(0.15)
+        assert await call == "ok"
+        return policy
+
+    assert asyncio.run(main()).hedged == 0
@@ -0,0 +1,69 @@
+# tests/test_sdk_http2_adapter.py
+#
+# The HTTP/2 transport (GlobalConnect(http2=True)) must honour the per-request
+# settings requests hands its adapters: verify, cert and proxies.
+
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "sdk", "python"))
+
+import globalconnect  # noqa: E402
+
+pytest.importorskip("requests")
+pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+
+class _RecordingHandler(BaseHTTPRequestHandler):
+    paths = []
+
+    def do_GET(self):
+        self.paths.append(self.path)
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _RecordingHandler.paths = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _RecordingHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+def test_requests_go_through_session_proxy(server):
+    gc = globalconnect.GlobalConnect(api_key="k", api_base="http://partner.invalid", http2=True)
+    try:
+        gc.session.trust_env = False
+        gc.session.proxies = {"http": server}
+        assert gc.get_status() == {"ok": True}
+        assert _RecordingHandler.paths == ["http://partner.invalid/partners/status"]
+    finally:
+        gc.close()
+
+
+def test_one_client_per_tls_and_proxy_combination(server):
+    adapter = globalconnect._HTTP2Adapter(max_streams=10, max_connections=2)
+    try:
+        first = adapter._client_for(server, True, None, None)
+        assert adapter._client_for(server, True, None, None) is first
+        assert adapter._client_for(server, False, None, None) is not first
+        assert adapter._client_for(server, True, None, {"http": server}) is not first
+        assert len(adapter._clients) == 3
+    finally:
+        adapter.close()
+    assert adapter._clients == {}
@@ -0,0 +1,54 @@
+# tests/test_sdk_import_time.py
+#
+# Import-time regression guard for the Python SDK (sdk/python/globalconnect.py).
+# Short-lived CLI jobs and serverless functions pay this cost on every cold start.
+
+import os
+import re
+import subprocess
+import sys
+
+SDK_DIR = os.path.join(os.path.dirname(__file__), "..", "sdk", "python")
+
+# Cumulative `import globalconnect` budget in microseconds (about 20ms locally;
+# importing requests + aiohttp eagerly used to cost ~350ms).
+IMPORT_BUDGET_US = 60_000
+
+HEAVY_MODULES = ("requests", "aiohttp", "flask", "asyncio", "concurrent.futures", "urllib3")
+
+
+def _run(code, *flags):
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    env["PYTHONPATH"] = os.path.abspath(SDK_DIR)
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+
+
+def _import_time_us():
+    result = _run("import globalconnect", "-X", "importtime")
+    match = re.search(r"^import time:\s+\d+ \|\s+(\d+) \| globalconnect$", result.stderr, re.MULTILINE)
+    assert match, result.stderr
+    return int(match.group(1))
+
+
+def test_import_does_not_load_heavy_dependencies():
+    code = (
+        "import sys, globalconnect\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert _run(code).stdout.strip() == ""
+
+
+def test_import_does_not_configure_logging():
+    code = (
+        "import logging, globalconnect\n"
+        "print(all(isinstance(h, logging.NullHandler) for h in globalconnect.logger.handlers))"
+    )
+    assert _run(code).stdout.strip() == "True"
+
+
+def test_import_time_budget():
+    _import_time_us()  # Warm the bytecode cache
+    best = min(_import_time_us() for _ in range(3))
+    assert best < IMPORT_BUDGET_US, f"import globalconnect took {best / 1000:.1f}ms"
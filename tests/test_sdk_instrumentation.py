@@ -0,0 +1,176 @@
+# tests/test_sdk_instrumentation.py
+#
+# Request instrumentation (sdk/python/globalconnect.py): the RequestRecord of a call
+# (attempts, bytes, backoff, cache outcome), InMemoryMetrics aggregation and
+# percentiles, and connection reuse reported by connection_stats().
+
+import asyncio
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "sdk", "python"))
+
+import globalconnect  # noqa: E402
+from globalconnect import GlobalConnectError, InMemoryMetrics, RequestRecord, ResponseCache  # noqa: E402
+
+pytest.importorskip("requests")
+
+BODY = json.dumps({"ok": True}).encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Keep-alive server; every other request to /flaky answers 503 first, /broken always 400."""
+
+    protocol_version = "HTTP/1.1"
+    calls = {}
+
+    def _reply(self):
+        calls = type(self).calls
+        calls[self.path] = calls.get(self.path, 0) + 1
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        if self.path == "/broken":
+            status = 400
+        elif self.path == "/flaky" and calls[self.path] % 2 == 1:
+            status = 503
+        else:
+            status = 200
+        body = BODY if status == 200 else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api_base():
+    _Handler.calls = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+class _RecordingMetrics(InMemoryMetrics):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def on_request(self, record):
+        self.records.append(record)
+        super().on_request(record)
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(globalconnect.time, "sleep", lambda seconds: None)
+
+
+def _client(api_base, metrics, **kwargs):
+    return globalconnect.GlobalConnect(
+        api_key="k", api_base=api_base, max_retries=3, backoff_factor=0.1, instrumentation=metrics, **kwargs
+    )
+
+
+def test_retried_call_record(api_base, no_sleep):
+    metrics = _RecordingMetrics()
+    gc = _client(api_base, metrics)
+    try:
+        assert gc.custom_endpoint("POST", "/flaky", json={"n": 1}) == {"ok": True}
+    finally:
+        gc.close()
+    (record,) = metrics.records
+    assert (record.method, record.endpoint, record.status) == ("POST", "/flaky", 200)
+    assert record.attempts == 2 and record.retries == 1
+    assert record.bytes_sent == len(b'{"n":1}') and record.bytes_received == len(BODY)
+    assert 0 <= record.backoff_seconds <= 0.1 and record.error is None and record.latency > 0
+    series = metrics.snapshot()["POST /flaky"]
+    assert series["count"] == 1 and series["retries"] == 1 and series["statuses"] == {200: 1}
+    assert series["bytes_sent"] == record.bytes_sent and series["bytes_received"] == len(BODY)
+
+
+def test_failed_call_record(api_base, no_sleep):
+    metrics = _RecordingMetrics()
+    gc = _client(api_base, metrics)
+    try:
+        with pytest.raises(GlobalConnectError):
+            gc.custom_endpoint("GET", "/broken")
+    finally:
+        gc.close()
+    (record,) = metrics.records
+    assert record.status == 400 and record.attempts == 1 and "400" in record.error
+    assert metrics.snapshot()["GET /broken"]["errors"] == 1
+
+
+def test_cache_outcome_is_recorded(api_base):
+    metrics = _RecordingMetrics()
+    gc = _client(api_base, metrics, cache=ResponseCache(default_ttl=60))
+    try:
+        gc.custom_endpoint("GET", "/data")
+        gc.custom_endpoint("GET", "/data")
+    finally:
+        gc.close()
+    assert [r.cache for r in metrics.records] == [None, "hit"]
+    assert [r.attempts for r in metrics.records] == [1, 0]
+    assert metrics.snapshot()["GET /data"]["cache_hits"] == 1
+
+
+def test_percentiles_are_bucket_upper_bounds():
+    metrics = InMemoryMetrics(buckets=(0.01, 0.1, 1.0, float("inf")))
+    for latency in [0.005] * 90 + [0.05] * 8 + [0.5, 5.0]:
+        record = RequestRecord("GET", "/x")
+        record.latency = latency
+        record.status = 200
+        metrics.on_request(record)
+    series = metrics.snapshot()["GET /x"]
+    assert (series["p50"], series["p95"], series["p99"]) == (0.01, 0.1, 1.0)
+    assert series["histogram"] == {0.01: 90, 0.1: 8, 1.0: 1, float("inf"): 1}
+    assert series["mean"] == pytest.approx((0.005 * 90 + 0.05 * 8 + 0.5 + 5.0) / 100)
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_connection_stats_report_reuse(api_base):
+    gc = _client(api_base, None)
+    try:
+        for _ in range(4):
+            gc.custom_endpoint("GET", "/data")
+        stats = gc.connection_stats()
+    finally:
+        gc.close()
+    assert stats["requests"] == 4 and stats["connections_opened"] == 1
+    assert stats["reuse_ratio"] == 0.75 and stats["protocols"] == {"HTTP/1.1": 4}
+
+
+def test_async_retried_call_record(api_base, monkeypatch):
+    pytest.importorskip("aiohttp")
+
+    async def no_sleep(seconds):
+        pass
+
+    monkeypatch.setattr(globalconnect.asyncio, "sleep", no_sleep)
+    metrics = _RecordingMetrics()
+
+    async def main():
+        async with globalconnect.AsyncGlobalConnect(
+            api_key="k", api_base=api_base, max_retries=3, backoff_factor=0.1, instrumentation=metrics
+        ) as gc:
+            return await gc.custom_endpoint("GET", "/flaky")
+
+    assert asyncio.run(main()) == {"ok": True}
+    (record,) = metrics.records
+    assert record.attempts == 2 and record.status == 200 and record.bytes_received == len(BODY)
@@ -0,0 +1,78 @@
+# tests/test_sdk_json_codec.py
+#
+# Request/response JSON must keep the stdlib semantics the SDK always had (non-str
+# keys, integers beyond 64 bits, NaN) unless a caller opts in to a fast codec, and
+# unencodable bodies must be reported as GlobalConnectError.
+
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "sdk", "python"))
+
+import globalconnect  # noqa: E402
+from globalconnect import GlobalConnectError  # noqa: E402
+
+BIG = 123456789012345678901234567890
+
+
+def _codecs():
+    names = []
+    for name in ("json", "orjson", "ujson"):
+        try:
+            globalconnect.get_json_codec(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def test_default_codec_is_stdlib():
+    assert globalconnect.get_json_codec().name == "json"
+    assert globalconnect.GlobalConnect(api_key="k").json_codec.name == "json"
+    assert globalconnect.get_json_codec("fast").name in _codecs()
+
+
+@pytest.mark.parametrize("name", _codecs())
+def test_non_str_keys_encode_like_stdlib(name):
+    codec = globalconnect.get_json_codec(name)
+    assert codec.loads(codec.dumps({1: "a", "b": [1, 2]})) == {"1": "a", "b": [1, 2]}
+
+
+def test_default_codec_round_trips_big_ints():
+    codec = globalconnect.get_json_codec()
+    assert codec.dumps({"wei": 10 ** 21}) == b'{"wei":1000000000000000000000}'
+    value = codec.loads(b'{"v": 123456789012345678901234567890}')["v"]
+    assert value == BIG and isinstance(value, int)
+
+
+def test_default_codec_round_trips_nan():
+    codec = globalconnect.get_json_codec()
+    assert codec.dumps({"v": float("nan")}) == b'{"v":NaN}'
+    assert math.isnan(codec.loads(b'{"v": NaN}')["v"])
+
+
+def test_orjson_falls_back_to_stdlib_for_big_ints_and_nan():
+    pytest.importorskip("orjson")
+    codec = globalconnect.get_json_codec("orjson")
+    assert codec.dumps({"wei": 10 ** 21}) == b'{"wei":1000000000000000000000}'
+    assert math.isnan(codec.loads(b'{"v": NaN}')["v"])
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+@pytest.mark.parametrize("name", _codecs())
+def test_unencodable_body_raises_sdk_error(name):
+    with pytest.raises(GlobalConnectError, match="not JSON serializable"):
+        globalconnect._encode_json(globalconnect.get_json_codec(name), {"x": object()})
+
+
+def test_client_reports_unencodable_body_before_sending():
+    gc = globalconnect.GlobalConnect(api_key="k", api_base="http://127.0.0.1:9", max_retries=0)
+    try:
+        with pytest.raises(GlobalConnectError, match="not JSON serializable"):
+            gc.trigger_event("e", {"when": object()})
+    finally:
+        gc.close()
@@ -0,0 +1,156 @@
+# tests/test_sdk_pagination.py
+#
+# Cursor pagination (iter_pages in sdk/python/globalconnect.py) for both clients:
+# the page contract, malformed pages raising instead of ending the stream, the
+# single-document fallback, and prefetch being abandoned when iteration stops early.
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "sdk", "python"))
+
+import globalconnect  # noqa: E402
+from globalconnect import GlobalConnectError  # noqa: E402
+
+pytest.importorskip("requests")
+pytest.importorskip("aiohttp")
+
+PAGES = 3
+
+
+class _PagesHandler(BaseHTTPRequestHandler):
+    """/pages serves PAGES pages of 2 records; /bad breaks the contract on page 2; /doc and /list are unpaginated."""
+
+    requested = []
+    slow_after_first = 0.0
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        cursor = int(query.get("cursor", 0))
+        type(self).requested.append((url.path, cursor, query.get("limit")))
+        if cursor:
+            time.sleep(type(self).slow_after_first)
+        if url.path == "/doc":
+            body = {"total": 7}
+        elif url.path == "/list":
+            body = [1, 2]
+        elif url.path == "/bad" and cursor == 1:
+            body = {"items": [99]}
+        else:
+            body = {"records": [cursor * 10, cursor * 10 + 1]}
+            if cursor < PAGES - 1:
+                body["next_cursor"] = str(cursor + 1)
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api_base():
+    _PagesHandler.requested, _PagesHandler.slow_after_first = [], 0.0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PagesHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_split_page_contract():
+    split = globalconnect._split_page
+    assert split([1, 2], "records", "next_cursor", first=True) == ([1, 2], None)
+    assert split({"records": [1], "next_cursor": "c"}, "records", "next_cursor", first=False) == ([1], "c")
+    assert split({"records": None}, "records", "next_cursor", first=False) == ([], None)
+    assert split({"total": 7}, "records", "next_cursor", first=True) == ([{"total": 7}], None)
+    for page in ({"total": 7}, {"records": "x"}, "text", None):
+        with pytest.raises(GlobalConnectError, match="no 'records' list"):
+            split(page, "records", "next_cursor", first=False)
+
+
+@pytest.fixture
+def client(api_base):
+    gc = globalconnect.GlobalConnect(api_key="k", api_base=api_base, max_retries=1)
+    yield gc
+    gc.close()
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_sync_pages_in_order(client, prefetch):
+    assert list(client.iter_pages("/pages", page_size=2, prefetch=prefetch)) == [0, 1, 10, 11, 20, 21]
+    assert [(cursor, limit) for _, cursor, limit in _PagesHandler.requested] == [(0, "2"), (1, "2"), (2, "2")]
+
+
+def test_sync_malformed_page_raises(client):
+    pages = client.iter_pages("/bad")
+    assert [next(pages), next(pages)] == [0, 1]
+    with pytest.raises(GlobalConnectError, match="no 'records' list"):
+        next(pages)
+
+
+def test_sync_unpaginated_responses(client):
+    assert list(client.iter_pages("/doc")) == [{"total": 7}]
+    assert list(client.iter_pages("/list")) == [1, 2]
+
+
+def test_sync_early_close_fetches_no_further_pages(client):
+    _PagesHandler.slow_after_first = 0.1
+    pages = client.iter_pages("/pages")
+    assert next(pages) == 0
+    pages.close()
+    time.sleep(0.2)
+    assert [cursor for _, cursor, _ in _PagesHandler.requested] == [0, 1]  # Only the one prefetched page
+
+
+def _collect(api_base, endpoint, **kwargs):
+    async def main():
+        async with globalconnect.AsyncGlobalConnect(api_key="k", api_base=api_base, max_retries=1) as gc:
+            return [record async for record in gc.iter_pages(endpoint, **kwargs)]
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_async_pages_in_order(api_base, prefetch):
+    assert _collect(api_base, "/pages", page_size=2, prefetch=prefetch) == [0, 1, 10, 11, 20, 21]
+
+
+def test_async_malformed_page_raises(api_base):
+    with pytest.raises(GlobalConnectError, match="no 'records' list"):
+        _collect(api_base, "/bad")
+
+
+def test_async_unpaginated_responses(api_base):
+    assert _collect(api_base, "/doc") == [{"total": 7}]
+    assert _collect(api_base, "/list") == [1, 2]
+
+
+def test_async_early_close_cancels_prefetch(api_base):
+    _PagesHandler.slow_after_first = 0.5
+
+    async def main():
+        async with globalconnect.AsyncGlobalConnect(api_key="k", api_base=api_base, max_retries=1) as gc:
+            pages = gc.iter_pages("/pages")
+            assert await pages.__anext__() == 0
+            await asyncio.sleep(0.05)  # The prefetch of page 2 is in flight
+            started = time.monotonic()
+            await pages.aclose()
+            assert time.monotonic() - started < 0.3  # Did not wait for the slow page
+            await asyncio.sleep(0)
+            return [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+
+    assert asyncio.run(main()) == []
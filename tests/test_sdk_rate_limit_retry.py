@@ -0,0 +1,158 @@
+# tests/test_sdk_rate_limit_retry.py
+#
+# Client-side throttling and retry control (sdk/python/globalconnect.py): Retry-After
+# parsing, token-bucket waits, and the retry budget cutting retries off.
+
+import os
+import sys
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "sdk", "python"))
+
+import globalconnect  # noqa: E402
+from globalconnect import GlobalConnectError, RateLimiter, RetryBudget, TokenBucket  # noqa: E402
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(globalconnect.time, "monotonic", clock)
+    return clock
+
+
+def test_parse_retry_after_seconds_and_http_date():
+    assert globalconnect._parse_retry_after("3") == 3.0
+    assert globalconnect._parse_retry_after("-5") == 0.0
+    assert 28 <= globalconnect._parse_retry_after(formatdate(time.time() + 30, usegmt=True)) <= 30
+    assert globalconnect._parse_retry_after(formatdate(time.time() - 30, usegmt=True)) == 0.0
+    assert globalconnect._parse_retry_after("soon") is None
+    assert globalconnect._parse_retry_after(None) is None
+
+
+def test_backoff_prefers_retry_after():
+    for _ in range(20):
+        assert 2.0 <= globalconnect._backoff_delay(0.1, 10.0, 1, 2.0) <= 2.1
+        assert 0.0 <= globalconnect._backoff_delay(0.1, 0.3, 5, None) <= 0.3
+
+
+def test_token_bucket_waits_once_burst_is_spent(clock):
+    bucket = TokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+    clock.now += 1.0  # Refills to the burst, not beyond
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, pytest.approx(0.1)]
+
+
+def test_rate_limiter_per_key_and_longest_prefix(clock):
+    limiter = RateLimiter(rate=1, burst=1, endpoint_limits={"/events/": 100, "/events/slow": (2, 1)})
+    assert limiter.reserve("/events/a", "k1") == 0.0
+    assert limiter.reserve("/events/a", "k2") == 0.0  # Separate bucket per API key
+    assert limiter.reserve("/events/a", "k1") == pytest.approx(1.0)
+    assert limiter.reserve("/events/slow", "k3") == 0.0
+    assert limiter.reserve("/events/slow", "k4") == pytest.approx(0.5)
+
+
+def test_retry_budget_is_spent_and_refilled(clock):
+    budget = RetryBudget(ratio=0.5, min_per_second=1.0, max_tokens=1.0)
+    assert budget.try_retry()
+    assert not budget.try_retry()
+    budget.record_request()
+    budget.record_request()
+    assert budget.try_retry()
+    clock.now += 1.0  # min_per_second trickles one token back in
+    assert budget.try_retry()
+    assert budget.exhausted == 1
+
+
+class _Handler(BaseHTTPRequestHandler):
+    count = 0
+    retry_after = "1"
+
+    def do_GET(self):
+        type(self).count += 1
+        self.send_response(503)
+        self.send_header("Retry-After", type(self).retry_after)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api_base():
+    _Handler.count, _Handler.retry_after = 0, "1"
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(globalconnect.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def _client(api_base, **kwargs):
+    kwargs.setdefault("coalesce", False)
+    return globalconnect.GlobalConnect(api_key="k", api_base=api_base, backoff_factor=0.01, **kwargs)
+
+
+def test_retries_sleep_for_retry_after(api_base, sleeps):
+    gc = _client(api_base, max_retries=3)
+    with pytest.raises(GlobalConnectError):
+        gc.get_status()
+    gc.close()
+    assert _Handler.count == 3
+    assert len(sleeps) == 2 and all(1.0 <= s <= 1.01 for s in sleeps)
+
+
+def test_retry_after_beyond_patience_is_not_waited_for(api_base, sleeps):
+    _Handler.retry_after = "600"
+    gc = _client(api_base, max_retries=3, max_retry_after=60)
+    with pytest.raises(GlobalConnectError):
+        gc.get_status()
+    gc.close()
+    assert _Handler.count == 1 and sleeps == []
+
+
+def test_retries_stop_when_budget_is_spent(api_base, sleeps):
+    budget = RetryBudget(ratio=0.0, min_per_second=0.0, max_tokens=1.0)
+    gc = _client(api_base, max_retries=5, retry_budget=budget)
+    with pytest.raises(GlobalConnectError, match="retry budget exhausted"):
+        gc.get_status()
+    with pytest.raises(GlobalConnectError, match="retry budget exhausted"):
+        gc.get_status()
+    gc.close()
+    assert _Handler.count == 3  # One retry in total, then each call gives up after its first attempt
+    assert budget.exhausted == 2
+
+
+def test_rate_limiter_throttles_before_sending(api_base, sleeps):
+    records = []
+    sink = globalconnect.CallbackSink(records.append)
+    gc = _client(api_base, max_retries=1, rate_limiter=RateLimiter(rate=1, burst=1), instrumentation=sink)
+    for _ in range(2):
+        with pytest.raises(GlobalConnectError):
+            gc.get_status()
+    gc.close()
+    assert len(sleeps) == 1 and 0.9 <= sleeps[0] <= 1.0
+    assert [r.throttle_seconds for r in records] == [0.0, sleeps[0]]
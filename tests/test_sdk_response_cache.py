@@ -0,0 +1,141 @@
+# tests/test_sdk_response_cache.py
+#
+# ResponseCache (sdk/python/globalconnect.py): TTL expiry, ETag / 304 revalidation,
+# the LRU size bound, and per-credential isolation when clients share a cache.
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "sdk", "python"))
+
+import globalconnect  # noqa: E402
+from globalconnect import ResponseCache  # noqa: E402
+
+pytest.importorskip("requests")
+
+
+class _ETagHandler(BaseHTTPRequestHandler):
+    """Answers with the caller's credential and ETag "v1"; 304 when If-None-Match matches."""
+
+    requests = []
+
+    def do_GET(self):
+        type(self).requests.append((self.path, self.headers.get("Authorization"), self.headers.get("If-None-Match")))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            return
+        body = json.dumps({"auth": self.headers.get("Authorization")}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api_base():
+    _ETagHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ETagHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_entry_expires_after_ttl():
+    cache = ResponseCache()
+    cache.put("k", b"body", None, ttl=0.05)
+    assert cache.get_fresh("k") == b"body"
+    time.sleep(0.06)
+    assert cache.get_fresh("k") is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_revalidation_extends_lifetime():
+    cache = ResponseCache()
+    cache.put("k", b"body", '"v1"', ttl=0.0)
+    assert cache.get_fresh("k") is None
+    assert cache.etag_for("k") == '"v1"'
+    assert cache.revalidated("k", ttl=60) == b"body"
+    assert cache.get_fresh("k") == b"body"
+    assert cache.revalidated("missing", ttl=60) is None
+
+
+def test_lru_eviction_keeps_total_size_bounded():
+    cache = ResponseCache(max_bytes=10)
+    cache.put("a", b"aaaa", None, 60)
+    cache.put("b", b"bbbb", None, 60)
+    assert cache.get_fresh("a") == b"aaaa"  # "b" is now least recently used
+    cache.put("c", b"cccc", None, 60)
+    assert cache.get_fresh("b") is None
+    assert cache.get_fresh("a") == b"aaaa" and cache.get_fresh("c") == b"cccc"
+    cache.put("huge", b"x" * 11, None, 60)  # Larger than the whole cache: not stored
+    assert cache.get_fresh("huge") is None
+    assert cache.stats()["bytes"] == 8 and cache.stats()["evictions"] == 1
+
+
+def test_key_depends_on_params_and_credential():
+    key = ResponseCache.make_key("http://api/x", {"b": 2, "a": 1}, "Bearer one")
+    assert key == ResponseCache.make_key("http://api/x", {"a": 1, "b": 2}, "Bearer one")
+    assert key != ResponseCache.make_key("http://api/x", {"a": 1, "b": 2}, "Bearer two")
+    assert key != ResponseCache.make_key("http://api/x", {"a": 1, "b": 2})
+    assert "Bearer one" not in key
+
+
+def test_sync_client_revalidates_with_etag(api_base):
+    cache = ResponseCache(ttls={"/partners/status": 0.05})
+    gc = globalconnect.GlobalConnect(api_key="one", api_base=api_base, cache=cache)
+    try:
+        assert gc.get_status() == {"auth": "Bearer one"}
+        assert gc.get_status() == {"auth": "Bearer one"}  # Fresh: served from the cache
+        time.sleep(0.06)
+        assert gc.get_status() == {"auth": "Bearer one"}  # Expired: 304 revalidation
+    finally:
+        gc.close()
+    assert [inm for _, _, inm in _ETagHandler.requests] == [None, '"v1"']
+    assert cache.stats()["revalidations"] == 1
+
+
+def test_shared_cache_isolates_credentials(api_base):
+    cache = ResponseCache()
+    one = globalconnect.GlobalConnect(api_key="one", api_base=api_base, cache=cache)
+    two = globalconnect.GlobalConnect(api_key="two", api_base=api_base, cache=cache)
+    try:
+        assert one.get_status() == {"auth": "Bearer one"}
+        assert two.get_status() == {"auth": "Bearer two"}
+        assert one.get_status() == {"auth": "Bearer one"}
+    finally:
+        one.close()
+        two.close()
+    assert [auth for _, auth, _ in _ETagHandler.requests] == ["Bearer one", "Bearer two"]
+
+
+def test_async_client_shares_cache_per_credential(api_base):
+    pytest.importorskip("aiohttp")
+    cache = ResponseCache()
+    sync_client = globalconnect.GlobalConnect(api_key="one", api_base=api_base, cache=cache)
+
+    async def main():
+        async with globalconnect.AsyncGlobalConnect(api_key="one", api_base=api_base, cache=cache) as same, \
+                globalconnect.AsyncGlobalConnect(api_key="two", api_base=api_base, cache=cache) as other:
+            return await same.get_status(), await other.get_status()
+
+    try:
+        assert sync_client.get_status() == {"auth": "Bearer one"}
+        assert asyncio.run(main()) == ({"auth": "Bearer one"}, {"auth": "Bearer two"})
+    finally:
+        sync_client.close()
+    assert [auth for _, auth, _ in _ETagHandler.requests] == ["Bearer one", "Bearer two"]
@@ -0,0 +1,125 @@
+# tests/test_sdk_webhook_receiver.py
+#
+# WebhookReceiver (sdk/python/globalconnect.py): secret check, body validation,
+# acknowledgement, backpressure and Idempotency-Key de-duplication, driven through
+# aiohttp's in-process test client.
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "sdk", "python"))
+
+pytest.importorskip("aiohttp")
+
+from aiohttp.test_utils import TestClient, TestServer  # noqa: E402
+
+import globalconnect  # noqa: E402
+from globalconnect import WebhookReceiver  # noqa: E402
+
+
+def _run(receiver, scenario):
+    async def main():
+        async with TestClient(TestServer(receiver.make_app())) as client:
+            await scenario(client)
+
+    asyncio.run(main())
+
+
+def test_secret_is_required():
+    received = []
+    receiver = WebhookReceiver(received.append, secret="s3cret")
+
+    async def scenario(client):
+        assert (await client.post("/webhook", json={"event": "e"})).status == 401
+        assert (await client.post("/webhook", json={"event": "e"}, headers={"X-GC-Secret": "wrong"})).status == 401
+        assert (await client.post("/webhook", json={"event": "e"}, headers={"X-GC-Secret": "s3cret"})).status == 204
+
+    _run(receiver, scenario)
+    assert receiver.metrics["unauthorized"] == 2 and received == [{"event": "e"}]
+
+
+def test_bad_bodies_are_rejected():
+    receiver = WebhookReceiver(lambda payload: None)
+
+    async def scenario(client):
+        assert (await client.post("/webhook", data=b"{not json")).status == 400
+        assert (await client.post("/webhook", json=[1, 2])).status == 400
+
+    _run(receiver, scenario)
+    assert receiver.metrics["bad_requests"] == 2 and receiver.metrics["accepted"] == 0
+
+
+def test_accepted_delivery_is_acked_and_handled():
+    received = []
+
+    async def handler(payload):
+        received.append(payload)
+
+    receiver = WebhookReceiver(handler, events=["onboarding"])
+
+    async def scenario(client):
+        response = await client.post("/webhook", json={"event": "onboarding", "id": 1})
+        assert response.status == 204
+        assert (await client.post("/webhook", json={"event": "other"})).status == 204  # Ignored
+        await asyncio.sleep(0.05)
+
+    _run(receiver, scenario)
+    assert received == [{"event": "onboarding", "id": 1}]
+    assert receiver.metrics["ignored"] == 1 and receiver.metrics["processed"] == 1
+
+
+def test_full_queue_answers_503_with_retry_after():
+    gate = asyncio.Event()
+    received = []
+
+    async def handler(payload):
+        await gate.wait()
+        received.append(payload["n"])
+
+    receiver = WebhookReceiver(handler, concurrency=1, max_queue=1)
+
+    async def scenario(client):
+        assert (await client.post("/webhook", json={"n": 1})).status == 204
+        await asyncio.sleep(0.02)  # The worker takes delivery 1 and blocks
+        assert (await client.post("/webhook", json={"n": 2})).status == 204
+        full = await client.post("/webhook", json={"n": 3}, headers={"Idempotency-Key": "k3"})
+        assert full.status == 503 and full.headers["Retry-After"] == "1"
+        gate.set()
+        await asyncio.sleep(0.02)
+        # The rejected delivery's key was forgotten, so the sender's retry is accepted
+        assert (await client.post("/webhook", json={"n": 3}, headers={"Idempotency-Key": "k3"})).status == 204
+        await asyncio.sleep(0.02)
+
+    _run(receiver, scenario)
+    assert received == [1, 2, 3] and receiver.metrics["rejected_full"] == 1
+
+
+def test_duplicate_deliveries_are_acked_once():
+    received = []
+    receiver = WebhookReceiver(received.append)
+
+    async def scenario(client):
+        for _ in range(2):
+            assert (await client.post("/webhook", json={"n": 1}, headers={"Idempotency-Key": "a"})).status == 204
+        for _ in range(2):
+            assert (await client.post("/webhook", json={"id": "evt-2", "n": 2})).status == 204
+        await asyncio.sleep(0.05)
+
+    _run(receiver, scenario)
+    assert sorted(p["n"] for p in received) == [1, 2] and receiver.metrics["duplicates"] == 2
+
+
+def test_dedupe_keys_expire_and_are_bounded(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(globalconnect.time, "monotonic", lambda: now[0])
+    receiver = WebhookReceiver(lambda payload: None, dedupe_ttl=60, dedupe_size=2)
+    assert not receiver._is_duplicate("a")
+    assert receiver._is_duplicate("a")
+    now[0] += 61
+    assert not receiver._is_duplicate("a")  # Expired
+    assert not receiver._is_duplicate("b")
+    assert not receiver._is_duplicate("c")  # Size bound evicts the oldest key
+    assert not receiver._is_duplicate("a")